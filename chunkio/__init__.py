@@ -1 +1,7 @@
 from .open import open
+from .aopen import aopen
+from .map import map, imap
+from .split import split
+from .rechunk import rechunk
+from .concat import concat, to_fileobj
+from .stat import stat, count
@@ -0,0 +1,26 @@
+import functools
+
+from chunkio.open import open
+from chunkio.chunk_handler import AsyncSequentialIOReader, AsyncSequentialIOWriter
+
+
+def aopen(file_path: str, mode: str = "r", *args, batch_size: int = 1 << 20, **kwargs):
+    """
+    Asynchronous counterpart of open for asyncio applications. Supports 'async with', 'async for' over lines and
+    awaitable read, readline, readlines, write, writelines, flush and close. The chunked files are opened with open,
+    thus they are interchangeable with the synchronous API.
+
+    All blocking work is done in batches of about batch_size characters (or bytes) on a dedicated thread per file,
+    which runs concurrently to the event loop.
+
+    :param file_path: path to the chunked base file
+    :param mode: mode, as for open
+    :param batch_size: approximate size of the batches read or written at once
+    :param args: further arguments passed to open, e.g. max_lines
+    :param kwargs: further keyword arguments passed to open, e.g. max_lines or encoding
+    :return: asynchronous reader or writer
+    """
+    opener = functools.partial(open, file_path, mode, *args, **kwargs)
+    if "r" in mode:
+        return AsyncSequentialIOReader(opener, batch_size=batch_size)
+    return AsyncSequentialIOWriter(opener, batch_size=batch_size)
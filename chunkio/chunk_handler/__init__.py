@@ -1,6 +1,15 @@
 from .writer.max_line_chunk_writer import MaxLineChunkWriter
-from .format import SubdirNumberedChunkFormat
+from .format import SubdirNumberedChunkFormat, HivePartitionedChunkFormat
 from .base_sequential_text_io_reader import BaseSequentialTextIOReader
 from .base_sequential_text_io_writer import BaseSequentialTextIOWriter
-from .chunker import MaxLineSequentialChunker
+from .base_sequential_binary_io_reader import BaseSequentialBinaryIOReader
+from .base_sequential_binary_io_writer import BaseSequentialBinaryIOWriter
+from .mmap_sequential_binary_reader import MmapSequentialBinaryReader
+from .background_sequential_io_writer import BackgroundSequentialIOWriter
+from .async_sequential_io import AsyncSequentialIOReader, AsyncSequentialIOWriter
+from .hash_partitioned_text_io_writer import HashPartitionedTextIOWriter
+from .hash_partitioned_binary_io_writer import HashPartitionedBinaryIOWriter
+from .hive_partitioned_text_io_writer import HivePartitionedTextIOWriter
+from .hive_partitioned_binary_io_writer import HivePartitionedBinaryIOWriter
+from .chunker import MaxLineSequentialChunker, MaxByteSequentialChunker
 from .utils import parse_lines
\ No newline at end of file
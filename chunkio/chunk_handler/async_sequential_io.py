@@ -0,0 +1,199 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, AnyStr, Callable, Iterable, List, Optional, Type
+
+
+class _AsyncSequentialIO:
+    def __init__(self, opener: Callable[[], Any]):
+        """
+        Runs all operations of a synchronous sequential reader or writer on a single dedicated thread, such that they
+        never block the event loop and always run in the order they were issued.
+
+        :param opener: callable opening the synchronous file object, called on the dedicated thread
+        """
+        self._opener = opener
+        self._file = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chunkio-aio")
+        self._closed = False
+
+    def _call(self, function: Callable, *args) -> asyncio.Future:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        return asyncio.get_running_loop().run_in_executor(self._executor, self._call_sync, function, *args)
+
+    def _call_sync(self, function: Callable, *args) -> Any:
+        if self._file is None:
+            self._file = self._opener()
+        return function(self._file, *args)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def open(self):
+        await self._call(lambda file: file)
+        return self
+
+    async def _close(self):
+        if self._closed:
+            return
+        try:
+            await self._call(lambda file: file.close())
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=False)
+
+    async def close(self):
+        await self._close()
+
+    def __await__(self):
+        return self.open().__await__()
+
+    async def __aenter__(self):
+        return await self.open()
+
+    async def __aexit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
+                        __traceback: TracebackType | None) -> None:
+        await self.close()
+
+
+class AsyncSequentialIOReader(_AsyncSequentialIO):
+    def __init__(self, opener: Callable[[], Any], batch_size: int = 1 << 20):
+        """
+        Asynchronous reader for chunked files. Async iteration reads batches of lines of about batch_size characters
+        (or bytes) on the dedicated thread, while the next batch is already read as the current one is consumed.
+
+        :param opener: callable opening the synchronous reader
+        :param batch_size: approximate size of the batches read at once
+        """
+        super().__init__(opener)
+        self.batch_size = batch_size
+        self._batch: List[AnyStr] = []
+        self._batch_position = 0
+        self._next_batch: Optional[asyncio.Future] = None
+
+    async def _discard_read_ahead(self):
+        # Reading directly needs to continue where the consumed lines end, thus put back the read ahead lines
+        if self._next_batch is not None:
+            self._batch = self._batch[self._batch_position:] + await self._next_batch
+            self._batch_position = 0
+            self._next_batch = None
+
+    def _pop_batch(self) -> List[AnyStr]:
+        lines = self._batch[self._batch_position:]
+        self._batch, self._batch_position = [], 0
+        return lines
+
+    async def read(self, __n: int = -1) -> AnyStr:
+        await self._discard_read_ahead()
+        lines = self._pop_batch()
+        if not lines:
+            return await self._call(lambda file: file.read(__n))
+        text = lines[0][:0].join(lines)
+        if 0 <= __n < len(text):
+            self._batch = [text[__n:]]
+            return text[:__n]
+        if __n < 0:
+            return text + await self._call(lambda file: file.read())
+        return text + await self._call(lambda file: file.read(__n - len(text)))
+
+    async def readline(self) -> AnyStr:
+        await self._discard_read_ahead()
+        if self._batch_position < len(self._batch):
+            line = self._batch[self._batch_position]
+            self._batch_position += 1
+            return line
+        return await self._call(lambda file: file.readline())
+
+    async def readlines(self, __hint: int = -1) -> List[AnyStr]:
+        await self._discard_read_ahead()
+        lines = self._pop_batch()
+        return lines + await self._call(lambda file: file.readlines(__hint))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> AnyStr:
+        if self._batch_position < len(self._batch):
+            line = self._batch[self._batch_position]
+            self._batch_position += 1
+            return line
+        if self._next_batch is None:
+            self._next_batch = self._call(lambda file: file.readlines(self.batch_size))
+        self._batch, self._batch_position = await self._next_batch, 0
+        self._next_batch = None
+        if not self._batch:
+            raise StopAsyncIteration
+        self._next_batch = self._call(lambda file: file.readlines(self.batch_size))
+        self._batch_position = 1
+        return self._batch[0]
+
+    async def close(self):
+        if self._next_batch is not None:
+            await asyncio.gather(self._next_batch, return_exceptions=True)
+            self._next_batch = None
+        await self._close()
+
+
+class AsyncSequentialIOWriter(_AsyncSequentialIO):
+    def __init__(self, opener: Callable[[], Any], batch_size: int = 1 << 20):
+        """
+        Asynchronous writer for chunked files. Writes are collected into batches of about batch_size characters
+        (or bytes), which are written on the dedicated thread. Awaiting a write only waits for the previous batch,
+        thus the event loop keeps running while a batch, including chunk rollovers, is written. Batches of write are
+        joined and written with write, batches of writelines with writelines, thus the chunks equal those of the
+        synchronous writer.
+
+        :param opener: callable opening the synchronous writer
+        :param batch_size: approximate size of the batches written at once
+        """
+        super().__init__(opener)
+        self.batch_size = batch_size
+        self._batch: List[AnyStr] = []
+        self._batch_size = 0
+        self._batch_lines = False  # Batch of writelines instead of write
+        self._pending: Optional[asyncio.Future] = None
+
+    async def _submit(self):
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            await pending
+        if self._batch:
+            batch, self._batch, self._batch_size = self._batch, [], 0
+            if self._batch_lines:
+                self._pending = self._call(lambda file: file.writelines(batch))
+            else:
+                self._pending = self._call(lambda file: file.write(batch[0][:0].join(batch)))
+
+    async def _append(self, __s: AnyStr, lines: bool):
+        if self._batch and self._batch_lines != lines:
+            await self._submit()
+        self._batch_lines = lines
+        self._batch.append(__s)
+        self._batch_size += len(__s)
+        if self._batch_size >= self.batch_size:
+            await self._submit()
+
+    async def write(self, __s: AnyStr) -> int:
+        await self._append(__s, lines=False)
+        return len(__s)
+
+    async def writelines(self, __lines: Iterable[AnyStr]) -> None:
+        for line in __lines:
+            await self._append(line, lines=True)
+
+    async def flush(self) -> None:
+        await self._submit()
+        await self._submit()  # Waits for the last batch
+        await self._call(lambda file: file.flush())
+
+    async def close(self):
+        if self._closed:
+            return
+        try:
+            await self._submit()
+            await self._submit()
+        finally:
+            await self._close()
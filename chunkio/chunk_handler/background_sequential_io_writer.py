@@ -0,0 +1,146 @@
+import io
+import queue
+import threading
+import typing
+
+from types import TracebackType
+from typing import AnyStr, Iterable, Iterator, Optional, Type
+
+from .base_sequential_text_io_writer import BaseSequentialTextIOWriter
+
+_STOP = object()
+
+
+class BackgroundSequentialIOWriter(typing.IO):
+    def __init__(self, writer: BaseSequentialTextIOWriter, max_queue_size: int = 1_000):
+        """
+        Wraps a sequential writer, such that write and writelines only enqueue the data and a background thread does
+        the chunking, the chunk file rollover and the actual disk I/O. The queue is bounded, thus a producer is only
+        blocked once it is max_queue_size writes ahead of the disk.
+
+        Errors of the background thread are sticky, i.e. raised by every later call to write, writelines, flush or
+        close. Writes after an error are dropped, thus the chunked file is incomplete once an error was raised.
+
+        :param writer: text or binary sequential writer, which is only used by the background thread afterwards
+        :param max_queue_size: maximal number of pending writes
+        """
+        assert max_queue_size > 0, "The queue size needs to be positive!"
+        self.writer = writer
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._work, name="chunkio-background-writer", daemon=True)
+        self._thread.start()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                # After an error all remaining items are dropped, but still consumed to not block the producer
+                if self._error is None:
+                    method, data = item
+                    method(data)
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _put(self, method, data):
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        self._raise_error()
+        self._queue.put((method, data))
+
+    @property
+    def mode(self) -> str:
+        return self.writer.mode
+
+    @property
+    def name(self) -> str:
+        return self.writer.name
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> typing.IO:
+        return self
+
+    def close(self) -> None:
+        if self._closed:
+            return self._raise_error()
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+        try:
+            self._raise_error()
+        finally:
+            self.writer.close()
+
+    def fileno(self) -> int:
+        raise io.UnsupportedOperation("The chunk files are only accessed by the background thread!")
+
+    def flush(self) -> None:
+        """
+        Blocks until all pending writes are written to the chunk files.
+        """
+        if self._closed:
+            return self._raise_error()
+        self._queue.join()
+        self._raise_error()
+        self.writer.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def read(self, __n: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readable(self) -> bool:
+        return False
+
+    def readline(self, __limit: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readlines(self, __hint: int = -1) -> list[AnyStr]:
+        raise NotImplementedError
+
+    def seek(self, __offset: int, __whence: int = 0) -> int:
+        raise NotImplementedError
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise NotImplementedError
+
+    def truncate(self, __size: int | None = None) -> int:
+        raise NotImplementedError
+
+    def writable(self) -> bool:
+        return not self._closed
+
+    def write(self, __s: AnyStr) -> int:
+        self._put(self.writer.write, __s)
+        return len(__s)
+
+    def writelines(self, __lines: Iterable[AnyStr]) -> None:
+        # Materialize on the producer thread, since the iterable might not be safe to consume from another thread
+        self._put(self.writer.writelines, list(__lines))
+        return None
+
+    def __next__(self) -> AnyStr:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[AnyStr]:
+        return self
+
+    def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
+                 __traceback: TracebackType | None) -> None:
+        self.close()
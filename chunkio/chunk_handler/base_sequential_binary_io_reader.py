@@ -0,0 +1,74 @@
+import io
+import typing
+
+from typing import BinaryIO, Optional
+
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from .base_sequential_text_io_reader import BaseSequentialTextIOReader
+
+
+class BaseSequentialBinaryIOReader(BaseSequentialTextIOReader, typing.BinaryIO):
+    """
+    Byte oriented counterpart of the BaseSequentialTextIOReader. Reads chunk files in binary mode, thus yields bytes
+    and skips decoding entirely.
+    """
+    _accepted_mode = "rb"
+    _file_type = io.BufferedIOBase
+    _empty = b""
+    _delimiter = b"\n"
+    _next_disables_tell = False
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "rb",
+            chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
+            verbose: bool = True,
+            prefetch: int = 0,
+            follow: bool = False,
+            poll_interval: float = 0.01,
+            max_poll_interval: float = 1.0,
+            timeout: Optional[float] = None,
+            **open_kwargs
+    ):
+        assert "b" in mode, f"Provided mode '{mode}' is not a binary mode"
+        super().__init__(file_path,
+                         *open_args,
+                         mode=mode,
+                         chunk_format=chunk_format,
+                         verbose=verbose,
+                         prefetch=prefetch,
+                         follow=follow,
+                         poll_interval=poll_interval,
+                         max_poll_interval=max_poll_interval,
+                         timeout=timeout,
+                         **open_kwargs)
+
+    def _wrap_chunk_buffer(self, buffer: bytes) -> BinaryIO:
+        return io.BytesIO(buffer)
+
+    def readinto(self, __buffer) -> int:
+        """
+        Reads bytes across chunk files directly into a preallocated, writable buffer, e.g. a bytearray.
+
+        :param __buffer: buffer supporting the buffer protocol
+        :return: number of bytes read, 0 at the end of the file
+        """
+        view = memoryview(__buffer).cast("B")
+        size = 0
+        while size < len(view):
+            if self.closed:
+                try:
+                    self._open_next_file()
+                except StopIteration:
+                    break
+            _size = self._current_file.readinto(view[size:])
+            if _size:
+                size += _size
+                continue
+            try:  # Current chunk file is exhausted
+                self._open_next_file()
+            except StopIteration:
+                break
+        return size
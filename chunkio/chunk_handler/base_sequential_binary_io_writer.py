@@ -0,0 +1,48 @@
+import io
+import typing
+
+from typing import Optional
+
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from chunkio.chunk_handler.chunker import SequentialChunker, MaxLineSequentialChunker
+from .base_sequential_text_io_writer import BaseSequentialTextIOWriter
+
+
+class BaseSequentialBinaryIOWriter(BaseSequentialTextIOWriter, typing.BinaryIO):
+    """
+    Byte oriented counterpart of the BaseSequentialTextIOWriter. Writes bytes to chunk files opened in binary mode,
+    thus skips encoding entirely. Delimiter and chunker need to operate on bytes.
+    """
+    _accepted_mode = "wab"
+    _file_type = io.BufferedIOBase
+    _empty = b""
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "wb",
+            chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
+            chunker: SequentialChunker = MaxLineSequentialChunker(max_lines=1_000, delimiter=b"\n"),
+            delimiter: bytes = b"\n",
+            verbose: bool = True,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            concurrent: bool = False,
+            **open_kwargs
+    ):
+        assert "b" in mode, f"Provided mode '{mode}' is not a binary mode"
+        assert isinstance(delimiter, bytes), "Delimiter should be bytes in binary mode!"
+        super().__init__(file_path,
+                         *open_args,
+                         mode=mode,
+                         chunk_format=chunk_format,
+                         chunker=chunker,
+                         delimiter=delimiter,
+                         verbose=verbose,
+                         write_manifest=write_manifest,
+                         compression_workers=compression_workers,
+                         compresslevel=compresslevel,
+                         concurrent=concurrent,
+                         **open_kwargs)
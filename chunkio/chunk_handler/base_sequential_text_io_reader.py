@@ -1,15 +1,34 @@
 import _io
+import bisect
+import io
+import os
+import time
 import typing
 import warnings
 
+from collections import deque
+from itertools import accumulate, islice
+from concurrent.futures import ThreadPoolExecutor
 from types import TracebackType
-from typing import BinaryIO, TextIO, Type, Iterator, AnyStr, Iterable, Optional, Any, Generator
+from typing import BinaryIO, Dict, TextIO, Type, Iterator, AnyStr, Iterable, Optional, Any, Generator, List, Tuple
 
-from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat, ChunkLineIndex
+from .compression import open_chunk_file
 from .utils import check_mode
 
+# Arguments of the builtin open following the mode, by position
+_OPEN_ARGS = ("buffering", "encoding", "errors", "newline", "closefd", "opener")
+# Arguments of the builtin open, which are supported for prefetched chunk files. Buffering has no effect in memory.
+_PREFETCH_OPEN_ARGS = ("buffering", "encoding", "errors", "newline")
+
 
 class BaseSequentialTextIOReader(typing.TextIO):
+    _accepted_mode = "rt"
+    _file_type = _io.TextIOWrapper
+    _empty = ""
+    _delimiter = "\n"
+    _next_disables_tell = True  # As for text files, which are iterated with next
+
     def __init__(
             self,
             file_path: str,
@@ -17,31 +36,276 @@ class BaseSequentialTextIOReader(typing.TextIO):
             mode: str = "r",
             chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
             verbose: bool = True,
+            prefetch: int = 0,
+            follow: bool = False,
+            poll_interval: float = 0.01,
+            max_poll_interval: float = 1.0,
+            timeout: Optional[float] = None,
             **open_kwargs
     ):
-        check_mode(mode, "rt")
+        """
+        Reads chunk files sequentially, as if they were a single file.
+
+        In follow mode, chunks are picked up as they appear, while the chunked file is still being written. The reader
+        polls for the next chunk with exponential backoff between poll_interval and max_poll_interval seconds and
+        stops once the manifest marks the chunked file as complete. Chunks need to be published atomically, as done by
+        the sequential writer. Follow mode supports sequential reading only, i.e. no seek, tell or random access.
+
+        :param file_path: base file path
+        :param mode: read mode, text or binary
+        :param chunk_format: chunk format deciding the chunk file paths
+        :param verbose: warns about operations, which might not behave as expected
+        :param prefetch: number of chunk files read ahead on background threads. Prefetched chunk files are held in
+            memory, thus support the open arguments buffering, encoding, errors and newline only and have no fileno.
+        :param follow: waits for chunks of a chunked file which is still being written
+        :param poll_interval: initial number of seconds between two polls in follow mode
+        :param max_poll_interval: maximal number of seconds between two polls in follow mode
+        :param timeout: optional number of seconds without new chunks, after which a TimeoutError is raised
+        """
+        check_mode(mode, self._accepted_mode)
+        assert isinstance(prefetch, int) and prefetch >= 0, "Prefetch should be a non-negative integer!"
+        assert not follow or chunk_format.manifest_path(file_path) is not None, \
+            "Follow mode requires a chunk format with manifest, which marks the end of the chunked file!"
+        assert 0 < poll_interval <= max_poll_interval, "Poll intervals should be positive and increasing!"
+        assert len(open_args) <= len(_OPEN_ARGS), f"Too many open arguments: {open_args}"
+        _open_kwargs = dict(zip(_OPEN_ARGS, open_args), **open_kwargs)
+        assert not prefetch or set(_open_kwargs).issubset(_PREFETCH_OPEN_ARGS), \
+            f"Prefetch supports the open arguments {list(_PREFETCH_OPEN_ARGS)} only, got {list(_open_kwargs)}"
 
         self.file_path = file_path
         self.open_args = open_args
         self._mode = mode
         self.chunk_format = chunk_format
         self.verbose = verbose
+        self.prefetch = prefetch
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.timeout = timeout
         self.open_kwargs = open_kwargs
 
         self._current_file = None
+        self._current_lines = iter(())  # Current file while it can be iterated, see __next__
+        self._current_chunk = -1  # Position of the current chunk file within the chunk listing
+        self._chunk_files = None
+        self._chunk_offsets = None
+        self._chunk_line_offsets = None
+        self._line_index = None
+        self._track_position = False  # Set once tell or seek is used, see __next__
+        self._untold_lines = 0  # Lines of the current chunk file read with next, see _restore_tell
+        self._untold_base = 0  # Position of the current chunk file, from which these lines were read
+        self._followed_chunks: Dict[str, Tuple[int, int]] = dict()  # Inode and bytes read per chunk in follow mode
         self._file_generator = self._set_file_generator()
 
-    def _set_file_generator(self) -> Generator[TextIO, None, None]:
-        for file_path in self.chunk_format.list(self.file_path):
-            yield open(file_path, mode=self.mode, *self.open_args, **self.open_kwargs)
+    def _list_chunk_files(self) -> List[str]:
+        if self._chunk_files is None:
+            self._chunk_files = list(self.chunk_format.list(self.file_path))
+        return self._chunk_files
+
+    def _iter_chunk_files(self, start: int = 0) -> Iterator[Tuple[str, int]]:
+        """
+        Yields the chunk files to read, with the number of bytes to skip in each.
+        """
+        if self.follow:
+            return self._follow_chunk_files(start)
+        return ((chunk_file, 0) for chunk_file in self._list_chunk_files()[start:])
+
+    def _follow_chunk_files(self, start: int = 0) -> Iterator[Tuple[str, int]]:
+        """
+        Yields chunk files as they are published, in the order of their indices. Chunks with a gap in front of them
+        are held back, since the missing chunk might still be published. Ends once the manifest exists, which the
+        writer writes after all chunks.
+
+        Appending continues the last chunk and replaces it once it is complete again. Thus, if the last chunk read has
+        been replaced, it is yielded again with the number of bytes read before, which are skipped. Its replacement is
+        always published before the next chunk.
+        """
+        position, last_index, last_chunk_file = 0, None, None
+        delay, last_progress = self.poll_interval, time.monotonic()
+        while True:
+            complete = os.path.isfile(self.chunk_format.manifest_path(self.file_path))  # Before listing the chunks
+            progress = False
+            if last_chunk_file is not None:
+                followed = self._followed_chunks.get(last_chunk_file)
+                if followed is None:  # Still read by a prefetch thread
+                    time.sleep(self.poll_interval)
+                    continue
+                inode, size = followed
+                try:
+                    replaced = os.stat(last_chunk_file).st_ino != inode
+                except FileNotFoundError:
+                    replaced = False
+                if replaced:
+                    yield last_chunk_file, size
+                    progress = True
+            try:
+                chunk_files = list(self.chunk_format.list(self.file_path, return_index=True))
+            except FileNotFoundError:  # Not created yet
+                chunk_files = []
+            for chunk_file, index in chunk_files[position:]:
+                if not complete and last_index is not None and index != last_index + 1:
+                    break
+                if position >= start:
+                    self._followed_chunks.pop(last_chunk_file, None)
+                    last_chunk_file = chunk_file
+                    yield chunk_file, 0
+                position, last_index, progress = position + 1, index, True
+            if complete and position >= len(chunk_files):
+                return
+            if progress:
+                delay, last_progress = self.poll_interval, time.monotonic()
+                continue
+            if self.timeout is not None and time.monotonic() - last_progress > self.timeout:
+                raise TimeoutError(f"No new chunks of {self.file_path} within {self.timeout} seconds")
+            time.sleep(delay)
+            delay = min(2 * delay, self.max_poll_interval)
+
+    def _list_chunk_offsets(self) -> List[int]:
+        """
+        Byte offsets of all chunk files within the whole file, followed by the total size. Sizes are taken from the
+        manifest if present, else from the file system. Uncompressed chunk files are never read.
+        """
+        if self._chunk_offsets is None:
+            sizes = self.chunk_format.chunk_sizes(self.file_path, self._list_chunk_files())
+            self._chunk_offsets = list(accumulate(sizes, initial=0))
+        return self._chunk_offsets
+
+    def _list_chunk_line_offsets(self) -> List[int]:
+        """
+        Number of lines preceding each chunk file, followed by the total number of lines. Line counts are taken from
+        the line index or the manifest if present, else the chunk files are counted once.
+        """
+        if self._chunk_line_offsets is None:
+            chunk_files = self._list_chunk_files()
+            line_index = self.chunk_format.read_line_index(self.file_path)
+            if line_index is not None and line_index.file_names == [os.path.basename(f) for f in chunk_files]:
+                self._line_index = line_index
+                line_counts = line_index.lines
+            else:
+                line_counts = self.chunk_format.chunk_line_counts(self.file_path, chunk_files)
+            self._chunk_line_offsets = list(accumulate(line_counts, initial=0))
+        return self._chunk_line_offsets
+
+    def build_line_index(self, step: int = 1_000, persist: bool = True) -> ChunkLineIndex:
+        """
+        Builds a sparse line index, storing the byte offset of every step-th line of each chunk. Subsequent lookups
+        via getline and lines read at most step lines. Lines are split at '\\n'.
+
+        :param step: number of lines between two indexed byte offsets
+        :param persist: if true the index is stored alongside the chunks and picked up by later readers
+        :return: line index
+        """
+        line_index = ChunkLineIndex.build(self._list_chunk_files(), step=step)
+        line_index_path = self.chunk_format.line_index_path(self.file_path)
+        if persist and line_index_path is not None:
+            line_index.write(line_index_path)
+        self._line_index = line_index
+        self._chunk_line_offsets = line_index.line_offsets()
+        return line_index
+
+    def getline(self, __line: int) -> AnyStr:
+        """
+        Random access to a single line by its line number within the whole file, starting at 0. Does not change the
+        position of the reader.
+
+        :param __line: line number
+        :return: line
+        """
+        lines = self.lines(__line, __line + 1)
+        if not lines:
+            raise IndexError(f"Line {__line} out of range")
+        return lines[0]
+
+    def lines(self, start: int, stop: int) -> List[AnyStr]:
+        """
+        Random access to the lines start to stop (excluding) within the whole file. Jumps to the chunk containing the
+        first line using the per chunk line counts and, if available, to the closest indexed line within that chunk.
+        Does not change the position of the reader.
+
+        :param start: first line number, starting at 0
+        :param stop: line number after the last line
+        :return: list of lines, shorter if the file ends before stop
+        """
+        assert 0 <= start, "Line numbers should be non-negative integers!"
+        chunk_files = self._list_chunk_files()
+        line_offsets = self._list_chunk_line_offsets()
+
+        lines = []
+        chunk = bisect.bisect_right(line_offsets, start) - 1
+        while chunk < len(chunk_files) and start + len(lines) < stop:
+            position, skip = 0, start + len(lines) - line_offsets[chunk]
+            if self._line_index is not None:
+                if self._line_index.bytes[chunk] != os.path.getsize(chunk_files[chunk]):
+                    raise ValueError(f"Line index is outdated for {chunk_files[chunk]}, please rebuild it")
+                position, skip = self._line_index.locate(chunk, skip)
+            with open_chunk_file(chunk_files[chunk], self.mode, *self.open_args, **self.open_kwargs) as file:
+                file.seek(position)
+                for _ in range(skip):
+                    file.readline()
+                while start + len(lines) < stop:
+                    line = file.readline()
+                    if not line:
+                        break
+                    lines.append(line)
+            chunk += 1
+        return lines
+
+    def _set_file_generator(self, start: int = 0) -> Generator[TextIO, None, None]:
+        self._current_chunk = start - 1
+        if self.prefetch > 0:
+            yield from self._set_prefetched_file_generator(start)
+            return
+        for file_path, offset in self._iter_chunk_files(start):
+            if offset:  # Continues a chunk replaced in follow mode
+                yield self._wrap_chunk_buffer(self._read_chunk_file(file_path, offset))
+                continue
+            file = open_chunk_file(file_path, self.mode, *self.open_args, **self.open_kwargs)
+            inode = os.fstat(file.fileno()).st_ino if self.follow else None
+            yield file
+            if self.follow:  # Read to its end, thus its position is its size
+                self._followed_chunks[file_path] = (inode, getattr(file, "buffer", file).tell())
+
+    def _set_prefetched_file_generator(self, start: int = 0) -> Generator[TextIO, None, None]:
+        """
+        Reads (and decompresses) the next chunk files into memory on background threads, while the current chunk file
+        is consumed. At most prefetch chunk files are buffered ahead of the current one. Decoding still happens on
+        iteration.
+        """
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            buffers = deque()
+            for file_path, offset in self._iter_chunk_files(start):
+                buffers.append(executor.submit(self._read_chunk_file, file_path, offset))
+                if len(buffers) > self.prefetch:
+                    yield self._wrap_chunk_buffer(buffers.popleft().result())
+            while buffers:
+                yield self._wrap_chunk_buffer(buffers.popleft().result())
+
+    def _read_chunk_file(self, file_path: str, offset: int = 0) -> bytes:
+        with open_chunk_file(file_path, mode="rb") as file:
+            inode = os.fstat(file.fileno()).st_ino
+            file.seek(offset)
+            buffer = file.read()
+        if self.follow:
+            self._followed_chunks[file_path] = (inode, offset + len(buffer))
+        return buffer
+
+    def _wrap_chunk_buffer(self, buffer: bytes) -> TextIO:
+        _open_kwargs = dict(zip(_OPEN_ARGS, self.open_args), **self.open_kwargs)
+        return io.TextIOWrapper(io.BytesIO(buffer),
+                                encoding=_open_kwargs.get("encoding"),
+                                errors=_open_kwargs.get("errors"),
+                                newline=_open_kwargs.get("newline"))
 
     def _open_next_file(self):
         _old_file = self._current_file  # Remember old file
 
-        self._current_file = next(self._file_generator)
+        self._current_file = self._current_lines = next(self._file_generator)
+        self._current_chunk += 1
+        self._untold_lines = 0
+        self._untold_base = 0
 
         # Close file only after opening a new file successfully!
-        if isinstance(_old_file, _io.TextIOWrapper):
+        if isinstance(_old_file, self._file_type):
             _old_file.close()
 
     @property
@@ -54,14 +318,14 @@ class BaseSequentialTextIOReader(typing.TextIO):
 
     @property
     def closed(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.closed
         else:
             return True
 
     @property
     def buffer(self) -> BinaryIO:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.buffer
         else:
             raise NotImplementedError("Buffer not initialized yet!")
@@ -71,7 +335,7 @@ class BaseSequentialTextIOReader(typing.TextIO):
         _encoding = self.open_kwargs.get("encoding")
         if isinstance(_encoding, str):
             return _encoding
-        elif isinstance(self._current_file, _io.TextIOWrapper):
+        elif isinstance(self._current_file, self._file_type):
             return self._current_file.encoding
         else:
             raise NotImplementedError("Encoding not initialized yet!")
@@ -81,21 +345,21 @@ class BaseSequentialTextIOReader(typing.TextIO):
         _errors = self.open_kwargs.get("errors")
         if isinstance(_errors, str):
             return _errors
-        elif isinstance(self._current_file, _io.TextIOWrapper):
+        elif isinstance(self._current_file, self._file_type):
             return self._current_file.errors
         else:
             return None
 
     @property
     def line_buffering(self) -> bool | int:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.line_buffering
         else:
             return False
 
     @property
     def newlines(self) -> Any:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.newlines
         else:
             raise NotImplementedError("Newlines not initialized yet!")
@@ -104,66 +368,125 @@ class BaseSequentialTextIOReader(typing.TextIO):
         return self
 
     def close(self) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        self._file_generator.close()  # Stops pending prefetches
+        self._current_lines = iter(())
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.close()
         else:
             return None
 
     def fileno(self) -> int:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if self.prefetch > 0:
+            raise io.UnsupportedOperation("Prefetched chunk files are held in memory and have no file descriptor")
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.fileno()
         else:
             raise NotImplementedError("Current file not initialized yet!")
 
     def flush(self) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.flush()
         else:
             return None
 
     def isatty(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.isatty()
         else:
             return False
 
     def read(self, __n: int = -1, *args) -> AnyStr:
-        # ToDo: This might be possible to implement properly, at a later time. Currently not the intended use-case.
-        if self.verbose:
-            warnings.warn("read forwards to current chunk file. This may not be what you have intended to do! "
-                          "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            return self._current_file.read(*args)
-        else:
-            raise NotImplementedError("Current file not initialized yet!")
+        """
+        Reads up to n characters (or bytes) across chunk files, as if the chunk files were a single file. Each chunk
+        file is read with as few and as large reads as possible.
+
+        :param __n: maximal number of characters (or bytes) to read, negative or None reads until the end
+        :return: content, empty at the end of the file
+        """
+        if self._untold_lines:
+            self._restore_tell()
+        parts = []
+        _remaining = -1 if __n is None or __n < 0 else __n
+        while _remaining != 0:
+            if self.closed:
+                try:
+                    self._open_next_file()
+                except StopIteration:
+                    break
+            part = self._current_file.read(_remaining)
+            self._moved()
+            if part:
+                parts.append(part)
+                if _remaining > 0:
+                    _remaining -= len(part)
+                continue
+            try:  # Current chunk file is exhausted
+                self._open_next_file()
+            except StopIteration:
+                break
+        if len(parts) == 1:
+            return parts[0]
+        return self._empty.join(parts)
 
     def readable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.readable()
         else:
             return False
 
+    def _restore_tell(self):
+        """
+        Iterating a text file with next disables its tell, which is restored by rereading the lines iterated since the
+        position they were read from with readline. Only happens once, if tell is first used while iterating.
+        """
+        lines, self._untold_lines = self._untold_lines, 0
+        if not lines or not self._next_disables_tell:
+            return
+        self._current_file.seek(self._untold_base)
+        for _ in range(lines):
+            self._current_file.readline()
+        self._moved()
+
+    def _moved(self):
+        """
+        Notes that the position of the current chunk file was moved without iterating it, e.g. by readline. Iterating
+        continues from there, which is remembered once iterating starts, see _restore_tell.
+        """
+        if self._next_disables_tell and self._current_lines is self._current_file:
+            self._current_lines = self._iter_from_position()
+
+    def _iter_from_position(self) -> Iterator[AnyStr]:
+        self._untold_base = self._current_file.tell()  # Before iterating disables tell
+        self._current_lines = self._current_file
+        for line in self._current_file:  # Unlike yield from, discarding this generator does not close the file
+            yield line
+
     def readline(self, __limit: int = -1, *args) -> AnyStr:
+        if self._untold_lines:
+            self._restore_tell()
         if self.closed:
             try:
                 self._open_next_file()
             except StopIteration:
-                return ""
+                return self._empty
 
         while True:
             line = self._current_file.readline(__limit, *args)
-            if line == "":
+            self._moved()
+            if not line:
                 try:
                     self._open_next_file()
                 except StopIteration:
-                    return ""
+                    return self._empty
             else:
                 return line
 
     def readlines(self, __hint: int = -1, *args) -> list[AnyStr]:
         if __hint <= 0:
-            return [line for line in self]
+            return list(self.iter_lines())
 
+        if self._untold_lines:
+            self._restore_tell()
         lines = []
         _current_hint = __hint
 
@@ -173,58 +496,174 @@ class BaseSequentialTextIOReader(typing.TextIO):
             except StopIteration:
                 return lines
 
-        while True:
-            _new_lines = self._current_file.readlines(_current_hint, *args)
-            lines.extend(_new_lines)
-            _current_hint -= sum([len(line) for line in _new_lines])
-            if _current_hint > 0:
+        # Read line by line, since iterating text files disables their tell
+        while _current_hint > 0:
+            line = self._current_file.readline()
+            self._moved()
+            if line:
+                lines.append(line)
+                _current_hint -= len(line)
+            else:
                 try:
                     self._open_next_file()
                 except StopIteration:
                     break
-            else:
-                break
 
         return lines
 
-    def seek(self, *args, **kwargs) -> int:
-        # ToDo: This might be possible to implement properly, at a later time. Currently not the intended use-case.
-        if self.verbose:
-            warnings.warn("seek forwards to current chunk file. This may not be what you have intended to do! "
-                          "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            return self._current_file.seek(*args, **kwargs)
+    def iter_lines(self) -> Iterator[AnyStr]:
+        """
+        Fast iteration over the remaining lines, which iterates the chunk files directly and thus avoids the per line
+        overhead of __next__. Lines are counted, such that tell and seek keep working afterwards, see _restore_tell.
+
+        :return: iterator over lines
+        """
+        while True:
+            try:
+                line = next(self._current_lines)
+            except StopIteration:  # Current chunk file is exhausted (or not opened yet)
+                try:
+                    self._open_next_file()
+                except StopIteration:
+                    return
+                continue
+            self._untold_lines += 1  # Lines iterated are told like those of __next__
+            yield line
+
+    def iter_batches(self, n_lines: int = 10_000) -> Iterator[List[AnyStr]]:
+        """
+        Iterates over the remaining lines in batches of n_lines lines, spanning chunk files if necessary. Only the
+        last batch might be shorter.
+
+        :param n_lines: number of lines per batch
+        :return: iterator over lists of lines
+        """
+        assert n_lines > 0, "Number of lines per batch should be a positive integer!"
+        batch = []
+        while True:
+            if self.closed:
+                try:
+                    self._open_next_file()
+                except StopIteration:
+                    break
+            _batch_size = len(batch)
+            batch.extend(islice(self._current_lines, n_lines - _batch_size))
+            self._untold_lines += len(batch) - _batch_size
+            if len(batch) >= n_lines:
+                yield batch
+                batch = []
+                continue
+            try:  # Current chunk file is exhausted
+                self._open_next_file()
+            except StopIteration:
+                break
+        if batch:
+            yield batch
+
+    def iter_blocks(self, n: int = 1 << 20) -> Iterator[AnyStr]:
+        """
+        Iterates over the remaining content in blocks of about n characters (or bytes), each ending on a line boundary.
+        A block is extended until the end of its last line and never spans chunk files, thus blocks might be shorter
+        at the end of a chunk file.
+
+        :param n: approximate number of characters (or bytes) per block
+        :return: iterator over blocks
+        """
+        assert n > 0, "Block size should be a positive integer!"
+        while True:
+            if self.closed:
+                try:
+                    self._open_next_file()
+                except StopIteration:
+                    return
+            if self._untold_lines:
+                self._restore_tell()
+            block = self._current_file.read(n)
+            if block:
+                if len(block) == n and not block.endswith(self._delimiter):
+                    block += self._current_file.readline()
+                self._moved()
+                yield block
+                continue
+            try:
+                self._open_next_file()
+            except StopIteration:
+                return
+
+    def seek(self, __offset: int, __whence: int = io.SEEK_SET) -> int:
+        """
+        Moves to a byte offset within the whole file, i.e. across all chunks. Jumps directly to the chunk containing
+        the offset, using the chunk sizes, without reading preceding chunks. In text mode, offsets should stem from
+        tell, as with regular text files.
+
+        :param __offset: byte offset relative to whence
+        :param __whence: io.SEEK_SET (start), io.SEEK_CUR (current position) or io.SEEK_END (end)
+        :return: new absolute byte offset
+        """
+        if self.follow:
+            raise io.UnsupportedOperation("Follow mode does not support seek")
+        if __whence == io.SEEK_SET:
+            position = __offset
+        elif __whence == io.SEEK_CUR:
+            position = self.tell() + __offset
+        elif __whence == io.SEEK_END:
+            position = self._list_chunk_offsets()[-1] + __offset
         else:
-            raise NotImplementedError("Current file not initialized yet!")
+            raise ValueError(f"Invalid whence ({__whence}, should be 0, 1 or 2)")
+        self._track_position = True
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}")
+
+        chunk_offsets = self._list_chunk_offsets()
+        if len(chunk_offsets) == 1:  # No chunks at all
+            return 0
+        # Last chunk starting at or before the position, i.e. skipping empty chunks
+        chunk = min(bisect.bisect_right(chunk_offsets, position) - 1, len(chunk_offsets) - 2)
+
+        self._file_generator.close()
+        if isinstance(self._current_file, self._file_type):
+            self._current_file.close()
+        self._file_generator = self._set_file_generator(start=chunk)
+        self._open_next_file()
+        self._current_file.seek(position - chunk_offsets[chunk])
+        self._moved()
+        return position
 
     def seekable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            return self._current_file.seekable()
-        else:
-            return False
+        return not self.follow
 
     def tell(self) -> int:
-        # ToDo: This might be possible to implement properly, at a later time. Currently not the intended use-case.
-        if self.verbose:
-            warnings.warn("tell forwards to current chunk file. This may not be what you have intended to do! "
-                          "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            return self._current_file.tell()
-        else:
-            raise NotImplementedError("Current file not initialized yet!")
+        """
+        Current byte offset within the whole file, i.e. the offset of the current chunk plus the position within it.
+
+        :return: absolute byte offset
+        """
+        if self.follow:
+            raise io.UnsupportedOperation("Follow mode does not support tell")
+        self._track_position = True
+        if not isinstance(self._current_file, self._file_type):
+            return 0
+        if self._untold_lines:
+            self._restore_tell()
+        chunk_offsets = self._list_chunk_offsets()
+        position = self._current_file.tell()
+        if position > chunk_offsets[self._current_chunk + 1] - chunk_offsets[self._current_chunk]:
+            # Text files encode the decoder state into their position, which can not be mapped across chunks
+            raise OSError("Can not tell position within a partially decoded character")
+        return chunk_offsets[self._current_chunk] + position
 
     def truncate(self, *args, **kwargs) -> int:
         # ToDo: This might be possible to implement properly, at a later time. Currently not the intended use-case.
         if self.verbose:
             warnings.warn("truncate forwards to current chunk file. This may not be what you have intended to do! "
                           "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.truncate(*args, **kwargs)
         else:
             raise NotImplementedError("Current file not initialized yet!")
 
     def writable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.writable()
         else:
             return False
@@ -236,18 +675,44 @@ class BaseSequentialTextIOReader(typing.TextIO):
         raise NotImplementedError
 
     def __next__(self) -> AnyStr:
-        if self.closed:
-            self._open_next_file()
+        """
+        Iterates the chunk files with next, which is fastest. Once tell or seek was used, lines are read with readline
+        instead, since iterating text files disables their tell.
+        """
+        if self._track_position:
+            return self._next_tracked()
+        try:
+            line = next(self._current_lines)
+        except StopIteration:  # Current chunk file is exhausted (or not opened yet)
+            return self._next_chunk_line()
+        self._untold_lines += 1
+        return line
+
+    def _next_chunk_line(self) -> AnyStr:
         while True:
+            self._open_next_file()
             try:
-                return next(self._current_file)
+                line = next(self._current_lines)
             except StopIteration:
-                self._open_next_file()
+                continue
+            self._untold_lines += 1
+            return line
+
+    def _next_tracked(self) -> AnyStr:
+        if self._untold_lines:
+            self._restore_tell()
+        if self.closed:
+            self._open_next_file()
+        while True:
+            line = self._current_file.readline()
+            if line:
+                self._moved()
+                return line
+            self._open_next_file()
 
     def __iter__(self) -> Iterator[AnyStr]:
         return self
 
     def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
                  __traceback: TracebackType | None) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            self._current_file.close()
+        self.close()
@@ -1,16 +1,28 @@
 import _io
+import os
+import shutil
 import typing
 import warnings
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from types import TracebackType
-from typing import BinaryIO, TextIO, Type, Iterator, AnyStr, Iterable, Optional, Any, List
+from typing import BinaryIO, TextIO, Type, Iterator, AnyStr, Iterable, Optional, Any, List, Tuple
 
-from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat, ChunkManifest
 from chunkio.chunk_handler.chunker import SequentialChunker, MaxLineSequentialChunker
-from .utils import check_mode, parse_lines
+from .compression import compress_file, is_compressed, open_chunk_file
+from .utils import check_mode, count_lines, iter_blocks
 
 
 class BaseSequentialTextIOWriter(typing.TextIO):
+    _accepted_mode = "wat"
+    _file_type = _io.TextIOWrapper
+    _empty = ""
+    # Bound the memory of a single write or writelines call, independent of the size of its input
+    _write_block_size = 1 << 20
+    _writelines_batch_size = 10_000
+
     def __init__(
             self,
             file_path: str,
@@ -20,9 +32,37 @@ class BaseSequentialTextIOWriter(typing.TextIO):
             chunker: SequentialChunker = MaxLineSequentialChunker(max_lines=1_000),
             delimiter: str = "\n",
             verbose: bool = True,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            concurrent: bool = False,
             **open_kwargs
     ):
-        check_mode(mode, "wt")
+        """
+        Writes lines sequentially into chunk files, rolling over to the next chunk file as decided by the chunker.
+
+        Each chunk is written to a temporary file first and renamed once it is complete, thus chunk files only ever
+        appear complete and readers following the chunked file never see partial chunks. The manifest is written last
+        and marks the chunked file as complete. If the chunk format produces compressed chunk files (e.g. ending with
+        '.gz'), each chunk is compressed on a thread pool as soon as it is complete, such that compression does not
+        block writing the next chunk.
+
+        :param file_path: base file path
+        :param mode: write or append mode, text or binary. Appending continues the last chunk, as decided by the chunker.
+        :param chunk_format: chunk format deciding the chunk file paths
+        :param chunker: sequential chunker deciding the chunk index of each line
+        :param delimiter: delimiter that indicates a line break
+        :param verbose: warns about operations, which might not behave as expected
+        :param write_manifest: writes a manifest of all chunks on close
+        :param compression_workers: number of threads compressing chunk files, defaults to the number of cpus,
+            0 compresses synchronously
+        :param compresslevel: optional compression level, else the default of the codec
+        :param concurrent: allows several writers, e.g. in different processes, to write into the same chunked file.
+            Each writer claims the next free chunk index atomically, writes to a temporary file and renames it once
+            the chunk is complete. No manifest is written in this mode.
+        """
+        check_mode(mode, self._accepted_mode)
+        assert "w" in mode or "a" in mode, f"Provided mode '{mode}' should either write or append"
 
         self.file_path = file_path
         self._mode = mode
@@ -36,21 +76,206 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         self.open_args = open_args
         self.open_kwargs = open_kwargs
 
+        self.compression_workers = os.cpu_count() if compression_workers is None else compression_workers
+        self.compresslevel = compresslevel
+        self.concurrent = concurrent
+        self._next_claimed_index = None
+        self._compression_executor = None
+        self._compression_futures: List[Future] = []
+
+        # Appending continues after the existing chunks, using their manifest. It is read before it is removed below,
+        # but chunks are only listed afterwards, thus followers never take it as the end of the appended chunks.
+        _append = "a" in mode and not concurrent
+        _manifest = self.chunk_format.read_manifest(self.file_path) if _append else None
+
+        # Stale metadata would hide or misplace the chunks written now, thus remove it until this writer is closed
+        self._manifest_path = self.chunk_format.manifest_path(self.file_path)
+        for _metadata_path in [self._manifest_path, self.chunk_format.line_index_path(self.file_path)]:
+            if _metadata_path is not None and os.path.isfile(_metadata_path):
+                os.remove(_metadata_path)
+
+        _append_state = None
+        if _append:
+            _manifest, _append_state = self._read_append_state(_manifest)
+        # A manifest can only describe the chunks of a single writer, thus concurrent writers do not write one. When
+        # appending to chunks without manifest, none is written either, since it would require reading all chunks.
+        self.write_manifest = write_manifest and self._manifest_path is not None
+        self._manifest = None
+        if not concurrent:
+            self._manifest = ChunkManifest() if _append_state is None else _manifest
+
         self._current_file = None
-        self._current_line = ""
+        self._current_file_path = None
+        self._current_staging_path = None
+        self._current_line = self._empty
         self._current_chunk_index = None
+        self._current_chunk_line_count = 0
+        self._current_chunk_complete = True
+        self._suspended = False
+        if _append_state is not None:
+            self.chunker.resume(*_append_state)
         self._open_chunk_file(self.chunker.current_index)
+        if _append_state is not None:
+            _, self._current_chunk_line_count, _, self._current_chunk_complete = _append_state
+
+    def _read_append_state(
+            self, manifest: Optional[ChunkManifest]
+    ) -> Tuple[Optional[ChunkManifest], Optional[Tuple[int, int, int, bool]]]:
+        """
+        Determines where appending continues, without reading the existing chunks: the last chunk keeps being filled,
+        taking its line count from the manifest if present, else its lines are counted once. The last chunk is copied
+        (or decompressed) once to its staging file, thus it stays readable until the continued chunk replaces it.
+        Chunks written with another compression can not be continued, thus appending starts the next chunk instead.
+
+        :param manifest: manifest of the existing chunks, if any
+        :return: manifest without the continued chunk or None, (chunk index, line count, byte count, line complete)
+            or None if there are no chunks yet
+        """
+        try:
+            chunk_files = list(self.chunk_format.list(self.file_path, return_index=True))
+        except FileNotFoundError:
+            return None, None
+        if not chunk_files:
+            return None, None
+        last_chunk_file, last_index = chunk_files[-1]
+
+        if manifest is not None and (len(manifest) != len(chunk_files) or manifest.entries[-1].index != last_index):
+            manifest = None  # Outdated
+        if self.chunk_format.format(self.file_path, last_index) != last_chunk_file:
+            return manifest, (last_index + 1, 0, 0, True)
+        # Continues in the uncompressed staging file, which replaces the chunk once it is complete again
+        if is_compressed(last_chunk_file):
+            with open_chunk_file(last_chunk_file, "rb") as source, open(last_chunk_file + ".tmp", "wb") as target:
+                shutil.copyfileobj(source, target, 1 << 20)
+        else:
+            shutil.copyfile(last_chunk_file, last_chunk_file + ".tmp")
+        last_chunk_file = last_chunk_file + ".tmp"
+
+        _delimiter = self._delimiter
+        if not isinstance(_delimiter, bytes):
+            _delimiter = _delimiter.encode(self.open_kwargs.get("encoding") or "utf-8")
+        with open(last_chunk_file, "rb") as file:
+            size = file.seek(0, os.SEEK_END)
+            file.seek(max(size - len(_delimiter), 0))
+            line_complete = size == 0 or file.read() == _delimiter
+        if manifest is not None:
+            line_count = manifest.entries.pop().lines
+        else:
+            line_count = count_lines(last_chunk_file, delimiter=_delimiter)
+        # Only complete lines count, the incomplete last line is continued
+        return manifest, (last_index, line_count - (not line_complete), size, line_complete)
 
     def _open_chunk_file(self, index: int):
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            self._current_file.close()
+        self._close_chunk_file()
         self._current_chunk_index = index
+        self._current_chunk_line_count = 0
+        self._current_chunk_complete = True
+        if self.concurrent:
+            self._current_file_path = self._claim_chunk_file()
+        else:
+            self._current_file_path = self.chunk_format.format(self.file_path, index)
+        self._current_staging_path = self._current_file_path + ".tmp"
         self._current_file = open(
-            self.chunk_format.format(self.file_path, index),
+            self._current_staging_path,
             mode=self.mode,
             *self.open_args, **self.open_kwargs
         )
 
+    def _claim_chunk_file(self) -> str:
+        """
+        Claims the next free chunk index by exclusively creating the temporary file of the chunk. Indices of chunks,
+        which are complete or claimed by other writers, are skipped. Starts after the highest existing chunk index.
+
+        :return: path of the claimed chunk file
+        """
+        if self._next_claimed_index is None:
+            try:
+                indices = [index for _, index in self.chunk_format.list(self.file_path, return_index=True)]
+            except FileNotFoundError:
+                indices = []
+            self._next_claimed_index = max(indices, default=-1) + 1
+        while True:
+            index = self._next_claimed_index
+            self._next_claimed_index += 1
+            file_path = self.chunk_format.format(self.file_path, index)
+            try:
+                os.close(os.open(file_path + ".tmp", os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                continue  # Claimed by another writer
+            if os.path.exists(file_path):  # Completed by another writer
+                os.remove(file_path + ".tmp")
+                continue
+            return file_path
+
+    def _close_chunk_file(self):
+        if not isinstance(self._current_file, self._file_type) or (self._current_file.closed and not self._suspended):
+            return
+        self._current_file.close()
+        self._suspended = False
+        if self.concurrent and os.path.getsize(self._current_staging_path) == 0:
+            os.remove(self._current_staging_path)  # Releases the claimed index instead of publishing an empty chunk
+            return
+        if self._manifest is not None:
+            # A trailing line without delimiter still counts as a line. Sizes are uncompressed.
+            self._manifest.append(index=self._current_chunk_index,
+                                  file_name=os.path.basename(self._current_file_path),
+                                  lines=self._current_chunk_line_count + (not self._current_chunk_complete),
+                                  bytes=os.path.getsize(self._current_staging_path))
+        if is_compressed(self._current_file_path):
+            self._compress_chunk_file(self._current_staging_path, self._current_file_path)
+        else:
+            os.replace(self._current_staging_path, self._current_file_path)
+
+    def _compress_chunk_file(self, staging_path: str, file_path: str):
+        if self.compression_workers <= 0:
+            compress_file(staging_path, file_path, compresslevel=self.compresslevel)
+            return
+        if self._compression_executor is None:
+            self._compression_executor = ThreadPoolExecutor(max_workers=self.compression_workers)
+        # Limit the number of pending chunks, in case writing is much faster than compressing
+        while len(self._compression_futures) >= 2 * self.compression_workers:
+            self._compression_futures.pop(0).result()
+        self._compression_futures.append(
+            self._compression_executor.submit(compress_file, staging_path, file_path, self.compresslevel)
+        )
+
+    def _wait_for_compression(self):
+        if self._compression_executor is None:
+            return
+        try:
+            for future in self._compression_futures:
+                future.result()  # Raises errors of the compression
+        finally:
+            self._compression_futures = []
+            self._compression_executor.shutdown()
+            self._compression_executor = None
+
+    def suspend(self):
+        """
+        Closes the current chunk file temporarily, releasing its file descriptor, e.g. if many writers are open at
+        once. The chunk is not published, the next write reopens it in append mode.
+        """
+        if self._suspended or self.closed:
+            return
+        self._current_file.close()
+        self._suspended = True
+
+    def _resume(self):
+        self._current_file = open(
+            self._current_staging_path,
+            mode=self.mode.replace("w", "a"),
+            *self.open_args, **self.open_kwargs
+        )
+        self._suspended = False
+
+    @property
+    def manifest(self) -> Optional[ChunkManifest]:
+        """
+        Manifest of the chunks published so far, None if this writer can not describe all chunks, e.g. when writing
+        concurrently.
+        """
+        return self._manifest
+
     @property
     def mode(self) -> str:
         return self._mode
@@ -61,14 +286,16 @@ class BaseSequentialTextIOWriter(typing.TextIO):
 
     @property
     def closed(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if self._suspended:
+            return False
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.closed
         else:
             return True
 
     @property
     def buffer(self) -> BinaryIO:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.buffer
         else:
             raise NotImplementedError("Buffer not initialized yet!")
@@ -78,7 +305,7 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         _encoding = self.open_kwargs.get("encoding")
         if isinstance(_encoding, str):
             return _encoding
-        elif isinstance(self._current_file, _io.TextIOWrapper):
+        elif isinstance(self._current_file, self._file_type):
             return self._current_file.encoding
         else:
             raise NotImplementedError("Encoding not initialized yet!")
@@ -88,21 +315,21 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         _errors = self.open_kwargs.get("errors")
         if isinstance(_errors, str):
             return _errors
-        elif isinstance(self._current_file, _io.TextIOWrapper):
+        elif isinstance(self._current_file, self._file_type):
             return self._current_file.errors
         else:
             return None
 
     @property
     def line_buffering(self) -> bool | int:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.line_buffering
         else:
             return False
 
     @property
     def newlines(self) -> Any:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.newlines
         else:
             raise NotImplementedError("Newlines not initialized yet!")
@@ -111,25 +338,29 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         return self
 
     def close(self) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            return self._current_file.close()
-        else:
+        if self.closed:
             return None
+        self._close_chunk_file()
+        self._wait_for_compression()
+        if self._manifest is not None and self.write_manifest:
+            self._manifest.write(self._manifest_path)
 
     def fileno(self) -> int:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.fileno()
         else:
             raise NotImplementedError("Current file not initialized yet!")
 
     def flush(self) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if self._suspended:
+            return None
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.flush()
         else:
             return None
 
     def isatty(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.isatty()
         else:
             return False
@@ -138,7 +369,7 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         raise NotImplementedError
 
     def readable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.readable()
         else:
             return False
@@ -154,13 +385,13 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         if self.verbose:
             warnings.warn("seek forwards to current chunk file. This may not be what you have intended to do! "
                           "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.seek(*args, **kwargs)
         else:
             raise NotImplementedError("Current file not initialized yet!")
 
     def seekable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.seekable()
         else:
             return False
@@ -170,7 +401,7 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         if self.verbose:
             warnings.warn("tell forwards to current chunk file. This may not be what you have intended to do! "
                           "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.tell()
         else:
             raise NotImplementedError("Current file not initialized yet!")
@@ -180,40 +411,59 @@ class BaseSequentialTextIOWriter(typing.TextIO):
         if self.verbose:
             warnings.warn("truncate forwards to current chunk file. This may not be what you have intended to do! "
                           "(To silence this warning set verbose to false)")
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.truncate(*args, **kwargs)
         else:
             raise NotImplementedError("Current file not initialized yet!")
 
     def writable(self) -> bool:
-        if isinstance(self._current_file, _io.TextIOWrapper):
+        if isinstance(self._current_file, self._file_type):
             return self._current_file.writable()
         else:
             return False
 
     def write(self, __s: AnyStr) -> int:
-        lines = parse_lines(__s, delimiter=self._delimiter)
-        return self._write_delimited_lines(lines)
+        # Blocks are sliced into segments by the chunker, searching delimiters in place instead of splitting lines
+        for block in iter_blocks(__s, delimiter=self._delimiter, block_size=self._write_block_size):
+            segments = self.chunker.block_segments(block, delimiter=self._delimiter)
+            for index, start, stop in segments:
+                if index != self._current_chunk_index:
+                    self._open_chunk_file(index)
+                self._write_chunk(block if len(segments) == 1 else block[start:stop])
+        return len(__s)
 
     def writelines(self, __lines: Iterable[AnyStr]) -> None:
-        _ = self._write_delimited_lines(list(__lines))
+        # Consume the lines batch by batch, thus generators are never materialized as a whole
+        _lines = iter(__lines)
+        batch = list(islice(_lines, self._writelines_batch_size))
+        while batch:
+            self._write_delimited_lines(batch)
+            batch = list(islice(_lines, self._writelines_batch_size))
         return None
 
-    def _write_delimited_lines(self, delimited_lines: List[str]) -> int:
+    def _write_delimited_lines(self, delimited_lines: List[AnyStr]) -> int:
+        """
+        Writes lines to the chunk files as decided by the chunker.
+
+        :param delimited_lines: list of lines (each being a string or bytes)
+        :return: response of the last write
+        """
         last_response = -1
-        indices = self.chunker.indices(delimited_lines)
-        _current_line = ""
-        for line, index in zip(delimited_lines, indices):
-            if index == self._current_chunk_index:
-                _current_line += line
-            else:
-                last_response = self._current_file.write(_current_line)
+        for index, start, stop in self.chunker.segments(delimited_lines):
+            if index != self._current_chunk_index:
                 self._open_chunk_file(index)
-                _current_line = line
-        if _current_line:
-            last_response = self._current_file.write(_current_line)
+            # Write whole segments of lines at once, instead of deciding the chunk line by line
+            last_response = self._write_chunk(self._empty.join(delimited_lines[start:stop]))
         return last_response
 
+    def _write_chunk(self, text: AnyStr) -> int:
+        if self._suspended:
+            self._resume()
+        if text:
+            self._current_chunk_line_count += text.count(self._delimiter)
+            self._current_chunk_complete = text.endswith(self._delimiter)
+        return self._current_file.write(text)
+
     def __next__(self) -> AnyStr:
         raise NotImplementedError
 
@@ -222,5 +472,4 @@ class BaseSequentialTextIOWriter(typing.TextIO):
 
     def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
                  __traceback: TracebackType | None) -> None:
-        if isinstance(self._current_file, _io.TextIOWrapper):
-            self._current_file.close()
+        self.close()
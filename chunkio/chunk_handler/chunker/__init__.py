@@ -1 +1,2 @@
-from .sequential_chunker import SequentialChunker, MaxLineSequentialChunker
+from .sequential_chunker import SequentialChunker, FixedIndexSequentialChunker, MaxLineSequentialChunker, \
+    MaxByteSequentialChunker
@@ -1,7 +1,11 @@
+import bisect
+import os
+
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from itertools import accumulate, groupby
+from typing import AnyStr, List, Optional, Tuple
 
-from chunkio.chunk_handler.utils import group_into_lines
+from chunkio.chunk_handler.utils import find_nth, group_into_lines, parse_lines
 
 
 class SequentialChunker(ABC):
@@ -21,8 +25,20 @@ class SequentialChunker(ABC):
         """
         pass
 
+    def resume(self, index: int, line_count: int = 0, byte_count: int = 0, line_complete: bool = True):
+        """
+        Continue an existing chunk, e.g. when appending to a chunked file.
+
+        :param index: chunk index to continue
+        :param line_count: number of complete lines in that chunk
+        :param byte_count: number of bytes in that chunk
+        :param line_complete: false if the last line of that chunk is missing its delimiter
+        """
+        self.reset()
+        self._current_index = index
+
     @abstractmethod
-    def index(self, line_part: str) -> int:
+    def index(self, line_part: AnyStr) -> int:
         """
         Returns true if this line should be writen to the chunker chunk file, else returns false.
 
@@ -31,18 +47,75 @@ class SequentialChunker(ABC):
         """
         pass
 
-    def indices(self, line_parts: List[str]) -> List[int]:
+    def indices(self, line_parts: List[AnyStr]) -> List[int]:
         """
         Split list of lines into chunks of lines written to the next chunk files.
 
-        :param line_parts: list of lines (each being a string)
+        :param line_parts: list of lines (each being a string or bytes)
         :return: list of chunk indices for the provided list of lines
         """
         return [self.index(line) for line in line_parts]
 
+    def segments(self, line_parts: List[AnyStr]) -> List[Tuple[int, int, int]]:
+        """
+        Split list of lines into consecutive segments of lines written to the same chunk file. Equivalent to the
+        run-length encoding of indices, which is used by default. Chunkers should override this to avoid a chunk index
+        per line.
+
+        :param line_parts: list of lines (each being a string or bytes)
+        :return: list of (chunk index, start, stop) tuples, such that line_parts[start:stop] go to the chunk index
+        """
+        segments = []
+        start = 0
+        for index, group in groupby(self.indices(line_parts)):
+            stop = start + sum(1 for _ in group)
+            segments.append((index, start, stop))
+            start = stop
+        return segments
+
+    def block_segments(self, block: AnyStr, delimiter: AnyStr = "\n") -> List[Tuple[int, int, int]]:
+        """
+        Split a block of text (or bytes) into consecutive segments written to the same chunk file. Equivalent to
+        segments of the lines of the block, which is used by default. Chunkers should override this to search
+        delimiters in place, instead of splitting the block into lines.
+
+        :param block: text (or bytes), possibly ending with an incomplete line
+        :param delimiter: delimiter that indicates a line break, needs to match the type of the block
+        :return: list of (chunk index, start, stop) tuples, such that block[start:stop] goes to the chunk index
+        """
+        lines = parse_lines(block, delimiter=delimiter)
+        if not lines[-1]:
+            lines.pop()
+        offsets = list(accumulate(map(len, lines), initial=0))
+        return [(index, offsets[start], offsets[stop]) for index, start, stop in self.segments(lines)]
+
+
+class FixedIndexSequentialChunker(SequentialChunker):
+    def __init__(self, index: int = 0):
+        """
+        Never rolls over, i.e. writes all lines into the chunk with the given index, e.g. the chunk of a partition.
+
+        :param index: chunk index of all lines
+        """
+        super().__init__()
+        self.fixed_index = index
+        self.reset()
+
+    def reset(self):
+        self._current_index = self.fixed_index
+
+    def index(self, line_part: AnyStr) -> int:
+        return self._current_index
+
+    def segments(self, line_parts: List[AnyStr]) -> List[Tuple[int, int, int]]:
+        return [(self._current_index, 0, len(line_parts))] if line_parts else []
+
+    def block_segments(self, block: AnyStr, delimiter: AnyStr = "\n") -> List[Tuple[int, int, int]]:
+        return [(self._current_index, 0, len(block))] if block else []
+
 
 class MaxLineSequentialChunker(SequentialChunker):
-    def __init__(self, max_lines: int = 10_000, delimiter: str = "\n"):
+    def __init__(self, max_lines: int = 10_000, delimiter: AnyStr = "\n"):
         super().__init__()
         self.max_lines = max_lines
         self.delimiter = delimiter
@@ -53,11 +126,15 @@ class MaxLineSequentialChunker(SequentialChunker):
         self.current_line_count = 0
         self._current_index = 0
 
+    def resume(self, index: int, line_count: int = 0, byte_count: int = 0, line_complete: bool = True):
+        super().resume(index)
+        self.current_line_count = line_count
+
     def _increment_current_index(self):
         self.current_line_count = 0
         self._current_index += 1
 
-    def index(self, line_part: str) -> int:
+    def index(self, line_part: AnyStr) -> int:
         if self.current_line_count >= self.max_lines:
             self._increment_current_index()
 
@@ -65,7 +142,7 @@ class MaxLineSequentialChunker(SequentialChunker):
             self.current_line_count += 1
         return self._current_index
 
-    def indices(self, line_parts: List[str]) -> List[int]:
+    def indices(self, line_parts: List[AnyStr]) -> List[int]:
         _remaining_lines = self.max_lines - self.current_line_count
 
         grouped_lines = group_into_lines(line_parts, delimiter=self.delimiter)
@@ -104,3 +181,255 @@ class MaxLineSequentialChunker(SequentialChunker):
             self.current_line_count -= 1
 
         return indices
+
+    def segments(self, line_parts: List[AnyStr]) -> List[Tuple[int, int, int]]:
+        _delimiter = self.delimiter
+        line_ends = [position for position, line_part in enumerate(line_parts) if line_part.endswith(_delimiter)]
+        _num_line_parts = len(line_parts)
+
+        segments = []
+        start = 0
+        consumed_lines = 0
+        while start < _num_line_parts:
+            if self.current_line_count >= self.max_lines:  # Roll over lazily, i.e. only if more line parts follow
+                self._increment_current_index()
+            _remaining_lines = self.max_lines - self.current_line_count
+            if consumed_lines + _remaining_lines <= len(line_ends):  # Fill the current chunk
+                stop = line_ends[consumed_lines + _remaining_lines - 1] + 1
+                consumed_lines += _remaining_lines
+                self.current_line_count += _remaining_lines
+            else:  # Remaining line parts fit the current chunk, the last line might be incomplete
+                stop = _num_line_parts
+                self.current_line_count += len(line_ends) - consumed_lines
+                consumed_lines = len(line_ends)
+            segments.append((self._current_index, start, stop))
+            start = stop
+        return segments
+
+    def block_segments(self, block: AnyStr, delimiter: AnyStr = "\n") -> List[Tuple[int, int, int]]:
+        _delimiter = self.delimiter
+        _length = len(block)
+        segments = []
+        start = 0
+        while start < _length:
+            if self.current_line_count >= self.max_lines:  # Roll over lazily, i.e. only if more content follows
+                self._increment_current_index()
+            stop = find_nth(block, _delimiter, self.max_lines - self.current_line_count, start)
+            if stop < 0:  # Remaining content fits the current chunk, the last line might be incomplete
+                stop = _length
+                self.current_line_count += block.count(_delimiter, start)
+            else:
+                self.current_line_count = self.max_lines
+            segments.append((self._current_index, start, stop))
+            start = stop
+        return segments
+
+
+class MaxByteSequentialChunker(SequentialChunker):
+    def __init__(self,
+                 max_bytes: int = 64 * 1024 * 1024,
+                 max_lines: Optional[int] = None,
+                 delimiter: AnyStr = "\n",
+                 encoding: str = "utf-8",
+                 newline: Optional[str] = None):
+        """
+        Rolls over to the next chunk before a line that would exceed the maximum number of (encoded) bytes. Lines are
+        never split, thus a single line larger than max_bytes is placed in its own chunk. Optionally, also rolls over
+        after max_lines lines, whatever limit is hit first.
+
+        Strings are measured as written by a text file with the given encoding and newline, i.e. including the newline
+        translation and the byte order mark at the start of each chunk file, e.g. for 'utf-16' or 'utf-8-sig'.
+
+        :param max_bytes: maximum number of bytes per chunk
+        :param max_lines: optional maximum number of lines per chunk
+        :param delimiter: string (or bytes) that indicates a line break
+        :param encoding: encoding used to estimate the size of strings, ignored for bytes
+        :param newline: newline argument of the text files, translating '\\n' on write, ignored for bytes
+        """
+        super().__init__()
+        assert max_bytes > 0, "max_bytes should be a positive integer!"
+        assert max_lines is None or max_lines > 0, "max_lines should be a positive integer!"
+        self.max_bytes = max_bytes
+        self.max_lines = max_lines
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.newline = newline
+        self.current_byte_count = None
+        self.current_line_count = None
+        self._line_complete = None
+
+        # Bytes written once per chunk file and per translated '\n', in addition to the encoded string
+        self._bom_size = 0 if isinstance(delimiter, bytes) else len("".encode(encoding))
+        _translated_newline = os.linesep if newline is None else newline or "\n"
+        self._newline_overhead = 0 if isinstance(delimiter, bytes) else \
+            len(_translated_newline.encode(encoding)) - len("\n".encode(encoding))
+        self._ascii_compatible = isinstance(delimiter, bytes) or "\n ~".encode(encoding) == b"\n ~"
+        self.reset()
+
+    def reset(self):
+        self.current_byte_count = 0
+        self.current_line_count = 0
+        self._line_complete = True
+        self._current_index = 0
+
+    def resume(self, index: int, line_count: int = 0, byte_count: int = 0, line_complete: bool = True):
+        super().resume(index)
+        self.current_line_count = line_count
+        self.current_byte_count = max(byte_count - self._bom_size, 0)  # Byte counts of chunk files include the mark
+        self._line_complete = line_complete
+
+    def _increment_current_index(self):
+        self.current_byte_count = 0
+        self.current_line_count = 0
+        self._current_index += 1
+
+    def _size(self, line_part: AnyStr) -> int:
+        if isinstance(line_part, bytes):
+            return len(line_part)
+        if self._ascii_compatible and line_part.isascii():
+            size = len(line_part)
+        else:
+            size = len(line_part.encode(self.encoding)) - self._bom_size
+        if self._newline_overhead:
+            size += self._newline_overhead * line_part.count("\n")
+        return size
+
+    def _sizes(self, line_parts: List[AnyStr]) -> List[int]:
+        if self._ascii_compatible and not self._newline_overhead and \
+                (not line_parts or isinstance(line_parts[0], bytes) or all(map(str.isascii, line_parts))):
+            return list(map(len, line_parts))
+        return [self._size(line_part) for line_part in line_parts]
+
+    def _is_full(self, size: int) -> bool:
+        if self.current_byte_count == 0 and self.current_line_count == 0:
+            return False  # Never roll over from an empty chunk
+        if self.max_lines is not None and self.current_line_count >= self.max_lines:
+            return True
+        return self._bom_size + self.current_byte_count + size > self.max_bytes
+
+    def _add(self, size: int, line_complete: bool):
+        # Decisions are only made at the start of a line, thus lines are never split
+        if self._line_complete and self._is_full(size):
+            self._increment_current_index()
+        self.current_byte_count += size
+        self._line_complete = line_complete
+        if line_complete:
+            self.current_line_count += 1
+
+    def index(self, line_part: AnyStr) -> int:
+        if line_part:  # Empty parts never start a new line
+            self._add(self._size(line_part), line_part.endswith(self.delimiter))
+        return self._current_index
+
+    def indices(self, line_parts: List[AnyStr]) -> List[int]:
+        indices = []
+        for index, start, stop in self.segments(line_parts):
+            indices += (stop - start) * [index]
+        return indices
+
+    def segments(self, line_parts: List[AnyStr]) -> List[Tuple[int, int, int]]:
+        """
+        Assigns whole runs of lines at once: the byte offsets of all line ends are accumulated upfront, such that the
+        last line fitting the current chunk is found by bisection, i.e. the work per chunk does not depend on its
+        number of lines.
+        """
+        _delimiter = self.delimiter
+        _num_line_parts = len(line_parts)
+        offsets = list(accumulate(self._sizes(line_parts), initial=0))
+        line_ends = [position + 1 for position, line_part in enumerate(line_parts) if line_part.endswith(_delimiter)]
+        line_end_offsets = [offsets[line_end] for line_end in line_ends]
+
+        segments = []
+        start = 0
+        position = 0
+        consumed_lines = 0
+        if not self._line_complete:  # Finish the incomplete last line of the current chunk first
+            position = line_ends[0] if line_ends else _num_line_parts
+            consumed_lines = 1 if line_ends else 0
+            self.current_byte_count += offsets[position]
+            self._line_complete = bool(line_ends)
+            self.current_line_count += consumed_lines
+
+        while position < _num_line_parts:
+            line_end = line_ends[consumed_lines] if consumed_lines < len(line_ends) else _num_line_parts
+            size = offsets[line_end] - offsets[position]
+            if not size:
+                break  # Only empty parts remain, which never start a new line
+            if self._is_full(size):
+                if position > start:
+                    segments.append((self._current_index, start, position))
+                    start = position
+                self._increment_current_index()
+
+            if consumed_lines == len(line_ends):  # Incomplete last line
+                self.current_byte_count += size
+                self._line_complete = False
+                break
+
+            # Last complete line fitting the current chunk, but at least the next one
+            _budget = offsets[position] + self.max_bytes - self._bom_size - self.current_byte_count
+            n_lines = max(bisect.bisect_right(line_end_offsets, _budget, lo=consumed_lines) - consumed_lines, 1)
+            if self.max_lines is not None:
+                n_lines = min(n_lines, self.max_lines - self.current_line_count)
+            stop = line_ends[consumed_lines + n_lines - 1]
+            self.current_byte_count += offsets[stop] - offsets[position]
+            self.current_line_count += n_lines
+            consumed_lines += n_lines
+            position = stop
+
+        if start < _num_line_parts:
+            segments.append((self._current_index, start, _num_line_parts))
+        return segments
+
+    def block_segments(self, block: AnyStr, delimiter: AnyStr = "\n") -> List[Tuple[int, int, int]]:
+        """
+        Searches chunk boundaries in place, if the offsets within the block are byte offsets once written, i.e. for
+        bytes and ASCII text in an ASCII compatible encoding without newline translation. The last line fitting the
+        current chunk is found with a single rfind. Other blocks are split into lines.
+        """
+        if isinstance(block, str) and not (self._ascii_compatible and not self._newline_overhead and block.isascii()):
+            return super().block_segments(block, delimiter=self.delimiter)
+        _delimiter = self.delimiter
+        _delimiter_length = len(_delimiter)
+        _length = len(block)
+
+        segments = []
+        start = 0
+        position = 0
+        if not self._line_complete and _length:  # Finish the incomplete last line of the current chunk first
+            line_end = block.find(_delimiter)
+            position = _length if line_end < 0 else line_end + _delimiter_length
+            self.current_byte_count += position
+            self._line_complete = line_end >= 0
+            self.current_line_count += line_end >= 0
+
+        while position < _length:
+            line_end = block.find(_delimiter, position)
+            line_end = _length if line_end < 0 else line_end + _delimiter_length
+            if self._is_full(line_end - position):
+                if position > start:
+                    segments.append((self._current_index, start, position))
+                    start = position
+                self._increment_current_index()
+
+            if not block.endswith(_delimiter, position, line_end):  # Incomplete last line
+                self.current_byte_count += line_end - position
+                self._line_complete = False
+                break
+
+            # Last complete line fitting the current chunk, but at least the next one
+            _limit = position + self.max_bytes - self._bom_size - self.current_byte_count
+            stop = line_end
+            if _limit > line_end:
+                stop = max(block.rfind(_delimiter, line_end, min(_limit, _length)) + _delimiter_length, line_end)
+            n_lines = block.count(_delimiter, position, stop)
+            if self.max_lines is not None and self.current_line_count + n_lines > self.max_lines:
+                n_lines = self.max_lines - self.current_line_count
+                stop = find_nth(block, _delimiter, n_lines, position)
+            self.current_byte_count += stop - position
+            self.current_line_count += n_lines
+            position = stop
+
+        if start < _length:
+            segments.append((self._current_index, start, _length))
+        return segments
@@ -0,0 +1,116 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+
+from typing import IO, Optional, Tuple
+
+COMPRESSION_EXTENSIONS = {
+    "gzip": ".gz",
+    "bz2": ".bz2",
+    "lzma": ".xz"
+}
+
+_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open
+}
+
+# Keyword arguments of the builtin open, which are understood by the compressed file openers as well
+_TEXT_KWARGS = ("encoding", "errors", "newline")
+
+
+def compression_extension(compression: Optional[str]) -> str:
+    """
+    File extension of a compression codec, e.g. '.gz' for 'gzip'.
+
+    :param compression: name of the codec, one of 'gzip', 'bz2', 'lzma' or None
+    :return: file extension, empty string for no compression
+    """
+    if compression is None:
+        return ""
+    assert compression in COMPRESSION_EXTENSIONS, \
+        f"Unsupported compression '{compression}', use one of {list(COMPRESSION_EXTENSIONS)}"
+    return COMPRESSION_EXTENSIONS[compression]
+
+
+def split_compression_extension(file_path: str) -> Tuple[str, str]:
+    """
+    Splits a compression extension from a file path, e.g. '/path/file.txt.gz' -> ('/path/file.txt', '.gz')
+
+    :param file_path: file path
+    :return: (file path without compression extension, compression extension or empty string)
+    """
+    _, file_extension = os.path.splitext(file_path)
+    if file_extension in _OPENERS:
+        return file_path[:-len(file_extension)], file_extension
+    return file_path, ""
+
+
+def is_compressed(file_path: str) -> bool:
+    return bool(split_compression_extension(file_path)[1])
+
+
+def open_chunk_file(file_path: str, mode: str = "r", *open_args, **open_kwargs) -> IO:
+    """
+    Opens a chunk file, transparently (de)compressing it according to its file extension. Compressed files support
+    the encoding, errors and newline keyword arguments only.
+
+    :param file_path: path to the chunk file
+    :param mode: mode, as for the builtin open
+    :return: file object
+    """
+    _, file_extension = split_compression_extension(file_path)
+    if not file_extension:
+        return open(file_path, mode, *open_args, **open_kwargs)
+    if "b" not in mode and "t" not in mode:
+        mode += "t"  # Compressed files default to binary mode
+    kwargs = {key: value for key, value in open_kwargs.items() if key in _TEXT_KWARGS and "t" in mode}
+    return _OPENERS[file_extension](file_path, mode, **kwargs)
+
+
+def uncompressed_size(file_path: str, block_size: int = 1 << 20) -> int:
+    """
+    Size of the content of a chunk file. Compressed files are decompressed to determine their size.
+
+    :param file_path: path to the chunk file
+    :param block_size: number of bytes decompressed at once
+    :return: size in bytes
+    """
+    if not is_compressed(file_path):
+        return os.path.getsize(file_path)
+    size = 0
+    with open_chunk_file(file_path, "rb") as file:
+        block = file.read(block_size)
+        while block:
+            size += len(block)
+            block = file.read(block_size)
+    return size
+
+
+def compress_file(source_file_path: str,
+                  target_file_path: str,
+                  compresslevel: Optional[int] = None,
+                  remove_source: bool = True):
+    """
+    Compresses a file according to the extension of the target file path. The target only appears once it is
+    complete, since the compressed data is written to a temporary file first.
+
+    :param source_file_path: path to the uncompressed file
+    :param target_file_path: path to the compressed file, e.g. ending with '.gz'
+    :param compresslevel: optional compression level, else the default of the codec
+    :param remove_source: removes the uncompressed file afterwards
+    """
+    _, file_extension = split_compression_extension(target_file_path)
+    assert file_extension, f"Unknown compression for {target_file_path}"
+    kwargs = dict(compresslevel=compresslevel) if compresslevel is not None else dict()
+    if file_extension == ".xz" and compresslevel is not None:
+        kwargs = dict(preset=compresslevel)
+    _tmp_file_path = target_file_path + ".part"
+    with open(source_file_path, "rb") as source, _OPENERS[file_extension](_tmp_file_path, "wb", **kwargs) as target:
+        shutil.copyfileobj(source, target, 1 << 20)
+    os.replace(_tmp_file_path, target_file_path)
+    if remove_source:
+        os.remove(source_file_path)
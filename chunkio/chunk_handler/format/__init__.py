@@ -1 +1,4 @@
 from .chunk_format import BaseChunkFormat, SubdirNumberedChunkFormat
+from .hive_partitioned_chunk_format import HivePartitionedChunkFormat
+from .chunk_manifest import ChunkManifest, ChunkManifestEntry
+from .chunk_line_index import ChunkLineIndex
@@ -1,7 +1,25 @@
 import os
+import re
+import threading
+import time
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Union, Generator
+from collections import OrderedDict
+from typing import Dict, List, Tuple, Union, Generator, Optional
+
+from chunkio.chunk_handler.compression import COMPRESSION_EXTENSIONS, compression_extension, split_compression_extension
+from chunkio.chunk_handler.compression import uncompressed_size
+from chunkio.chunk_handler.utils import count_lines
+from .chunk_manifest import ChunkManifest
+from .chunk_line_index import ChunkLineIndex
+
+_chunk_file_name_patterns: Dict[str, "re.Pattern"] = dict()
+
+# Listings of chunk directories by (directory, file extension), with the modification time of the directory
+_LISTING_CACHE_SIZE = 256
+_RACY_MTIME_NS = 2_000_000_000
+_listing_cache: "OrderedDict[Tuple[str, str], Tuple[int, List[Tuple[str, int]]]]" = OrderedDict()
+_listing_cache_lock = threading.Lock()
 
 
 class BaseChunkFormat(ABC):
@@ -49,23 +67,134 @@ class BaseChunkFormat(ABC):
         """
         pass
 
+    def metadata_path(self, file_path: str, file_name: str) -> Optional[str]:
+        """
+        Path of a metadata file stored alongside the chunks of the base file path, e.g. the manifest. Formats without
+        metadata support return None.
+
+        :param file_path: path to base file
+        :param file_name: name of the metadata file
+        :return: path to the metadata file or None
+        """
+        return None
+
+    def manifest_path(self, file_path: str) -> Optional[str]:
+        """
+        Path of the manifest describing the chunks of the base file path.
+
+        :param file_path: path to base file
+        :return: path to the manifest file or None
+        """
+        return self.metadata_path(file_path, ChunkManifest.file_name)
+
+    def line_index_path(self, file_path: str) -> Optional[str]:
+        """
+        Path of the line index of the chunks of the base file path.
+
+        :param file_path: path to base file
+        :return: path to the line index file or None
+        """
+        return self.metadata_path(file_path, ChunkLineIndex.file_name)
+
+    def read_manifest(self, file_path: str) -> Optional[ChunkManifest]:
+        """
+        Reads the manifest of the base file path, if present.
+
+        :param file_path: path to base file
+        :return: manifest or None
+        """
+        manifest_path = self.manifest_path(file_path)
+        if manifest_path is None or not os.path.isfile(manifest_path):
+            return None
+        return ChunkManifest.read(manifest_path)
+
+    def read_line_index(self, file_path: str) -> Optional[ChunkLineIndex]:
+        """
+        Reads the line index of the base file path, if present.
+
+        :param file_path: path to base file
+        :return: line index or None
+        """
+        line_index_path = self.line_index_path(file_path)
+        if line_index_path is None or not os.path.isfile(line_index_path):
+            return None
+        return ChunkLineIndex.read(line_index_path)
+
+    def chunk_sizes(self, file_path: str, chunk_files: Optional[List[str]] = None) -> List[int]:
+        """
+        Uncompressed sizes of the chunks of the base file path, taken from the manifest if it describes all chunks,
+        else from the file system. Uncompressed chunk files are never read.
+
+        :param file_path: path to base file
+        :param chunk_files: listed chunk files, else they are listed
+        :return: size per chunk in bytes
+        """
+        if chunk_files is None:
+            chunk_files = list(self.list(file_path))
+        manifest = self.read_manifest(file_path)
+        if manifest is not None and len(manifest) == len(chunk_files):
+            return [entry.bytes for entry in manifest.entries]
+        return [uncompressed_size(chunk_file) for chunk_file in chunk_files]
+
+    def chunk_line_counts(self, file_path: str, chunk_files: Optional[List[str]] = None) -> List[int]:
+        """
+        Line counts of the chunks of the base file path, taken from the manifest if it describes all chunks, else the
+        chunk files are counted once. A trailing line without delimiter counts as a line.
+
+        :param file_path: path to base file
+        :param chunk_files: listed chunk files, else they are listed
+        :return: number of lines per chunk
+        """
+        if chunk_files is None:
+            chunk_files = list(self.list(file_path))
+        manifest = self.read_manifest(file_path)
+        if manifest is not None and len(manifest) == len(chunk_files):
+            return [entry.lines for entry in manifest.entries]
+        return [count_lines(chunk_file) for chunk_file in chunk_files]
+
 
 class SubdirNumberedChunkFormat(BaseChunkFormat):
-    def __init__(self, index_format: str = "06d", keep_extension: bool = True):
+    def __init__(self,
+                 index_format: str = "06d",
+                 keep_extension: bool = True,
+                 compression: Optional[str] = None,
+                 cache_listing: bool = False):
         """
         Uses the base file path as a directory and places chunks in that directory:
 
         keep_extension: true -> /path/to/base_file_path.ext/base_file_path.{index:06d}.ext
         keep_extension: false -> /path/to/base_file_path/base_file_path.{index:06d}.ext
+        compression: 'gzip' -> /path/to/base_file_path.ext/base_file_path.{index:06d}.ext.gz
+
+        Parsing and listing accept compressed chunks regardless of the compression setting.
 
         :param index_format: format string for the index string
         :param keep_extension: keeps the file extension when creating the directory containing the file chunks, default true
+        :param compression: optional compression codec of formatted chunk files, one of 'gzip', 'bz2' or 'lzma'
+        :param cache_listing: caches the listing of chunk directories within the process, until their modification
+            time changes. Directories modified within the last seconds are not cached.
         """
 
         self.index_format = index_format
         self.keep_extension = keep_extension
+        self.compression = compression
+        self.cache_listing = cache_listing
+        self._compression_extension = compression_extension(compression)
 
     def format(self, file_path: str, index: int) -> str:
+        chunk_file_path = self._chunk_file_path(file_path, index)
+
+        directory = os.path.dirname(chunk_file_path)
+        if not os.path.isdir(directory):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass  # Created concurrently by another writer
+
+        return chunk_file_path
+
+    def _chunk_file_path(self, file_path: str, index: int) -> str:
+        # Path of the chunk file only, without creating its directory
         self._validate_index(index)
 
         file_name = os.path.basename(file_path)
@@ -74,12 +203,18 @@ class SubdirNumberedChunkFormat(BaseChunkFormat):
         if not self.keep_extension:
             file_path, _ = os.path.splitext(file_path)
 
-        if not os.path.isdir(file_path):
-            os.mkdir(file_path)
-
-        return os.path.join(file_path, f"{file_name}.{index:{self.index_format}}{file_ext}")
+        return os.path.join(file_path, f"{file_name}.{index:{self.index_format}}{file_ext}{self._compression_extension}")
 
     def parse(self, chunk_file_path: str) -> Tuple[str, int]:
+        uncompressed_file_path, _compression_extension = split_compression_extension(chunk_file_path)
+        if _compression_extension:
+            try:
+                return self._parse(uncompressed_file_path)
+            except AssertionError:
+                pass  # E.g. an uncompressed chunk of a base file with extension '.gz'
+        return self._parse(chunk_file_path)
+
+    def _parse(self, chunk_file_path: str) -> Tuple[str, int]:
         base_file_path = os.path.dirname(chunk_file_path)
 
         if not self.keep_extension:
@@ -98,29 +233,81 @@ class SubdirNumberedChunkFormat(BaseChunkFormat):
 
         return base_file_path, chunk_index
 
-    def list(self, file_path: str, return_index: bool = False) -> Generator[Union[str, Tuple[str, int]], None, None]:
-        parsed_files, parsed_ids = [],[]
+    @staticmethod
+    def _chunk_file_name_pattern(file_extension: str) -> "re.Pattern":
+        # Chunk file names end with '.{index}{ext}', optionally compressed, which excludes temporary files
+        pattern = _chunk_file_name_patterns.get(file_extension)
+        if pattern is None:
+            _compression_extensions = "|".join(re.escape(extension) for extension in COMPRESSION_EXTENSIONS.values())
+            pattern = re.compile(rf".*\.([0-9]+){re.escape(file_extension)}(?:{_compression_extensions})?",
+                                 flags=re.ASCII | re.DOTALL)
+            _chunk_file_name_patterns[file_extension] = pattern
+        return pattern
 
-        expected_base_path = file_path
+    def _directory(self, file_path: str) -> str:
         if not self.keep_extension:
             file_path, _ = os.path.splitext(file_path)
+        return file_path
 
-        for file_name in os.listdir(file_path):
-            potential_file_path = os.path.join(file_path, file_name)
-            if not os.path.isfile(potential_file_path):
-                continue
-            try:
-                base_path, index = self.parse(potential_file_path)
-            except AssertionError:
-                continue
-            if base_path != expected_base_path:
-                continue
-            parsed_files.append(potential_file_path)
-            parsed_ids.append(index)
-
-        sorted_file_paths = [(path, index) for path, index in sorted(zip(parsed_files, parsed_ids), key=lambda t: t[1])]
-        for chunk_file, index in sorted_file_paths:
+    def metadata_path(self, file_path: str, file_name: str) -> Optional[str]:
+        return os.path.join(self._directory(file_path), file_name)
+
+    def list(self, file_path: str, return_index: bool = False) -> Generator[Union[str, Tuple[str, int]], None, None]:
+        manifest = self.read_manifest(file_path)
+        if manifest is not None:
+            directory = self._directory(file_path)
+            for entry in manifest.entries:
+                chunk_file = os.path.join(directory, entry.file_name)
+                if return_index:
+                    yield chunk_file, entry.index
+                else:
+                    yield chunk_file
+            return
+
+        directory = self._directory(file_path)
+        _, file_extension = os.path.splitext(os.path.basename(file_path))
+        chunk_files = self._scan(directory, file_extension)
+        for chunk_file, index in chunk_files:
             if return_index:
                 yield chunk_file, index
             else:
                 yield chunk_file
+
+    def _scan(self, directory: str, file_extension: str) -> List[Tuple[str, int]]:
+        """
+        Scans the directory for chunk files, matching the file names against a compiled pattern and using the file type
+        of the directory entry, i.e. without stat calls on most file systems. Optionally, the result is cached until the
+        modification time of the directory changes.
+
+        :return: sorted list of (chunk file path, index)
+        """
+        _cache_key = (directory, file_extension)
+        if self.cache_listing:
+            _mtime_ns = os.stat(directory).st_mtime_ns
+            _scan_time_ns = time.time_ns()
+            with _listing_cache_lock:
+                cached = _listing_cache.get(_cache_key)
+                if cached is not None and cached[0] == _mtime_ns:
+                    _listing_cache.move_to_end(_cache_key)
+                    return cached[1]
+
+        _match = self._chunk_file_name_pattern(file_extension).fullmatch
+        chunk_files = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                match = _match(entry.name)
+                if match is None or not entry.is_file():
+                    continue
+                chunk_files.append((int(match.group(1)), entry.path))
+        chunk_files.sort()
+        chunk_files = [(chunk_file, index) for index, chunk_file in chunk_files]
+
+        # Modifications within the granularity of the modification time would not change it, thus recently modified
+        # directories are not cached
+        if self.cache_listing and _scan_time_ns - _mtime_ns > _RACY_MTIME_NS:
+            with _listing_cache_lock:
+                _listing_cache[_cache_key] = (_mtime_ns, chunk_files)
+                _listing_cache.move_to_end(_cache_key)
+                while len(_listing_cache) > _LISTING_CACHE_SIZE:
+                    _listing_cache.popitem(last=False)
+        return chunk_files
@@ -0,0 +1,113 @@
+import json
+import os
+
+from itertools import accumulate, islice
+from typing import List, Tuple
+
+from chunkio.chunk_handler.compression import open_chunk_file
+
+
+class ChunkLineIndex:
+    file_name = ".chunkio-line-index.json"
+    version = 1
+
+    def __init__(self, step: int, file_names: List[str], lines: List[int], bytes: List[int], offsets: List[List[int]]):
+        """
+        Sparse line index of a chunked file. Stores the number of lines of every chunk and the byte offset of every
+        step-th line within each chunk, such that any line can be found by jumping to the right chunk and reading at
+        most step lines.
+
+        :param step: number of lines between two indexed byte offsets
+        :param file_names: chunk file names in ascending order of the chunk index
+        :param lines: number of lines per chunk
+        :param bytes: size of each chunk file in bytes, used to detect outdated indices
+        :param offsets: byte offsets of the lines 0, step, 2 * step, ... per chunk
+        """
+        self.step = step
+        self.file_names = file_names
+        self.lines = lines
+        self.bytes = bytes
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.file_names)
+
+    @staticmethod
+    def _index_chunk_file(chunk_file: str, step: int) -> Tuple[int, List[int]]:
+        lines, position, offsets = 0, 0, []
+        with open_chunk_file(chunk_file, mode="rb") as file:
+            line_lengths = map(len, file)
+            while True:
+                # Only every step-th line is handled in python, the rest is consumed by builtins
+                batch = list(islice(line_lengths, step))
+                if not batch:
+                    break
+                offsets.append(position)
+                lines += len(batch)
+                position += sum(batch)
+        return lines, offsets
+
+    @classmethod
+    def build(cls, chunk_files: List[str], step: int = 1_000) -> "ChunkLineIndex":
+        """
+        Builds the line index by scanning all chunk files in binary mode, splitting lines at b'\\n'.
+
+        :param chunk_files: chunk file paths in ascending order of the chunk index
+        :param step: number of lines between two indexed byte offsets
+        :return: line index
+        """
+        assert step > 0, "Step should be a positive integer!"
+        lines, offsets = [], []
+        for chunk_file in chunk_files:
+            chunk_lines, chunk_offsets = cls._index_chunk_file(chunk_file, step)
+            lines.append(chunk_lines)
+            offsets.append(chunk_offsets)
+        return cls(step=step,
+                   file_names=[os.path.basename(chunk_file) for chunk_file in chunk_files],
+                   lines=lines,
+                   bytes=[os.path.getsize(chunk_file) for chunk_file in chunk_files],
+                   offsets=offsets)
+
+    def line_offsets(self) -> List[int]:
+        """
+        :return: number of lines preceding each chunk, followed by the total number of lines
+        """
+        return list(accumulate(self.lines, initial=0))
+
+    def locate(self, chunk: int, line: int) -> Tuple[int, int]:
+        """
+        Locates a line within a chunk.
+
+        :param chunk: position of the chunk
+        :param line: line number within the chunk
+        :return: (byte offset of the closest preceding indexed line, number of lines to skip from there)
+        """
+        if not self.offsets[chunk]:  # Empty chunk
+            return 0, line
+        indexed_line = min(line // self.step, len(self.offsets[chunk]) - 1)
+        return self.offsets[chunk][indexed_line], line - indexed_line * self.step
+
+    def write(self, file_path: str):
+        data = {
+            "version": self.version,
+            "step": self.step,
+            "file_names": self.file_names,
+            "lines": self.lines,
+            "bytes": self.bytes,
+            "offsets": self.offsets
+        }
+        _tmp_file_path = file_path + ".tmp"
+        with open(_tmp_file_path, mode="w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(_tmp_file_path, file_path)
+
+    @classmethod
+    def read(cls, file_path: str) -> "ChunkLineIndex":
+        with open(file_path, mode="r", encoding="utf-8") as file:
+            data = json.load(file)
+        assert data.get("version") == cls.version, f"Unsupported line index version in {file_path}"
+        return cls(step=data["step"],
+                   file_names=data["file_names"],
+                   lines=data["lines"],
+                   bytes=data["bytes"],
+                   offsets=data["offsets"])
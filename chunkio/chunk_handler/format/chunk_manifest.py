@@ -0,0 +1,80 @@
+import json
+import os
+
+from typing import List, NamedTuple, Optional
+
+
+class ChunkManifestEntry(NamedTuple):
+    index: int
+    file_name: str
+    lines: int
+    bytes: int
+    line_offset: int
+    byte_offset: int
+
+
+class ChunkManifest:
+    file_name = ".chunkio-manifest.json"
+    version = 1
+
+    def __init__(self, entries: Optional[List[ChunkManifestEntry]] = None):
+        """
+        Describes all chunks of a chunked file in ascending order, i.e. chunk file names, line counts, byte sizes and
+        the cumulative offsets of each chunk within the whole file. Allows listing chunks and computing totals
+        without touching the chunk files.
+
+        :param entries: manifest entries in ascending order of the chunk index
+        """
+        self.entries = entries if entries is not None else []
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def lines(self) -> int:
+        if not self.entries:
+            return 0
+        return self.entries[-1].line_offset + self.entries[-1].lines
+
+    @property
+    def bytes(self) -> int:
+        if not self.entries:
+            return 0
+        return self.entries[-1].byte_offset + self.entries[-1].bytes
+
+    def append(self, index: int, file_name: str, lines: int, bytes: int) -> ChunkManifestEntry:
+        """
+        Appends the next chunk, deriving its cumulative offsets from the previous entries.
+
+        :param index: chunk index
+        :param file_name: chunk file name, relative to the chunk directory
+        :param lines: number of lines in the chunk
+        :param bytes: size of the chunk in bytes
+        :return: the appended entry
+        """
+        assert not self.entries or index > self.entries[-1].index, "Chunks need to be appended in ascending order!"
+        entry = ChunkManifestEntry(index, file_name, lines, bytes, self.lines, self.bytes)
+        self.entries.append(entry)
+        return entry
+
+    def write(self, file_path: str):
+        """
+        Writes the manifest atomically, such that readers either see the complete manifest or none at all.
+
+        :param file_path: path of the manifest file
+        """
+        data = {"version": self.version}
+        for field in ChunkManifestEntry._fields:
+            data[field] = [getattr(entry, field) for entry in self.entries]
+        _tmp_file_path = file_path + ".tmp"
+        with open(_tmp_file_path, mode="w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+        os.replace(_tmp_file_path, file_path)
+
+    @classmethod
+    def read(cls, file_path: str) -> "ChunkManifest":
+        with open(file_path, mode="r", encoding="utf-8") as file:
+            data = json.load(file)
+        assert data.get("version") == cls.version, f"Unsupported manifest version in {file_path}"
+        columns = [data[field] for field in ChunkManifestEntry._fields]
+        return cls([ChunkManifestEntry(*values) for values in zip(*columns)])
@@ -0,0 +1,131 @@
+import os
+
+from typing import Callable, Collection, Generator, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+from .chunk_format import SubdirNumberedChunkFormat
+
+
+class HivePartitionedChunkFormat(SubdirNumberedChunkFormat):
+    def __init__(self,
+                 partition_key: str,
+                 partition_filter: Optional[Union[Callable[[str], bool], Collection[str]]] = None,
+                 index_format: str = "06d",
+                 keep_extension: bool = True,
+                 compression: Optional[str] = None,
+                 cache_listing: bool = False):
+        """
+        Partitions chunks into one directory per partition value, named 'partition_key=value' (Hive style). Each
+        partition is itself chunked with the SubdirNumberedChunkFormat:
+
+        /path/to/base_file_path.ext/{partition_key}={value}/base_file_path.ext/base_file_path.{index:06d}.ext
+
+        Values are percent-encoded in directory names. Listing only descends into partitions accepted by the
+        partition filter, thus chunks of other partitions are never listed or opened.
+
+        :param partition_key: name of the partition field, e.g. 'date'
+        :param partition_filter: optional callable accepting a partition value or a collection of accepted values
+        :param index_format: format string for the index string
+        :param keep_extension: keeps the file extension when creating the directories, default true
+        :param compression: optional compression codec of formatted chunk files, one of 'gzip', 'bz2' or 'lzma'
+        :param cache_listing: caches the listing of the chunk directories of the partitions within the process, see
+            SubdirNumberedChunkFormat
+        """
+        super().__init__(index_format=index_format,
+                         keep_extension=keep_extension,
+                         compression=compression,
+                         cache_listing=cache_listing)
+        assert partition_key and "=" not in partition_key and os.sep not in partition_key, \
+            f"Invalid partition key '{partition_key}'"
+        self.partition_key = partition_key
+        self.partition_filter = partition_filter
+        if partition_filter is not None and not callable(partition_filter):
+            self.partition_filter = frozenset(str(value) for value in partition_filter).__contains__
+        self._partition_chunk_format = SubdirNumberedChunkFormat(index_format=index_format,
+                                                                 keep_extension=keep_extension,
+                                                                 compression=compression,
+                                                                 cache_listing=cache_listing)
+
+    def partition_chunk_format(self) -> SubdirNumberedChunkFormat:
+        """
+        Chunk format used within each partition, including the metadata of the partition.
+        """
+        return self._partition_chunk_format
+
+    def partition_path(self, file_path: str, value: str) -> str:
+        """
+        Base file path of the chunked file of a partition.
+
+        :param file_path: path to base file
+        :param value: partition value
+        :return: base file path of the partition
+        """
+        _partition_directory = f"{self.partition_key}={quote(str(value), safe='')}"
+        return os.path.join(self._directory(file_path), _partition_directory, os.path.basename(file_path))
+
+    def list_partitions(self, file_path: str) -> List[str]:
+        """
+        Lists the values of all partitions accepted by the partition filter in ascending order.
+
+        :param file_path: path to base file
+        :return: partition values
+        """
+        directory = self._directory(file_path)
+        if not os.path.isdir(directory):
+            return []
+        _prefix = f"{self.partition_key}="
+        values = sorted(unquote(entry.name[len(_prefix):]) for entry in os.scandir(directory)
+                        if entry.name.startswith(_prefix) and entry.is_dir())
+        if self.partition_filter is None:
+            return values
+        return [value for value in values if self.partition_filter(value)]
+
+    def format(self, file_path: str, index: int, partition: Optional[str] = None) -> str:
+        """
+        Formats the path of the chunk with the given index within a partition. Without partition, the index is the
+        position within the listing of all accepted partitions, as returned by list, thus only existing chunks can be
+        formatted. Directories are not created, which is left to the writers.
+
+        :param file_path: path to base file
+        :param index: index of the chunk within the partition, or position within the listing without partition
+        :param partition: optional partition value
+        :return: chunk file path
+        """
+        if partition is not None:
+            return self._chunk_file_path(self.partition_path(file_path, partition), index)
+        self._validate_index(index)
+        for chunk_file, position in self.list(file_path, return_index=True):
+            if position == index:
+                return chunk_file
+        raise IndexError(f"No chunk at position {index} of {file_path}, new chunks require a partition value!")
+
+    def parse(self, chunk_file_path: str) -> Tuple[str, int]:
+        partition_path, index = super().parse(chunk_file_path)
+        partition_directory = os.path.dirname(partition_path)
+        assert os.path.basename(partition_directory).startswith(f"{self.partition_key}="), \
+            f"Unexpected format from {chunk_file_path}"
+        file_path = os.path.dirname(partition_directory)
+        if not self.keep_extension:
+            _, file_extension = os.path.splitext(partition_path)
+            file_path = file_path + file_extension
+        return file_path, index
+
+    def metadata_path(self, file_path: str, file_name: str) -> Optional[str]:
+        return None  # Metadata is stored per partition
+
+    def list(self, file_path: str, return_index: bool = False) -> Generator[Union[str, Tuple[str, int]], None, None]:
+        """
+        Lists the chunks of all accepted partitions, ordered by partition value and chunk index. Since chunk indices
+        restart in each partition, the returned index is the position within this listing.
+        """
+        position = 0
+        for value in self.list_partitions(file_path):
+            partition_path = self.partition_path(file_path, value)
+            if not os.path.isdir(self._directory(partition_path)):
+                continue
+            for chunk_file in self._partition_chunk_format.list(partition_path):
+                if return_index:
+                    yield chunk_file, position
+                else:
+                    yield chunk_file
+                position += 1
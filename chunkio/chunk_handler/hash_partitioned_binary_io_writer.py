@@ -0,0 +1,51 @@
+import typing
+
+from typing import Any, Callable, Optional
+
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from .base_sequential_binary_io_writer import BaseSequentialBinaryIOWriter
+from .hash_partitioned_text_io_writer import HashPartitionedTextIOWriter
+
+
+class HashPartitionedBinaryIOWriter(HashPartitionedTextIOWriter, typing.BinaryIO):
+    """
+    Byte oriented counterpart of the HashPartitionedTextIOWriter. Writes bytes to chunk files opened in binary mode,
+    thus the key function receives bytes.
+    """
+    _accepted_mode = "wb"
+    _empty = b""
+    _writer_class = BaseSequentialBinaryIOWriter
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "wb",
+            num_partitions: int = 16,
+            key: Optional[Callable[[bytes], Any]] = None,
+            chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
+            delimiter: bytes = b"\n",
+            verbose: bool = True,
+            max_open_files: int = 64,
+            buffer_size: int = 1 << 16,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            **open_kwargs
+    ):
+        assert "b" in mode, f"Provided mode '{mode}' is not a binary mode"
+        assert isinstance(delimiter, bytes), "Delimiter should be bytes in binary mode!"
+        super().__init__(file_path,
+                         *open_args,
+                         mode=mode,
+                         num_partitions=num_partitions,
+                         key=key,
+                         chunk_format=chunk_format,
+                         delimiter=delimiter,
+                         verbose=verbose,
+                         max_open_files=max_open_files,
+                         buffer_size=buffer_size,
+                         write_manifest=write_manifest,
+                         compression_workers=compression_workers,
+                         compresslevel=compresslevel,
+                         **open_kwargs)
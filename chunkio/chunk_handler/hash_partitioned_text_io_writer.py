@@ -0,0 +1,285 @@
+import os
+import typing
+import zlib
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, AnyStr, Callable, Iterable, Iterator, List, Optional, TextIO, Type
+
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat, ChunkManifest
+from chunkio.chunk_handler.chunker import FixedIndexSequentialChunker
+from .base_sequential_text_io_writer import BaseSequentialTextIOWriter
+from .utils import check_mode, iter_parse_lines
+
+
+def stable_hash(key: Any) -> int:
+    """
+    Hash of a partition key, which is stable across processes and runs, in contrast to the builtin hash of strings.
+
+    :param key: integer, string, bytes or any other object with a stable representation
+    :return: non-negative integer
+    """
+    if isinstance(key, int):
+        return key % 2 ** 64  # Keeps negative keys apart from their absolute value
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    elif not isinstance(key, (bytes, bytearray, memoryview)):
+        key = repr(key).encode("utf-8")
+    return zlib.crc32(key)
+
+
+class HashPartitionedTextIOWriter(typing.TextIO):
+    _accepted_mode = "wt"
+    _empty = ""
+    _writer_class = BaseSequentialTextIOWriter
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "w",
+            num_partitions: int = 16,
+            key: Optional[Callable[[AnyStr], Any]] = None,
+            chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
+            delimiter: str = "\n",
+            verbose: bool = True,
+            max_open_files: int = 64,
+            buffer_size: int = 1 << 16,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            **open_kwargs
+    ):
+        """
+        Writes lines into a fixed number of chunk files, routing each line by the stable hash of its key modulo the
+        number of partitions. Thus, all lines with the same key end up in the same chunk file, whose chunk index is
+        the partition. The result is a regular chunked file, readable with the sequential reader and list_chunks.
+
+        Each partition is written by a sequential writer, whose chunker never rolls over. Lines are buffered per
+        partition and handed to the partition writers in batches. At most max_open_files partition writers keep their
+        chunk file open, the least recently used one is suspended when another one needs to write. Compressed chunk
+        files are compressed on close.
+
+        :param file_path: base file path
+        :param mode: write mode, text or binary
+        :param num_partitions: number of partitions, i.e. chunk files
+        :param key: callable returning the partition key of a line (including its delimiter), defaults to the line
+        :param chunk_format: chunk format deciding the chunk file paths
+        :param delimiter: delimiter that indicates a line break
+        :param verbose: warns about operations, which might not behave as expected
+        :param max_open_files: maximal number of simultaneously open chunk files
+        :param buffer_size: number of characters (or bytes) buffered per partition before they are written
+        :param write_manifest: writes a manifest of all chunks on close
+        :param compression_workers: number of threads closing (and compressing) chunk files on close, defaults to the
+            number of cpus
+        :param compresslevel: optional compression level, else the default of the codec
+        """
+        check_mode(mode, self._accepted_mode)
+        assert "w" in mode, f"Provided mode '{mode}' should write, hash partitions can not be appended to"
+        assert num_partitions > 0, "Number of partitions should be a positive integer!"
+        assert max_open_files > 0, "Number of open files should be a positive integer!"
+
+        self.file_path = file_path
+        self._mode = mode
+        self.num_partitions = num_partitions
+        self.key = key
+        self.chunk_format = chunk_format
+        self._delimiter = delimiter
+        self.verbose = verbose
+        self.max_open_files = max_open_files
+        self.buffer_size = buffer_size
+        self.compression_workers = os.cpu_count() if compression_workers is None else compression_workers
+        self.compresslevel = compresslevel
+
+        self.open_args = open_args
+        self.open_kwargs = open_kwargs
+
+        # Stale metadata would hide or misplace the chunks written now, thus remove it until this writer is closed
+        self._manifest_path = self.chunk_format.manifest_path(self.file_path)
+        for _metadata_path in [self._manifest_path, self.chunk_format.line_index_path(self.file_path)]:
+            if _metadata_path is not None and os.path.isfile(_metadata_path):
+                os.remove(_metadata_path)
+        self.write_manifest = write_manifest and self._manifest_path is not None
+
+        self._writers: List[Optional[BaseSequentialTextIOWriter]] = [None] * num_partitions
+        self._open_partitions: "OrderedDict[int, None]" = OrderedDict()  # Writers with an open chunk file, by use
+        self._buffers: List[List[AnyStr]] = [[] for _ in range(num_partitions)]
+        self._buffer_sizes = [0] * num_partitions
+        self._current_line: List[AnyStr] = []
+        self._closed = False
+
+    def partition(self, line: AnyStr) -> int:
+        """
+        Partition of a line, i.e. the chunk index it is written to.
+
+        :param line: line including its delimiter
+        :return: partition
+        """
+        _key = line if self.key is None else self.key(line)
+        return stable_hash(_key) % self.num_partitions
+
+    def _open_partition_writer(self, partition: int) -> BaseSequentialTextIOWriter:
+        if partition in self._open_partitions:
+            self._open_partitions.move_to_end(partition)
+            return self._writers[partition]
+        if len(self._open_partitions) >= self.max_open_files:
+            _evicted_partition, _ = self._open_partitions.popitem(last=False)
+            self._writers[_evicted_partition].suspend()
+        if self._writers[partition] is None:
+            # Manifests of single partitions are merged on close, compression happens while closing concurrently
+            self._writers[partition] = self._writer_class(self.file_path,
+                                                          *self.open_args,
+                                                          mode=self._mode,
+                                                          chunk_format=self.chunk_format,
+                                                          chunker=FixedIndexSequentialChunker(partition),
+                                                          delimiter=self._delimiter,
+                                                          verbose=self.verbose,
+                                                          write_manifest=False,
+                                                          compression_workers=0,
+                                                          compresslevel=self.compresslevel,
+                                                          **self.open_kwargs)
+        self._open_partitions[partition] = None
+        return self._writers[partition]
+
+    def _flush_partition(self, partition: int):
+        if not self._buffers[partition]:
+            return
+        self._open_partition_writer(partition).writelines(self._buffers[partition])
+        self._buffers[partition] = []
+        self._buffer_sizes[partition] = 0
+
+    def _write_line(self, line: AnyStr):
+        partition = self.partition(line)
+        self._buffers[partition].append(line)
+        self._buffer_sizes[partition] += len(line)
+        if self._buffer_sizes[partition] >= self.buffer_size:
+            self._flush_partition(partition)
+
+    def _write_line_parts(self, line_parts: Iterable[AnyStr]):
+        for line_part in line_parts:
+            if not line_part.endswith(self._delimiter):
+                self._current_line.append(line_part)
+            elif self._current_line:
+                self._current_line.append(line_part)
+                self._write_line(self._empty.join(self._current_line))
+                self._current_line = []
+            else:
+                self._write_line(line_part)
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def name(self) -> str:
+        return self.file_path
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> TextIO:
+        return self
+
+    def close(self) -> None:
+        if self._closed:
+            return None
+        self._closed = True
+        _last_line = self._empty.join(self._current_line)
+        if _last_line:  # A trailing line without delimiter still counts as a line
+            self._write_line(_last_line)
+            self._current_line = []
+        try:
+            for partition in range(self.num_partitions):
+                self._flush_partition(partition)
+                if self._writers[partition] is None:  # Every partition has its chunk file, thus index equals partition
+                    self._open_partition_writer(partition)
+        finally:
+            # Closing publishes (and compresses) the chunk files, concurrently across partitions
+            self._close_partition_writers()
+
+        if self.write_manifest:
+            manifest = ChunkManifest()
+            for writer in self._writers:
+                for entry in writer.manifest.entries:
+                    manifest.append(index=entry.index, file_name=entry.file_name, lines=entry.lines, bytes=entry.bytes)
+            manifest.write(self._manifest_path)
+
+    def _close_partition_writers(self):
+        writers = [writer for writer in self._writers if writer is not None]
+        self._open_partitions.clear()
+        if self.compression_workers <= 0:
+            for writer in writers:
+                writer.close()
+            return
+        with ThreadPoolExecutor(max_workers=self.compression_workers) as executor:
+            futures = [executor.submit(writer.close) for writer in writers]
+            for future in futures:
+                future.result()  # Raises errors of closing, e.g. of the compression
+
+    def fileno(self) -> int:
+        raise NotImplementedError("Partitioned files have several file descriptors!")
+
+    def flush(self) -> None:
+        """
+        Writes all buffered lines and flushes the open chunk files. An incomplete last line stays buffered.
+        """
+        for partition in range(self.num_partitions):
+            self._flush_partition(partition)
+        for partition in self._open_partitions:
+            self._writers[partition].flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def read(self, __n: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readable(self) -> bool:
+        return False
+
+    def readline(self, __limit: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readlines(self, __hint: int = -1) -> list[AnyStr]:
+        raise NotImplementedError
+
+    def seek(self, __offset: int, __whence: int = 0) -> int:
+        raise NotImplementedError
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise NotImplementedError
+
+    def truncate(self, __size: int | None = None) -> int:
+        raise NotImplementedError
+
+    def writable(self) -> bool:
+        return not self._closed
+
+    def write(self, __s: AnyStr) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        for _, lines in iter_parse_lines(__s, delimiter=self._delimiter):
+            self._write_line_parts(lines)
+        return len(__s)
+
+    def writelines(self, __lines: Iterable[AnyStr]) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        self._write_line_parts(__lines)
+        return None
+
+    def __next__(self) -> AnyStr:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[AnyStr]:
+        return self
+
+    def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
+                 __traceback: TracebackType | None) -> None:
+        self.close()
+
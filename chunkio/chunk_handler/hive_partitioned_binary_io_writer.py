@@ -0,0 +1,50 @@
+import typing
+
+from typing import Any, Callable, Optional
+
+from chunkio.chunk_handler.format import HivePartitionedChunkFormat
+from chunkio.chunk_handler.chunker import SequentialChunker, MaxLineSequentialChunker
+from .base_sequential_binary_io_writer import BaseSequentialBinaryIOWriter
+from .hive_partitioned_text_io_writer import HivePartitionedTextIOWriter
+
+
+class HivePartitionedBinaryIOWriter(HivePartitionedTextIOWriter, typing.BinaryIO):
+    """
+    Byte oriented counterpart of the HivePartitionedTextIOWriter. Writes bytes to chunk files opened in binary mode,
+    thus the partition callable receives bytes. Delimiter and chunker need to operate on bytes.
+    """
+    _accepted_mode = "wab"
+    _empty = b""
+    _writer_class = BaseSequentialBinaryIOWriter
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "wb",
+            partition_format: HivePartitionedChunkFormat,
+            partition: Callable[[bytes], Any],
+            chunker: SequentialChunker = MaxLineSequentialChunker(max_lines=1_000, delimiter=b"\n"),
+            delimiter: bytes = b"\n",
+            verbose: bool = True,
+            buffer_size: int = 1 << 16,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            **open_kwargs
+    ):
+        assert "b" in mode, f"Provided mode '{mode}' is not a binary mode"
+        assert isinstance(delimiter, bytes), "Delimiter should be bytes in binary mode!"
+        super().__init__(file_path,
+                         *open_args,
+                         mode=mode,
+                         partition_format=partition_format,
+                         partition=partition,
+                         chunker=chunker,
+                         delimiter=delimiter,
+                         verbose=verbose,
+                         buffer_size=buffer_size,
+                         write_manifest=write_manifest,
+                         compression_workers=compression_workers,
+                         compresslevel=compresslevel,
+                         **open_kwargs)
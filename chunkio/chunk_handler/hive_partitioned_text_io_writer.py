@@ -0,0 +1,219 @@
+import copy
+import os
+import typing
+
+from types import TracebackType
+from typing import Any, AnyStr, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Type
+
+from chunkio.chunk_handler.format import HivePartitionedChunkFormat
+from chunkio.chunk_handler.chunker import SequentialChunker, MaxLineSequentialChunker
+from .base_sequential_text_io_writer import BaseSequentialTextIOWriter
+from .utils import check_mode, iter_parse_lines
+
+
+class HivePartitionedTextIOWriter(typing.TextIO):
+    _accepted_mode = "wat"
+    _empty = ""
+    _writer_class = BaseSequentialTextIOWriter
+
+    def __init__(
+            self,
+            file_path: str,
+            *open_args,
+            mode: str = "w",
+            partition_format: HivePartitionedChunkFormat,
+            partition: Callable[[AnyStr], Any],
+            chunker: SequentialChunker = MaxLineSequentialChunker(max_lines=1_000),
+            delimiter: str = "\n",
+            verbose: bool = True,
+            buffer_size: int = 1 << 16,
+            write_manifest: bool = True,
+            compression_workers: Optional[int] = None,
+            compresslevel: Optional[int] = None,
+            **open_kwargs
+    ):
+        """
+        Writes lines into Hive style partitions, e.g. 'date=2026-10-18', where the partition value is derived from each
+        line. Every partition is a chunked file of its own, written by a sequential writer with its own copy of the
+        chunker. Lines are buffered per partition and handed to the partition writers in batches. Partitions which
+        are not written to are left untouched. In append mode, existing partitions continue after their last chunk.
+
+        :param file_path: base file path
+        :param mode: write or append mode, text or binary
+        :param partition_format: Hive partitioned chunk format deciding the partition and chunk file paths
+        :param partition: callable returning the partition value of a line (including its delimiter)
+        :param chunker: sequential chunker deciding the chunk index of each line within a partition
+        :param delimiter: delimiter that indicates a line break
+        :param verbose: warns about operations, which might not behave as expected
+        :param buffer_size: number of characters (or bytes) buffered per partition before they are written
+        :param write_manifest: writes a manifest of the chunks of each partition on close
+        :param compression_workers: number of threads compressing chunk files per partition
+        :param compresslevel: optional compression level, else the default of the codec
+        """
+        check_mode(mode, self._accepted_mode)
+        assert "w" in mode or "a" in mode, f"Provided mode '{mode}' should either write or append"
+        assert isinstance(partition_format, HivePartitionedChunkFormat), "Partition format should be Hive partitioned!"
+
+        self.file_path = file_path
+        self._mode = mode
+        self.partition_format = partition_format
+        self.partition = partition
+        self.chunker = chunker
+        self._delimiter = delimiter
+        self.verbose = verbose
+        self.buffer_size = buffer_size
+        self.write_manifest = write_manifest
+        self.compression_workers = compression_workers
+        self.compresslevel = compresslevel
+
+        self.open_args = open_args
+        self.open_kwargs = open_kwargs
+
+        self._writers: Dict[str, BaseSequentialTextIOWriter] = dict()
+        self._buffers: Dict[str, List[AnyStr]] = dict()
+        self._buffer_sizes: Dict[str, int] = dict()
+        self._current_line: List[AnyStr] = []
+        self._closed = False
+
+    def _open_partition_writer(self, value: str) -> BaseSequentialTextIOWriter:
+        writer = self._writers.get(value)
+        if writer is None:
+            partition_path = self.partition_format.partition_path(self.file_path, value)
+            os.makedirs(os.path.dirname(partition_path), exist_ok=True)
+            writer = self._writer_class(partition_path,
+                                        *self.open_args,
+                                        mode=self._mode,
+                                        chunk_format=self.partition_format.partition_chunk_format(),
+                                        chunker=copy.deepcopy(self.chunker),
+                                        delimiter=self._delimiter,
+                                        verbose=self.verbose,
+                                        write_manifest=self.write_manifest,
+                                        compression_workers=self.compression_workers,
+                                        compresslevel=self.compresslevel,
+                                        **self.open_kwargs)
+            self._writers[value] = writer
+        return writer
+
+    def _flush_partition(self, value: str):
+        if not self._buffers.get(value):
+            return
+        self._open_partition_writer(value).writelines(self._buffers[value])
+        self._buffers[value] = []
+        self._buffer_sizes[value] = 0
+
+    def _write_line(self, line: AnyStr):
+        value = self.partition(line)
+        value = value.decode("utf-8") if isinstance(value, bytes) else str(value)
+        if value not in self._buffers:
+            self._buffers[value] = []
+            self._buffer_sizes[value] = 0
+        self._buffers[value].append(line)
+        self._buffer_sizes[value] += len(line)
+        if self._buffer_sizes[value] >= self.buffer_size:
+            self._flush_partition(value)
+
+    def _write_line_parts(self, line_parts: Iterable[AnyStr]):
+        for line_part in line_parts:
+            if not line_part.endswith(self._delimiter):
+                self._current_line.append(line_part)
+            elif self._current_line:
+                self._current_line.append(line_part)
+                self._write_line(self._empty.join(self._current_line))
+                self._current_line = []
+            else:
+                self._write_line(line_part)
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def name(self) -> str:
+        return self.file_path
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self) -> TextIO:
+        return self
+
+    def close(self) -> None:
+        if self._closed:
+            return None
+        self._closed = True
+        _last_line = self._empty.join(self._current_line)
+        if _last_line:  # A trailing line without delimiter still counts as a line
+            self._write_line(_last_line)
+            self._current_line = []
+        try:
+            for value in list(self._buffers):
+                self._flush_partition(value)
+        finally:
+            for writer in self._writers.values():
+                writer.close()
+
+    def fileno(self) -> int:
+        raise NotImplementedError("Partitioned files have several file descriptors!")
+
+    def flush(self) -> None:
+        """
+        Writes all buffered lines to the partition writers and flushes them. An incomplete last line stays buffered.
+        """
+        for value in list(self._buffers):
+            self._flush_partition(value)
+        for writer in self._writers.values():
+            writer.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def read(self, __n: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readable(self) -> bool:
+        return False
+
+    def readline(self, __limit: int = -1) -> AnyStr:
+        raise NotImplementedError
+
+    def readlines(self, __hint: int = -1) -> list[AnyStr]:
+        raise NotImplementedError
+
+    def seek(self, __offset: int, __whence: int = 0) -> int:
+        raise NotImplementedError
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        raise NotImplementedError
+
+    def truncate(self, __size: int | None = None) -> int:
+        raise NotImplementedError
+
+    def writable(self) -> bool:
+        return not self._closed
+
+    def write(self, __s: AnyStr) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        for _, lines in iter_parse_lines(__s, delimiter=self._delimiter):
+            self._write_line_parts(lines)
+        return len(__s)
+
+    def writelines(self, __lines: Iterable[AnyStr]) -> None:
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+        self._write_line_parts(__lines)
+        return None
+
+    def __next__(self) -> AnyStr:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[AnyStr]:
+        return self
+
+    def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
+                 __traceback: TracebackType | None) -> None:
+        self.close()
@@ -0,0 +1,156 @@
+import mmap
+import os
+
+from types import TracebackType
+from typing import Iterator, List, Optional, Tuple, Type, Union
+
+from chunkio.chunk_handler.format import BaseChunkFormat, SubdirNumberedChunkFormat
+from .compression import is_compressed, open_chunk_file
+
+Line = Union[memoryview, bytes]
+
+
+class MmapSequentialBinaryReader:
+    def __init__(
+            self,
+            file_path: str,
+            chunk_format: BaseChunkFormat = SubdirNumberedChunkFormat(),
+            delimiter: bytes = b"\n",
+            copy: bool = False
+    ):
+        """
+        Read-only line scanner, which memory maps one chunk file at a time and yields the lines as memoryviews into
+        the map, i.e. lines are neither copied nor decoded. Each chunk is unmapped as the reader moves on, keeping the
+        memory usage bounded. Compressed chunk files can not be mapped, thus are decompressed into memory instead.
+
+        Referenced lines (memoryviews) keep their chunk mapped, thus keep lines by converting them with bytes, or set
+        copy to yield bytes in the first place.
+
+        :param file_path: base file path
+        :param chunk_format: chunk format deciding the chunk file paths
+        :param delimiter: delimiter that indicates a line break
+        :param copy: yields bytes instead of memoryviews
+        """
+        assert isinstance(delimiter, bytes) and delimiter, "Delimiter should be non-empty bytes!"
+
+        self.file_path = file_path
+        self.chunk_format = chunk_format
+        self._delimiter = delimiter
+        self.copy = copy
+
+        self._current_map: Optional[mmap.mmap] = None
+        self._current_view: Optional[memoryview] = None
+        self._pending_maps: List[mmap.mmap] = []
+        self._closed = False
+
+    @property
+    def name(self) -> str:
+        return self.file_path
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _map_chunk_file(self, chunk_file_path: str) -> Optional[Union[mmap.mmap, bytes]]:
+        if is_compressed(chunk_file_path):
+            with open_chunk_file(chunk_file_path, mode="rb") as file:
+                buffer = file.read()
+        else:
+            with open(chunk_file_path, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    return None  # Empty files can not be mapped
+                buffer = self._current_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+        self._current_view = memoryview(buffer)
+        return buffer
+
+    def _unmap_chunk_file(self):
+        if self._current_view is not None:
+            self._current_view.release()
+        if self._current_map is not None:
+            self._pending_maps.append(self._current_map)
+        self._current_view = None
+        self._current_map = None
+        # The last line of a chunk is typically still referenced while the next chunk is mapped, thus maps which can
+        # not be closed yet are retried on the next chunk, or unmapped once their lines are garbage collected
+        _pending_maps = []
+        for _map in self._pending_maps:
+            try:
+                _map.close()
+            except BufferError:
+                _pending_maps.append(_map)
+        self._pending_maps = _pending_maps
+
+    def _iter_buffers(self) -> Iterator[Tuple[Union[mmap.mmap, bytes], memoryview]]:
+        """
+        Maps the chunk files one after another, unmapping the previous one.
+
+        :return: iterator over (buffer supporting find and rfind, memoryview of the buffer)
+        """
+        try:
+            for chunk_file_path in self.chunk_format.list(self.file_path):
+                if self._closed:
+                    return
+                buffer = self._map_chunk_file(chunk_file_path)
+                if buffer is not None:
+                    yield buffer, self._current_view
+                self._unmap_chunk_file()
+        finally:
+            self._unmap_chunk_file()
+
+    def _line(self, buffer: Union[mmap.mmap, bytes], view: memoryview, start: int, stop: int) -> Line:
+        return buffer[start:stop] if self.copy else view[start:stop]
+
+    def iter_lines(self) -> Iterator[Line]:
+        """
+        Iterates over all lines, including their delimiter. Line breaks are found with find on the mapped chunk.
+
+        :return: iterator over memoryviews (or bytes) of the lines
+        """
+        _delimiter_length = len(self._delimiter)
+        for buffer, view in self._iter_buffers():
+            _find = buffer.find
+            size = len(buffer)
+            start = 0
+            while start < size:
+                stop = _find(self._delimiter, start)
+                stop = size if stop < 0 else stop + _delimiter_length
+                yield self._line(buffer, view, start, stop)
+                start = stop
+
+    def iter_lines_containing(self, needle: bytes) -> Iterator[Line]:
+        """
+        Iterates over the lines containing needle. Instead of testing each line, needle is searched within the whole
+        mapped chunk and only the lines around the matches are located, thus lines without match are skipped at the
+        speed of find.
+
+        :param needle: bytes to search for, without delimiter
+        :return: iterator over memoryviews (or bytes) of the matching lines, including their delimiter
+        """
+        assert needle and self._delimiter not in needle, "Needle should be non-empty and not contain the delimiter!"
+        _delimiter_length = len(self._delimiter)
+        for buffer, view in self._iter_buffers():
+            size = len(buffer)
+            position = buffer.find(needle)
+            while position >= 0:
+                start = buffer.rfind(self._delimiter, 0, position)
+                start = 0 if start < 0 else start + _delimiter_length
+                stop = buffer.find(self._delimiter, position + len(needle))
+                stop = size if stop < 0 else stop + _delimiter_length
+                yield self._line(buffer, view, start, stop)
+                position = buffer.find(needle, stop)
+
+    def close(self) -> None:
+        self._closed = True
+        self._unmap_chunk_file()
+
+    def __iter__(self) -> Iterator[Line]:
+        return self.iter_lines()
+
+    def __enter__(self) -> "MmapSequentialBinaryReader":
+        return self
+
+    def __exit__(self, __t: Type[BaseException] | None, __value: BaseException | None,
+                 __traceback: TracebackType | None) -> None:
+        self.close()
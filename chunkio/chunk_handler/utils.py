@@ -1,20 +1,30 @@
-from typing import List
+import errno
+import os
+
+from typing import AnyStr, Iterator, List, Optional, Tuple
+
+from .compression import open_chunk_file
+
+# Errors of kernel side copies, which are resolved by falling back to buffered copies, e.g. across file systems
+_UNSUPPORTED_COPY_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
 
 
 def check_mode(mode: str, accepted: str) -> bool:
     _mode_set = set(list(mode))
     _accepted_mode_set = set(list(accepted))
+    if len(_mode_set.intersection("rwax")) > 1 or len(_mode_set.intersection("tb")) > 1:
+        raise AssertionError(f"Provided mode '{mode}' combines exclusive modes")
     if not _mode_set.difference(accepted):
         return True
     raise AssertionError(f"Provided mode '{mode}' does conflict with accepted modes: {accepted}")
 
 
-def parse_lines(string: str, delimiter: str = "\n") -> List[str]:
+def parse_lines(string: AnyStr, delimiter: AnyStr = "\n") -> List[AnyStr]:
     """
     Parses string for complete lines and the last incomplete line
 
-    :param string: input text to parse
-    :param delimiter: delimiter that indicates a line break, default '\\n'
+    :param string: input text (or bytes) to parse
+    :param delimiter: delimiter that indicates a line break, default '\\n', needs to match the type of the input
     :return: list of complete lines, incomplete next line
     """
     _splits = string.split(delimiter)
@@ -23,13 +33,91 @@ def parse_lines(string: str, delimiter: str = "\n") -> List[str]:
     return _split_sep
 
 
-def group_into_lines(strings: List[str], delimiter: str = "\n") -> List[List[str]]:
+def iter_blocks(string: AnyStr, delimiter: AnyStr = "\n", block_size: int = 1 << 20) -> Iterator[AnyStr]:
+    """
+    Slices a string into blocks, which end on a delimiter, except for the last one. Blocks are only extended beyond
+    block_size for longer lines. Delimiters are searched in place, i.e. the string is never split into lines.
+
+    :param string: input text (or bytes) to slice
+    :param delimiter: delimiter that indicates a line break, default '\\n', needs to match the type of the input
+    :param block_size: approximate number of characters (or bytes) per block
+    :return: iterator over blocks
+    """
+    _length = len(string)
+    start = 0
+    while start < _length:
+        stop = _length
+        if start + block_size < _length:
+            _cut = string.rfind(delimiter, start, start + block_size)
+            if _cut < start:  # Line longer than block size
+                _cut = string.find(delimiter, start + block_size)
+            if _cut >= 0:
+                stop = _cut + len(delimiter)
+        yield string[start:stop] if start > 0 or stop < _length else string
+        start = stop
+
+
+def iter_parse_lines(string: AnyStr,
+                     delimiter: AnyStr = "\n",
+                     block_size: int = 1 << 20) -> Iterator[Tuple[AnyStr, List[AnyStr]]]:
+    """
+    Parses a string block by block, such that large strings are never split into lines all at once. Blocks end on a
+    delimiter, except for the last one, and are only extended beyond block_size for longer lines. In contrast to
+    parse_lines no empty trailing line is produced.
+
+    :param string: input text (or bytes) to parse
+    :param delimiter: delimiter that indicates a line break, default '\\n', needs to match the type of the input
+    :param block_size: approximate number of characters (or bytes) per block
+    :return: iterator over (block, lines of the block)
+    """
+    for block in iter_blocks(string, delimiter=delimiter, block_size=block_size):
+        lines = parse_lines(block, delimiter=delimiter)
+        if not lines[-1]:
+            lines.pop()
+        yield block, lines
+
+
+def find_nth(string: AnyStr, delimiter: AnyStr, n: int, start: int = 0) -> int:
+    """
+    Offset after the n-th delimiter from start on, as str.find would return n times in a row. Single character
+    delimiters are counted in growing windows first, thus long ranges are skipped at the speed of str.count.
+
+    :param string: input text (or bytes) to search
+    :param delimiter: delimiter that indicates a line break, needs to match the type of the input
+    :param n: number of delimiters, positive
+    :param start: offset to start searching from
+    :return: offset after the n-th delimiter, -1 if there are fewer delimiters
+    """
+    assert n > 0, "n should be a positive integer!"
+    _length = len(string)
+    if len(delimiter) == 1:  # Longer delimiters might span two windows
+        window = 1 << 12
+        while n > 64 and start < _length:
+            stop = min(start + window, _length)
+            count = string.count(delimiter, start, stop)
+            if count < n:
+                n -= count
+                start = stop
+                window *= 2
+            elif window > 1 << 12:
+                window //= 2
+            else:
+                break
+    for _ in range(n):
+        position = string.find(delimiter, start)
+        if position < 0:
+            return -1
+        start = position + len(delimiter)
+    return start
+
+
+def group_into_lines(strings: List[AnyStr], delimiter: AnyStr = "\n") -> List[List[AnyStr]]:
     """
     Groups writes into lines according to provided delimiter. E.g. ['fir', 'st\n', 'l', 'i', 'n', 'e\n'] should yield
     [['fir', 'st\n'], ['l', 'i', 'n', 'e\n']]
 
-    :param strings: list of strings to group
-    :param delimiter: string that indicates a line break
+    :param strings: list of strings (or bytes) to group
+    :param delimiter: string (or bytes) that indicates a line break
     :return: list of grouped strings
     """
     _grouped_lines = [[]]
@@ -41,3 +129,86 @@ def group_into_lines(strings: List[str], delimiter: str = "\n") -> List[List[str
         return _grouped_lines[:-1]
     else:
         return _grouped_lines
+
+
+def count_lines(file_path: str, delimiter: bytes = b"\n", block_size: int = 1 << 20) -> int:
+    """
+    Counts lines of a file by counting delimiters in large binary blocks, i.e. without decoding or splitting lines.
+    A trailing line without delimiter counts as a line, as it does when iterating the file. Compressed chunk files
+    are decompressed on the fly.
+
+    :param file_path: path to the file
+    :param delimiter: single byte that indicates a line break, default b'\\n'
+    :param block_size: number of bytes read at once
+    :return: number of lines
+    """
+    lines = 0
+    last_block = b""
+    with open_chunk_file(file_path, mode="rb") as file:
+        block = file.read(block_size)
+        while block:
+            lines += block.count(delimiter)
+            last_block = block
+            block = file.read(block_size)
+    if last_block and not last_block.endswith(delimiter):
+        lines += 1
+    return lines
+
+
+def copy_range(source_fd: int,
+               target_fd: int,
+               offset: int,
+               size: int,
+               target_offset: Optional[int] = None,
+               block_size: int = 1 << 20) -> int:
+    """
+    Copies a byte range between two files, within the kernel if possible, i.e. with os.copy_file_range or os.sendfile,
+    else with buffered reads and writes.
+
+    :param source_fd: file descriptor of the source, opened for reading
+    :param target_fd: file descriptor of the target, opened for writing
+    :param offset: byte offset within the source
+    :param size: number of bytes to copy
+    :param target_offset: byte offset within the target, else writes at the current position of the target
+    :param block_size: number of bytes copied at once by the buffered fallback
+    :return: number of bytes copied, less than size only if the source ends before
+    """
+    copied = 0
+
+    def _target_offset() -> Optional[int]:
+        return None if target_offset is None else target_offset + copied
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            while copied < size:
+                _copied = os.copy_file_range(source_fd, target_fd, size - copied, offset + copied, _target_offset())
+                if not _copied:
+                    return copied
+                copied += _copied
+            return copied
+        except OSError as error:
+            if error.errno not in _UNSUPPORTED_COPY_ERRNOS:
+                raise
+    if hasattr(os, "sendfile") and target_offset is None:
+        try:
+            while copied < size:
+                _copied = os.sendfile(target_fd, source_fd, offset + copied, size - copied)
+                if not _copied:
+                    return copied
+                copied += _copied
+            return copied
+        except OSError as error:
+            if error.errno not in _UNSUPPORTED_COPY_ERRNOS:
+                raise
+    if target_offset is not None:
+        os.lseek(target_fd, target_offset + copied, os.SEEK_SET)
+    os.lseek(source_fd, offset + copied, os.SEEK_SET)
+    while copied < size:
+        block = os.read(source_fd, min(block_size, size - copied))
+        if not block:
+            break
+        view = memoryview(block)
+        while view:
+            view = view[os.write(target_fd, view):]
+        copied += len(block)
+    return copied
@@ -0,0 +1,119 @@
+import io
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import BinaryIO, Optional
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from chunkio.chunk_handler.compression import is_compressed, open_chunk_file
+from chunkio.chunk_handler.utils import copy_range
+
+
+def _copy_chunk(chunk_file_path: str, target: BinaryIO, target_fd: Optional[int], block_size: int) -> int:
+    """
+    Copies a chunk file to the current position of the target, within the kernel if the chunk file is not compressed
+    and the target has a file descriptor.
+
+    :return: number of bytes copied
+    """
+    if target_fd is not None and not is_compressed(chunk_file_path):
+        with open(chunk_file_path, "rb") as source:
+            return copy_range(source.fileno(), target_fd, 0, os.fstat(source.fileno()).st_size, block_size=block_size)
+    size = 0
+    with open_chunk_file(chunk_file_path, "rb") as source:
+        block = source.read(block_size)
+        while block:
+            target.write(block)
+            size += len(block)
+            block = source.read(block_size)
+    if target_fd is not None:
+        target.flush()  # Subsequent kernel side copies bypass the buffer of the target
+    return size
+
+
+def to_fileobj(file_path: str,
+               fileobj: BinaryIO,
+               keep_extension: bool = True,
+               index_format: str = "06d",
+               block_size: int = 1 << 20) -> int:
+    """
+    Writes the content of all chunks to a binary file object, in the order of the chunk listing. Chunks are copied
+    within the kernel where possible, i.e. if the file object has a file descriptor, else with buffered reads and
+    writes. Compressed chunks are decompressed.
+
+    :param file_path: base file path of the chunked file
+    :param fileobj: binary file object, e.g. an opened file, a pipe or io.BytesIO
+    :param keep_extension: keeps the file extension for the chunk directory, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param block_size: number of bytes copied at once by buffered copies
+    :return: number of bytes written
+    """
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
+    try:
+        target_fd = fileobj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        target_fd = None
+    if target_fd is not None:
+        fileobj.flush()
+
+    size = 0
+    for chunk_file_path in chunk_format.list(file_path):
+        size += _copy_chunk(chunk_file_path, fileobj, target_fd, block_size)
+
+    if target_fd is not None and fileobj.seekable():
+        fileobj.seek(os.lseek(target_fd, 0, os.SEEK_CUR))  # Synchronizes the position after kernel side copies
+    return size
+
+
+def _copy_chunk_to(chunk_file_path: str, target_file_path: str, offset: int, size: int, block_size: int) -> int:
+    with open(target_file_path, "r+b") as target:
+        target.seek(offset)
+        if _copy_chunk(chunk_file_path, target, target.fileno(), block_size) != size:
+            raise ValueError(f"Manifest is outdated for {chunk_file_path}")
+    return size
+
+
+def concat(file_path: str,
+           target_file_path: str,
+           keep_extension: bool = True,
+           index_format: str = "06d",
+           *,
+           processes: Optional[int] = 1,
+           block_size: int = 1 << 20) -> int:
+    """
+    Concatenates all chunks into a single file, in the order of the chunk listing. Chunks are copied within the kernel
+    where possible, e.g. with os.copy_file_range, compressed chunks are decompressed. The target file only appears
+    once it is complete.
+
+    With several processes, the chunks are copied concurrently by threads, each one to the offset of its chunk within
+    the target file. Offsets are computed from the chunk sizes of the manifest if present, else from the file system.
+    Without manifest, compressed chunks are thus decompressed twice, once to determine their size and once to copy
+    them. A single process copies them in one pass.
+
+    :param file_path: base file path of the chunked file
+    :param target_file_path: path of the concatenated file
+    :param keep_extension: keeps the file extension for the chunk directory, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param processes: number of threads copying chunks concurrently, None defaults to the number of cpus
+    :param block_size: number of bytes copied at once by buffered copies
+    :return: number of bytes written
+    """
+    staging_path = target_file_path + ".tmp"
+    if processes == 1:
+        with open(staging_path, "wb") as target:
+            size = to_fileobj(file_path, target, keep_extension, index_format, block_size=block_size)
+        os.replace(staging_path, target_file_path)
+        return size
+
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
+    chunk_files = list(chunk_format.list(file_path))
+    chunk_offsets = list(accumulate(chunk_format.chunk_sizes(file_path, chunk_files), initial=0))
+    with open(staging_path, "wb") as target:
+        target.truncate(chunk_offsets[-1])
+    with ThreadPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        futures = [executor.submit(_copy_chunk_to, chunk_file_path, staging_path, start, stop - start, block_size)
+                   for chunk_file_path, start, stop in zip(chunk_files, chunk_offsets, chunk_offsets[1:])]
+        size = sum(future.result() for future in futures)
+    os.replace(staging_path, target_file_path)
+    return size
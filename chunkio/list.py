@@ -1,10 +1,25 @@
-from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from typing import Callable, Collection, Optional, Union
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat, HivePartitionedChunkFormat
 
 
 def list_chunks(file_path: str,
                 keep_extension: bool = True,
                 index_format: str = "06d",
                 return_index: bool = False,
-                *_, **__):
-    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
+                *_,
+                partition_by: Optional[str] = None,
+                partition_filter: Optional[Union[Callable[[str], bool], Collection[str]]] = None,
+                cache_listing: bool = False,
+                **__):
+    if partition_by:
+        chunk_format = HivePartitionedChunkFormat(partition_key=partition_by,
+                                                  partition_filter=partition_filter,
+                                                  index_format=index_format,
+                                                  keep_extension=keep_extension,
+                                                  cache_listing=cache_listing)
+        return chunk_format.list(file_path, return_index=return_index)
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format,
+                                             keep_extension=keep_extension,
+                                             cache_listing=cache_listing)
     return chunk_format.list(file_path, return_index=return_index)
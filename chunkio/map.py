@@ -0,0 +1,85 @@
+import multiprocessing
+
+from typing import Any, Callable, IO, Iterator, List, Optional, Tuple
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from chunkio.chunk_handler.compression import open_chunk_file
+
+
+def _apply(task: Tuple[Callable[[IO], Any], str, str, Optional[str], dict]) -> Any:
+    """
+    Applies the function to a single chunk file. Runs inside the worker processes, thus has to be importable.
+
+    :param task: (function, chunk file path, mode, output chunk file path, open kwargs)
+    :return: result of the function, or the output chunk file path if an output is written
+    """
+    function, chunk_file_path, mode, output_file_path, open_kwargs = task
+    with open_chunk_file(chunk_file_path, mode, **open_kwargs) as file:
+        result = function(file)
+        if output_file_path is None:
+            return result
+        # Write while the input is still open, since the result might lazily iterate over it
+        with open_chunk_file(output_file_path, mode.replace("r", "w"), **open_kwargs) as output_file:
+            if isinstance(result, (str, bytes)):
+                output_file.write(result)
+            elif result is not None:
+                output_file.writelines(result)
+    return output_file_path
+
+
+def imap(file_path: str,
+         function: Callable[[IO], Any],
+         processes: Optional[int] = None,
+         ordered: bool = True,
+         output_file_path: Optional[str] = None,
+         mode: str = "r",
+         keep_extension: bool = True,
+         index_format: str = "06d",
+         **open_kwargs) -> Iterator[Any]:
+    """
+    Applies a function to every chunk of a chunked file on a process pool, dispatching one chunk per task.
+    The function receives the opened chunk file and has to be picklable, e.g. defined on module level.
+
+    If an output file path is provided, the result of each function call (a string or an iterable of lines) is
+    written to a new chunked file, keeping the chunk index of the input chunk. In this case the output chunk file
+    paths are yielded instead of the results.
+
+    :param file_path: path to the chunked base file
+    :param function: callable receiving an opened chunk file
+    :param processes: number of worker processes, defaults to the number of cpus
+    :param ordered: if true results are yielded in chunk order, else as soon as they are ready
+    :param output_file_path: optional base file path of a chunked file receiving the per chunk results
+    :param mode: mode used to open the chunk files, either text or binary reading
+    :param keep_extension: keeps the file extension for the chunk directories, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param open_kwargs: further keyword arguments passed to open, e.g. encoding
+    :return: iterator over the results
+    """
+    assert "r" in mode and not set(mode).difference("rtb"), f"Provided mode '{mode}' does not support reading"
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
+
+    tasks: List[Tuple[Callable[[IO], Any], str, str, Optional[str], dict]] = []
+    for chunk_file_path, index in chunk_format.list(file_path, return_index=True):
+        # Format output paths here, since it might create the chunk directory
+        output_chunk_file_path = None
+        if output_file_path is not None:
+            output_chunk_file_path = chunk_format.format(output_file_path, index)
+        tasks.append((function, chunk_file_path, mode, output_chunk_file_path, open_kwargs))
+
+    with multiprocessing.Pool(processes) as pool:
+        if ordered:
+            yield from pool.imap(_apply, tasks, chunksize=1)
+        else:
+            yield from pool.imap_unordered(_apply, tasks, chunksize=1)
+
+
+def map(file_path: str,
+        function: Callable[[IO], Any],
+        processes: Optional[int] = None,
+        ordered: bool = True,
+        output_file_path: Optional[str] = None,
+        *args, **kwargs) -> List[Any]:
+    """
+    Same as imap, but collects all results into a list.
+    """
+    return list(imap(file_path, function, processes, ordered, output_file_path, *args, **kwargs))
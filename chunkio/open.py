@@ -1,8 +1,14 @@
 import builtins
+import locale
 
-from typing import Optional
+from typing import Any, Callable, Collection, Optional, Union
 
 from chunkio.chunk_handler import BaseSequentialTextIOReader, SubdirNumberedChunkFormat, BaseSequentialTextIOWriter, MaxLineSequentialChunker
+from chunkio.chunk_handler import MaxByteSequentialChunker
+from chunkio.chunk_handler import BaseSequentialBinaryIOReader, BaseSequentialBinaryIOWriter
+from chunkio.chunk_handler import BackgroundSequentialIOWriter
+from chunkio.chunk_handler import HashPartitionedTextIOWriter, HashPartitionedBinaryIOWriter
+from chunkio.chunk_handler import HivePartitionedChunkFormat, HivePartitionedTextIOWriter, HivePartitionedBinaryIOWriter
 
 
 def open(file_path: str,
@@ -11,24 +17,99 @@ def open(file_path: str,
          keep_extension: bool = True,
          index_format: str = "06d",
          verbose: bool = True,
-         *args, **kwargs):
-    _delimiter = "\n"
-    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
-    if "r" in mode:
-        return BaseSequentialTextIOReader(file_path,
-                                          mode=mode,
-                                          chunk_format=chunk_format,
-                                          verbose=verbose,
-                                          *args,
-                                          **kwargs)
-    elif "w" in mode and max_lines:
+         *args,
+         max_bytes: Optional[int] = None,
+         prefetch: int = 0,
+         follow: bool = False,
+         compression: Optional[str] = None,
+         compression_workers: Optional[int] = None,
+         compresslevel: Optional[int] = None,
+         background: int = 0,
+         concurrent: bool = False,
+         num_partitions: Optional[int] = None,
+         partition_key: Optional[Callable[[Any], Any]] = None,
+         partition_by: Optional[str] = None,
+         partition_value: Optional[Callable[[Any], Any]] = None,
+         partition_filter: Optional[Union[Callable[[str], bool], Collection[str]]] = None,
+         cache_listing: bool = False,
+         **kwargs):
+    binary = "b" in mode
+    _delimiter = b"\n" if binary else "\n"
+    if partition_by:
+        chunk_format = HivePartitionedChunkFormat(partition_key=partition_by,
+                                                  partition_filter=partition_filter,
+                                                  index_format=index_format,
+                                                  keep_extension=keep_extension,
+                                                  compression=compression,
+                                                  cache_listing=cache_listing)
+    else:
+        chunk_format = SubdirNumberedChunkFormat(index_format=index_format,
+                                                 keep_extension=keep_extension,
+                                                 compression=compression,
+                                                 cache_listing=cache_listing)
+    chunker = None
+    if max_bytes:
+        chunker = MaxByteSequentialChunker(max_bytes=max_bytes,
+                                           max_lines=max_lines,
+                                           delimiter=_delimiter,
+                                           encoding=kwargs.get("encoding") or locale.getpreferredencoding(False),
+                                           newline=kwargs.get("newline"))
+    elif max_lines:
         chunker = MaxLineSequentialChunker(max_lines=max_lines, delimiter=_delimiter)
-        return BaseSequentialTextIOWriter(file_path,
-                                          mode=mode,
-                                          chunk_format=chunk_format,
-                                          chunker=chunker,
-                                          verbose=verbose,
-                                          delimiter=_delimiter,
-                                          *args, **kwargs)
+    if "r" in mode:
+        reader_class = BaseSequentialBinaryIOReader if binary else BaseSequentialTextIOReader
+        return reader_class(file_path,
+                            mode=mode,
+                            chunk_format=chunk_format,
+                            verbose=verbose,
+                            prefetch=prefetch,
+                            follow=follow,
+                            *args,
+                            **kwargs)
+    elif ("w" in mode or "a" in mode) and partition_by:
+        # Hash partitions route lines by partition_key, Hive partitions name their directories by partition_value
+        assert partition_value is not None, \
+            "Hive partitioning requires a partition_value deriving the value of each line!"
+        assert partition_key is None, "Hash partitioning by partition_key can not be combined with partition_by!"
+        writer_class = HivePartitionedBinaryIOWriter if binary else HivePartitionedTextIOWriter
+        if chunker is not None:
+            kwargs["chunker"] = chunker
+        return writer_class(file_path,
+                            mode=mode,
+                            partition_format=chunk_format,
+                            partition=partition_value,
+                            delimiter=_delimiter,
+                            verbose=verbose,
+                            compression_workers=compression_workers,
+                            compresslevel=compresslevel,
+                            *args, **kwargs)
+    elif ("w" in mode or "a" in mode) and num_partitions:
+        assert "a" not in mode, "Hash partitions can not be appended to, open them in write mode!"
+        writer_class = HashPartitionedBinaryIOWriter if binary else HashPartitionedTextIOWriter
+        return writer_class(file_path,
+                            mode=mode,
+                            num_partitions=num_partitions,
+                            key=partition_key,
+                            chunk_format=chunk_format,
+                            delimiter=_delimiter,
+                            verbose=verbose,
+                            compression_workers=compression_workers,
+                            compresslevel=compresslevel,
+                            *args, **kwargs)
+    elif ("w" in mode or "a" in mode) and chunker is not None:
+        writer_class = BaseSequentialBinaryIOWriter if binary else BaseSequentialTextIOWriter
+        writer = writer_class(file_path,
+                              mode=mode,
+                              chunk_format=chunk_format,
+                              chunker=chunker,
+                              verbose=verbose,
+                              delimiter=_delimiter,
+                              compression_workers=compression_workers,
+                              compresslevel=compresslevel,
+                              concurrent=concurrent,
+                              *args, **kwargs)
+        if background:
+            return BackgroundSequentialIOWriter(writer, max_queue_size=background)
+        return writer
     else:
         return builtins.open(file_path, *args, **kwargs)
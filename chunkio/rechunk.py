@@ -0,0 +1,206 @@
+import bisect
+import os
+import shutil
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import List, Optional, Tuple
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat, BaseSequentialBinaryIOReader
+from chunkio.chunk_handler.format import ChunkManifest
+from chunkio.chunk_handler.compression import compress_file, is_compressed, open_chunk_file, split_compression_extension
+from chunkio.chunk_handler.utils import copy_range, count_lines
+from .split import byte_boundaries, find_delimiters
+
+_DELIMITER = b"\n"
+
+# (source chunk, start, stop) within the uncompressed source chunk
+Segment = Tuple[int, int, int]
+
+
+def _segments(chunk_offsets: List[int], start: int, stop: int) -> List[Segment]:
+    """
+    Byte ranges of the source chunks making up the range start to stop of their concatenation.
+    """
+    segments = []
+    chunk = bisect.bisect_right(chunk_offsets, start) - 1
+    while start < stop:
+        _stop = min(stop, chunk_offsets[chunk + 1])
+        if _stop > start:
+            segments.append((chunk, start - chunk_offsets[chunk], _stop - chunk_offsets[chunk]))
+        start = _stop
+        chunk += 1
+    return segments
+
+
+def _line_boundaries(chunk_files: List[str],
+                     chunk_offsets: List[int],
+                     line_counts: List[int],
+                     ordinals: List[int],
+                     block_size: int,
+                     line_complete: bool = True) -> List[int]:
+    """
+    Offsets after the lines with the given ascending ordinals within the concatenation of the chunks. The per chunk
+    delimiter counts tell the chunk containing each boundary, thus only those chunks are searched. If the last line
+    is incomplete, the last chunk does not end with a delimiter, thus it is always searched.
+    """
+    line_offsets = list(accumulate(line_counts, initial=0))
+    boundaries = []
+    for ordinal in ordinals:
+        chunk = bisect.bisect_left(line_offsets, ordinal) - 1
+        _ends_with_delimiter = line_complete or chunk + 1 < len(line_counts)
+        if line_offsets[chunk + 1] == ordinal and _ends_with_delimiter:  # Chunk ends with this line
+            boundaries.append(chunk_offsets[chunk + 1])
+            continue
+        with open_chunk_file(chunk_files[chunk], "rb") as file:
+            offsets = find_delimiters(file, 0, chunk_offsets[chunk + 1] - chunk_offsets[chunk],
+                                      [ordinal - line_offsets[chunk]], block_size)
+        boundaries.append(chunk_offsets[chunk] + offsets[0])
+    return boundaries
+
+
+def _write_chunk(chunk_files: List[str],
+                 chunk_sizes: List[int],
+                 chunk_line_counts: List[int],
+                 segments: List[Segment],
+                 target_file_path: str,
+                 lines: Optional[int],
+                 compresslevel: Optional[int]) -> int:
+    """
+    Writes a new chunk from byte ranges of the source chunks. A source chunk which is taken as a whole is linked
+    instead of copied if possible.
+
+    :return: number of lines of the new chunk
+    """
+    if len(segments) == 1:
+        chunk, start, stop = segments[0]
+        _, source_extension = split_compression_extension(chunk_files[chunk])
+        _, target_extension = split_compression_extension(target_file_path)
+        if start == 0 and stop == chunk_sizes[chunk] and source_extension == target_extension:
+            try:
+                os.link(chunk_files[chunk], target_file_path)
+                return chunk_line_counts[chunk]
+            except OSError:
+                pass  # E.g. not supported by the file system
+
+    staging_path = target_file_path + ".tmp"
+    with open(staging_path, "wb") as target:
+        for chunk, start, stop in segments:
+            if not is_compressed(chunk_files[chunk]):
+                with open(chunk_files[chunk], "rb") as source:
+                    copy_range(source.fileno(), target.fileno(), start, stop - start)
+                continue
+            with open_chunk_file(chunk_files[chunk], "rb") as source:
+                source.seek(start)
+                while start < stop:
+                    block = source.read(min(1 << 20, stop - start))
+                    target.write(block)
+                    start += len(block)
+    if lines is None:
+        lines = count_lines(staging_path)
+    if is_compressed(target_file_path):
+        compress_file(staging_path, target_file_path, compresslevel=compresslevel)
+    else:
+        os.replace(staging_path, target_file_path)
+    return lines
+
+
+def rechunk(file_path: str,
+            max_lines: Optional[int] = None,
+            max_bytes: Optional[int] = None,
+            n_chunks: Optional[int] = None,
+            keep_extension: bool = True,
+            index_format: str = "06d",
+            *,
+            compression: Optional[str] = None,
+            compresslevel: Optional[int] = None,
+            processes: Optional[int] = None,
+            block_size: int = 1 << 24) -> List[str]:
+    """
+    Changes the chunk size of a chunked file in place, producing the same chunks (and manifest) as writing its content
+    again with chunkio.open and the new max_lines or max_bytes. Chunks are expected to end on a line break, except
+    for the last one, as written by chunkio. Lines are split at '\\n'.
+
+    Works on bytes only, i.e. nothing is decoded or split into lines. Split points are found from the per chunk line
+    counts (or sizes) and by searching only the chunks containing them. Source chunks which remain whole are linked
+    into the new chunked file, else their byte ranges are copied within the kernel where supported. The new chunks
+    are written to a staging directory, which replaces the chunk directory once complete.
+
+    :param file_path: base file path of the chunked file
+    :param max_lines: maximal number of lines per chunk
+    :param max_bytes: maximal number of bytes per chunk, lines are never split. Optionally combined with max_lines.
+    :param n_chunks: number of chunks, distributing the lines evenly, i.e. the first chunks have one line more than
+        the others if the lines do not divide evenly. Fewer chunks if there are fewer lines. Ignored if max_lines or
+        max_bytes is given.
+    :param keep_extension: keeps the file extension for the chunk directory, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param compression: optional compression codec of the new chunk files, one of 'gzip', 'bz2' or 'lzma'
+    :param compresslevel: optional compression level, else the default of the codec
+    :param processes: number of threads writing chunks, defaults to the number of cpus
+    :param block_size: number of bytes read at once while searching split points
+    :return: new chunk file paths
+    """
+    assert max_lines or max_bytes or n_chunks, "Either max_lines, max_bytes or n_chunks should be provided!"
+    assert max_lines is None or max_lines > 0, "max_lines should be a positive integer!"
+    assert max_bytes is None or max_bytes > 0, "max_bytes should be a positive integer!"
+    assert n_chunks is None or n_chunks > 0, "n_chunks should be a positive integer!"
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format,
+                                             keep_extension=keep_extension,
+                                             compression=compression)
+
+    chunk_files = list(chunk_format.list(file_path))
+    chunk_sizes = chunk_format.chunk_sizes(file_path, chunk_files)
+    chunk_line_counts = chunk_format.chunk_line_counts(file_path, chunk_files)  # From the manifest, if present
+    chunk_offsets = list(accumulate(chunk_sizes, initial=0))
+    size, line_count = chunk_offsets[-1], sum(chunk_line_counts)
+    with BaseSequentialBinaryIOReader(file_path, chunk_format=chunk_format) as reader:
+        line_complete = True
+        if size > 0:
+            reader.seek(size - 1)
+            line_complete = reader.read(1) == _DELIMITER
+        if max_bytes:
+            boundaries = byte_boundaries(reader, size, max_bytes, max_lines, block_size)
+    if max_bytes:
+        boundaries = [offset for offset in boundaries if offset < size]  # Never end with an empty chunk
+        lines = [None] * (len(boundaries) + 1)  # Counted while writing
+    else:
+        # Line counts include a trailing line without delimiter, which does not end a chunk
+        delimiter_counts = chunk_line_counts[:-1] + [chunk_line_counts[-1] - (not line_complete)] if chunk_files else []
+        if max_lines:
+            ordinals = list(range(max_lines, line_count, max_lines))  # Never end with an empty chunk
+        else:
+            # The first line_count % n_chunks chunks take one line more
+            _lines, _extra_lines = divmod(line_count, n_chunks)
+            ordinals = list(accumulate(_lines + (index < _extra_lines) for index in range(min(n_chunks, line_count))))
+            ordinals = ordinals[:-1]
+        boundaries = _line_boundaries(chunk_files, chunk_offsets, delimiter_counts, ordinals, block_size,
+                                      line_complete=line_complete)
+        lines = [stop - start for start, stop in zip([0] + ordinals, ordinals + [line_count])]
+    byte_ranges = list(zip([0] + boundaries, boundaries + [size]))
+
+    directory = os.path.dirname(chunk_format.format(file_path, 0))
+    staging_directory = directory + ".rechunk.tmp"
+    shutil.rmtree(staging_directory, ignore_errors=True)
+    os.mkdir(staging_directory)
+    chunk_file_names = [os.path.basename(chunk_format.format(file_path, index)) for index in range(len(byte_ranges))]
+    staging_paths = [os.path.join(staging_directory, chunk_file_name) for chunk_file_name in chunk_file_names]
+    with ThreadPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        futures = [executor.submit(_write_chunk, chunk_files, chunk_sizes, chunk_line_counts,
+                                   _segments(chunk_offsets, start, stop), staging_path, _lines, compresslevel)
+                   for staging_path, (start, stop), _lines in zip(staging_paths, byte_ranges, lines)]
+        lines = [future.result() for future in futures]
+
+    manifest = ChunkManifest()
+    for index, (chunk_file_name, (start, stop), _lines) in enumerate(zip(chunk_file_names, byte_ranges, lines)):
+        manifest.append(index=index, file_name=chunk_file_name, lines=_lines, bytes=stop - start)
+    manifest.write(os.path.join(staging_directory, ChunkManifest.file_name))
+
+    # Swaps the directories by two renames, which is not atomic: in between, the chunk directory is missing and
+    # readers, which listed the old chunks before, fail to open them afterwards. A single listing never mixes old and
+    # new chunks though.
+    old_directory = directory + ".rechunk.old"
+    shutil.rmtree(old_directory, ignore_errors=True)
+    os.rename(directory, old_directory)
+    os.rename(staging_directory, directory)
+    shutil.rmtree(old_directory)
+    return [os.path.join(directory, chunk_file_name) for chunk_file_name in chunk_file_names]
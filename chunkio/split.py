@@ -0,0 +1,260 @@
+import multiprocessing
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import ChunkManifest
+from chunkio.chunk_handler.compression import compress_file, is_compressed
+from chunkio.chunk_handler.utils import copy_range
+
+_DELIMITER = b"\n"
+
+
+def _count_delimiters(task: Tuple[str, int, int, int]) -> int:
+    """
+    Counts the delimiters within a byte range of a file. Runs inside the worker processes, thus has to be importable.
+
+    :param task: (file path, start, stop, block size)
+    :return: number of delimiters
+    """
+    file_path, start, stop, block_size = task
+    count = 0
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        while start < stop:
+            block = file.read(min(block_size, stop - start))
+            if not block:
+                break
+            count += block.count(_DELIMITER)
+            start += len(block)
+    return count
+
+
+def find_delimiters(file: BinaryIO, start: int, stop: int, ordinals: List[int], block_size: int = 1 << 24) -> List[int]:
+    """
+    Finds the offsets after the n-th delimiters within a byte range of a file, counting from the start of the range.
+    Blocks without any of the requested delimiters are only counted.
+
+    :param file: file opened in binary mode, supporting seek
+    :param start: first byte offset of the range
+    :param stop: byte offset after the range
+    :param ordinals: ascending delimiter ordinals, starting at 1
+    :param block_size: number of bytes read at once
+    :return: offsets after the requested delimiters, fewer if the range ends before
+    """
+    offsets = []
+    count = 0
+    file.seek(start)
+    while start < stop and len(offsets) < len(ordinals):
+        block = file.read(min(block_size, stop - start))
+        if not block:
+            break
+        _block_count = count + block.count(_DELIMITER)
+        position = -1
+        while len(offsets) < len(ordinals) and ordinals[len(offsets)] <= _block_count:
+            for _ in range(ordinals[len(offsets)] - count):
+                position = block.find(_DELIMITER, position + 1)
+            count = ordinals[len(offsets)]
+            offsets.append(start + position + 1)
+        count = _block_count
+        start += len(block)
+    return offsets
+
+
+def _find_delimiters(task: Tuple[str, int, int, List[int], int]) -> List[int]:
+    """
+    Same as find_delimiters for a file path. Runs inside the worker processes, thus has to be importable.
+
+    :param task: (file path, start, stop, ascending delimiter ordinals starting at 1, block size)
+    :return: offsets after the requested delimiters
+    """
+    file_path, start, stop, ordinals, block_size = task
+    with open(file_path, "rb") as file:
+        return find_delimiters(file, start, stop, ordinals, block_size)
+
+
+def _run(function: Callable, tasks: List, processes: Optional[int]) -> List:
+    if len(tasks) <= 1 or processes == 1:
+        return [function(task) for task in tasks]
+    with multiprocessing.Pool(processes) as pool:
+        return pool.map(function, tasks, chunksize=1)
+
+
+def _byte_ranges(size: int, processes: int, block_size: int) -> List[Tuple[int, int]]:
+    _range_size = max(-(-size // processes), block_size)
+    return [(start, min(start + _range_size, size)) for start in range(0, size, _range_size)]
+
+
+def _line_boundaries(source_file_path: str,
+                     size: int,
+                     max_lines: int,
+                     processes: Optional[int],
+                     block_size: int) -> List[int]:
+    """
+    Offsets after every max_lines-th line. The delimiters are counted in parallel over byte ranges first, which
+    tells the range containing each boundary. Then the boundaries are located within their ranges in parallel.
+    """
+    byte_ranges = _byte_ranges(size, processes or os.cpu_count(), block_size)
+    counts = _run(_count_delimiters, [(source_file_path, start, stop, block_size) for start, stop in byte_ranges],
+                  processes)
+    lines_before = list(accumulate(counts, initial=0))
+
+    tasks = []
+    for (start, stop), _lines_before, count in zip(byte_ranges, lines_before, counts):
+        first = _lines_before // max_lines + 1
+        ordinals = [k * max_lines - _lines_before for k in range(first, (_lines_before + count) // max_lines + 1)]
+        if ordinals:
+            tasks.append((source_file_path, start, stop, ordinals, block_size))
+    return [offset for offsets in _run(_find_delimiters, tasks, processes) for offset in offsets]
+
+
+def _chunk_end(file: BinaryIO, start: int, size: int, max_bytes: int, max_lines: Optional[int], block_size: int) -> int:
+    # As the MaxByteSequentialChunker: as many whole lines as fit max_bytes, but at least one line
+    limit = start + max_bytes
+    end = size
+    if limit < size:
+        end = None
+        stop = limit
+        while end is None and stop > start:  # Last delimiter before the limit
+            _start = max(start, stop - block_size)
+            file.seek(_start)
+            position = file.read(stop - _start).rfind(_DELIMITER)
+            if position >= 0:
+                end = _start + position + 1
+            stop = _start
+        position = limit
+        while end is None:  # Single line exceeding max_bytes
+            file.seek(position)
+            block = file.read(block_size)
+            if not block:
+                end = size
+            elif _DELIMITER in block:
+                end = position + block.find(_DELIMITER) + 1
+            position += len(block)
+    if max_lines is not None:
+        boundaries = find_delimiters(file, start, end, [max_lines], block_size)
+        if boundaries:
+            end = boundaries[0]
+    return end
+
+
+def byte_boundaries(file: BinaryIO,
+                    size: int,
+                    max_bytes: int,
+                    max_lines: Optional[int] = None,
+                    block_size: int = 1 << 24) -> List[int]:
+    """
+    Chunk boundaries for a maximal number of bytes per chunk, as decided by the MaxByteSequentialChunker. Each boundary
+    only depends on the previous one, but is found by reading backwards from the byte limit, thus only a small part
+    of each chunk is read.
+
+    :param file: file opened in binary mode, supporting seek
+    :param size: size of the file
+    :param max_bytes: maximal number of bytes per chunk
+    :param max_lines: optional maximal number of lines per chunk
+    :param block_size: number of bytes read at once
+    :return: byte offsets at which the chunks after the first one start
+    """
+    boundaries = []
+    start = 0
+    while True:
+        start = _chunk_end(file, start, size, max_bytes, max_lines, block_size)
+        if start >= size:
+            return boundaries
+        boundaries.append(start)
+
+
+def _write_chunk(source_file_path: str, chunk_file_path: str, start: int, stop: int, compresslevel: Optional[int]):
+    staging_path = chunk_file_path + ".tmp"
+    with open(source_file_path, "rb") as source, open(staging_path, "wb") as target:
+        copy_range(source.fileno(), target.fileno(), start, stop - start)
+    if is_compressed(chunk_file_path):
+        compress_file(staging_path, chunk_file_path, compresslevel=compresslevel)
+    else:
+        os.replace(staging_path, chunk_file_path)
+
+
+def split(source_file_path: str,
+          file_path: str,
+          max_lines: Optional[int] = None,
+          max_bytes: Optional[int] = None,
+          keep_extension: bool = True,
+          index_format: str = "06d",
+          *,
+          compression: Optional[str] = None,
+          compresslevel: Optional[int] = None,
+          processes: Optional[int] = None,
+          block_size: int = 1 << 24,
+          write_manifest: bool = True) -> List[str]:
+    """
+    Splits a large file into a chunked file, producing the same chunks (and manifest) as writing its content with
+    chunkio.open and the same max_lines or max_bytes. Lines are split at '\\n'.
+
+    Works on bytes only, i.e. nothing is decoded or split into lines. Split points are found by counting delimiters
+    in large blocks, in parallel over byte ranges of the file, and the chunks are copied as byte ranges within the
+    kernel where supported. With max_bytes, split points are found by reading backwards from each byte limit.
+
+    :param source_file_path: path to the file to split
+    :param file_path: base file path of the chunked file
+    :param max_lines: maximal number of lines per chunk
+    :param max_bytes: maximal number of bytes per chunk, lines are never split. Optionally combined with max_lines.
+    :param keep_extension: keeps the file extension for the chunk directory, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param compression: optional compression codec of the chunk files, one of 'gzip', 'bz2' or 'lzma'
+    :param compresslevel: optional compression level, else the default of the codec
+    :param processes: number of worker processes scanning the file and threads writing chunks, defaults to the
+        number of cpus
+    :param block_size: number of bytes read at once, also the minimal size of the byte range scanned by a process
+    :param write_manifest: writes a manifest of all chunks
+    :return: chunk file paths
+    """
+    assert max_lines or max_bytes, "Either max_lines or max_bytes should be provided!"
+    assert max_lines is None or max_lines > 0, "max_lines should be a positive integer!"
+    assert max_bytes is None or max_bytes > 0, "max_bytes should be a positive integer!"
+    assert block_size > 0, "Block size should be a positive integer!"
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format,
+                                             keep_extension=keep_extension,
+                                             compression=compression)
+
+    size = os.path.getsize(source_file_path)
+    if max_bytes:
+        with open(source_file_path, "rb") as file:
+            boundaries = byte_boundaries(file, size, max_bytes, max_lines, block_size)
+    else:
+        boundaries = [offset for offset in _line_boundaries(source_file_path, size, max_lines, processes, block_size)
+                      if offset < size]  # Chunks are rolled over lazily, thus never end with an empty chunk
+    byte_ranges = list(zip([0] + boundaries, boundaries + [size]))
+
+    if max_bytes:
+        line_counts = _run(_count_delimiters, [(source_file_path, start, stop, block_size)
+                                               for start, stop in byte_ranges], processes)
+    else:
+        line_counts = [max_lines] * len(boundaries) + [0]
+        line_counts[-1] = _count_delimiters((source_file_path, byte_ranges[-1][0], size, block_size))
+    if size > 0:
+        with open(source_file_path, "rb") as file:
+            file.seek(size - 1)
+            line_counts[-1] += file.read(1) != _DELIMITER  # A trailing line without delimiter still counts as a line
+
+    # Stale metadata would hide or misplace the chunks written now, thus remove it until all chunks are written
+    manifest_path = chunk_format.manifest_path(file_path)
+    for _metadata_path in [manifest_path, chunk_format.line_index_path(file_path)]:
+        if os.path.isfile(_metadata_path):
+            os.remove(_metadata_path)
+
+    chunk_file_paths = [chunk_format.format(file_path, index) for index in range(len(byte_ranges))]
+    with ThreadPoolExecutor(max_workers=processes or os.cpu_count()) as executor:
+        futures = [executor.submit(_write_chunk, source_file_path, chunk_file_path, start, stop, compresslevel)
+                   for chunk_file_path, (start, stop) in zip(chunk_file_paths, byte_ranges)]
+        for future in futures:
+            future.result()
+
+    if write_manifest:
+        manifest = ChunkManifest()
+        for index, (chunk_file_path, (start, stop), lines) in enumerate(zip(chunk_file_paths, byte_ranges, line_counts)):
+            manifest.append(index=index, file_name=os.path.basename(chunk_file_path), lines=lines, bytes=stop - start)
+        manifest.write(manifest_path)
+    return chunk_file_paths
@@ -0,0 +1,70 @@
+import multiprocessing
+import os
+
+from typing import Optional, Tuple
+
+from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import ChunkManifest
+from chunkio.chunk_handler.compression import uncompressed_size
+from chunkio.chunk_handler.utils import count_lines
+
+
+def _stat_chunk(task: Tuple[str, int]) -> Tuple[int, int]:
+    """
+    Counts lines and bytes of a single chunk file with large binary reads. Runs inside the worker processes, thus has
+    to be importable.
+
+    :param task: (chunk file path, block size)
+    :return: (number of lines, number of uncompressed bytes)
+    """
+    chunk_file_path, block_size = task
+    return count_lines(chunk_file_path, block_size=block_size), uncompressed_size(chunk_file_path, block_size)
+
+
+def stat(file_path: str,
+         keep_extension: bool = True,
+         index_format: str = "06d",
+         *,
+         processes: Optional[int] = None,
+         block_size: int = 1 << 24,
+         persist: bool = False) -> ChunkManifest:
+    """
+    Line counts and (uncompressed) sizes of all chunks and in total, as a manifest. Taken from the manifest if present,
+    else the chunk files are counted in parallel on a process pool, reading large binary blocks without decoding.
+    Lines are split at '\\n'.
+
+    :param file_path: base file path of the chunked file
+    :param keep_extension: keeps the file extension for the chunk directory, default true
+    :param index_format: format string for the chunk index, default '06d'
+    :param processes: number of worker processes counting chunk files, defaults to the number of cpus
+    :param block_size: number of bytes read at once
+    :param persist: if true a counted manifest is stored alongside the chunks and picked up by later calls and
+        readers. Chunks added later on by writers without manifest, e.g. concurrent ones, are hidden by it.
+    :return: manifest with per chunk entries and the totals lines and bytes
+    """
+    chunk_format = SubdirNumberedChunkFormat(index_format=index_format, keep_extension=keep_extension)
+    manifest = chunk_format.read_manifest(file_path)
+    if manifest is not None:
+        return manifest
+
+    chunk_files = list(chunk_format.list(file_path, return_index=True))
+    tasks = [(chunk_file_path, block_size) for chunk_file_path, _ in chunk_files]
+    if len(tasks) <= 1 or processes == 1:
+        stats = [_stat_chunk(task) for task in tasks]
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            stats = pool.map(_stat_chunk, tasks, chunksize=max(len(tasks) // (4 * (processes or os.cpu_count())), 1))
+
+    manifest = ChunkManifest()
+    for (chunk_file_path, index), (lines, size) in zip(chunk_files, stats):
+        manifest.append(index=index, file_name=os.path.basename(chunk_file_path), lines=lines, bytes=size)
+    if persist:
+        manifest.write(chunk_format.manifest_path(file_path))
+    return manifest
+
+
+def count(file_path: str, *args, **kwargs) -> int:
+    """
+    Number of lines of a chunked file, see stat.
+    """
+    return stat(file_path, *args, **kwargs).lines
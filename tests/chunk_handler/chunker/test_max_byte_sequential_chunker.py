@@ -0,0 +1,128 @@
+import os
+import pytest
+
+from itertools import accumulate
+from random import Random
+from chunkio.chunk_handler import MaxByteSequentialChunker
+from chunkio.chunk_handler.utils import group_into_lines, parse_lines
+from typing import List, Optional
+
+
+@pytest.mark.parametrize(
+    "max_bytes, max_lines, line_parts, expected_indices", [
+        # Lines fill chunks up to the byte limit
+        (10, None, ["1234\n", "1234\n", "1234\n"], [0, 0, 1]),
+        # Lines larger than the limit get their own chunk
+        (4, None, ["12\n", "123456789\n", "12\n"], [0, 1, 2]),
+        # Combined limits, whatever is hit first
+        (100, 2, ["1\n", "2\n", "3\n", "4\n", "5\n"], [0, 0, 1, 1, 2]),
+        (6, 2, ["1\n", "2\n", "12345\n"], [0, 0, 1]),
+        # Multi-byte characters are counted encoded
+        (4, None, ["ä\n", "ä\n"], [0, 1]),
+        # Bytes
+        (10, None, [b"1234\n", b"1234\n", b"1234\n"], [0, 0, 1]),
+    ]
+)
+def test_max_byte_sequential_chunker_indices(max_bytes: int,
+                                             max_lines: Optional[int],
+                                             line_parts: List[str],
+                                             expected_indices: List[int]):
+    delimiter = b"\n" if isinstance(line_parts[0], bytes) else "\n"
+    chunker = MaxByteSequentialChunker(max_bytes=max_bytes, max_lines=max_lines, delimiter=delimiter)
+    assert chunker.indices(line_parts) == expected_indices
+
+    chunker.reset()
+    assert [chunker.index(line_part) for line_part in line_parts] == expected_indices
+
+
+def test_max_byte_sequential_chunker_indices_line_parts():
+    chunker = MaxByteSequentialChunker(max_bytes=10)
+    # The size of the full line decides, thus the second line moves to the next chunk as a whole
+    assert chunker.indices(["123", "45\n", "12", "34", "5\n", "1\n"]) == [0, 0, 1, 1, 1, 1]
+
+
+def test_max_byte_sequential_chunker_indices_across_calls():
+    chunker = MaxByteSequentialChunker(max_bytes=10)
+    assert chunker.indices(["1234\n", "12"]) == [0, 0]
+    assert chunker.indices(["34\n", "12345\n", ""]) == [0, 1, 1]
+    assert chunker.current_byte_count == 6
+
+
+@pytest.mark.parametrize(
+    "max_bytes, max_lines, calls, expected_segments", [
+        (10, None, [["1234\n", "1234\n", "1234\n"]], [[(0, 0, 2), (1, 2, 3)]]),
+        (10, None, [["123", "45\n", "12", "34", "5\n", "1\n"]], [[(0, 0, 2), (1, 2, 6)]]),
+        (10, None, [["1234\n", "12"], ["34\n", "12345\n", ""]], [[(0, 0, 2)], [(0, 0, 1), (1, 1, 3)]]),
+        (100, 2, [["1\n", "2\n", "3\n", "4\n", "5\n"]], [[(0, 0, 2), (1, 2, 4), (2, 4, 5)]]),
+        (4, None, [[b"12\n", b"123456789\n", b"12\n"]], [[(0, 0, 1), (1, 1, 2), (2, 2, 3)]]),
+    ]
+)
+def test_max_byte_sequential_chunker_segments(max_bytes: int,
+                                              max_lines: Optional[int],
+                                              calls: List[List[str]],
+                                              expected_segments: List[List[tuple]]):
+    delimiter = b"\n" if isinstance(calls[0][0], bytes) else "\n"
+    chunker = MaxByteSequentialChunker(max_bytes=max_bytes, max_lines=max_lines, delimiter=delimiter)
+    assert [chunker.segments(line_parts) for line_parts in calls] == expected_segments
+
+
+@pytest.mark.parametrize(
+    "encoding, newline, line_parts, expected_indices", [
+        # Translated newlines count with their encoded size
+        ("utf-8", "\r\n", ["123\n", "123\n", "123\n"], [0, 0, 1]),
+        ("utf-8", "\n", ["123\n", "123\n", "123\n"], [0, 0, 0]),
+        # Byte order marks count once per chunk, here 2 bytes plus 2 bytes per character
+        ("utf-16", "\n", ["12\n", "12\n", "1\n"], [0, 1, 1]),
+        ("utf-8-sig", "\n", ["123\n", "12\n", "12\n"], [0, 0, 1]),
+    ]
+)
+def test_max_byte_sequential_chunker_encoded_size(encoding: str,
+                                                  newline: str,
+                                                  line_parts: List[str],
+                                                  expected_indices: List[int]):
+    chunker = MaxByteSequentialChunker(max_bytes=12, encoding=encoding, newline=newline)
+    assert chunker.indices(line_parts) == expected_indices
+
+    chunker.reset()
+    assert [chunker.index(line_part) for line_part in line_parts] == expected_indices
+
+
+@pytest.mark.parametrize("encoding, newline", [("utf-8", None), ("utf-8", "\r\n"), ("utf-16", "")])
+def test_max_byte_sequential_chunker_segments_encoded_lines(encoding: str, newline: Optional[str]):
+    random = Random(0)
+    line_parts = [random.choice(["", "a", "bb", "ä", "x" * 20]) + random.choice(["", "\n"]) for _ in range(2_000)]
+    max_bytes, max_lines = 50, 7
+
+    # Each line goes to the current chunk, unless the chunk would exceed a limit once written
+    expected_indices = []
+    index, chunk_bytes, chunk_lines = 0, 0, 0
+    bom_size = len("".encode(encoding))
+    for group in group_into_lines(line_parts):
+        line = "".join(group).replace("\n", os.linesep if newline is None else newline or "\n")
+        size = len(line.encode(encoding)) - bom_size
+        if chunk_lines and (chunk_lines >= max_lines or bom_size + chunk_bytes + size > max_bytes):
+            index, chunk_bytes, chunk_lines = index + 1, 0, 0
+        chunk_bytes, chunk_lines = chunk_bytes + size, chunk_lines + 1
+        expected_indices += len(group) * [index]
+
+    chunker = MaxByteSequentialChunker(max_bytes=max_bytes, max_lines=max_lines, encoding=encoding, newline=newline)
+    assert chunker.indices(line_parts) == expected_indices
+
+
+@pytest.mark.parametrize("max_bytes, max_lines", [(1, None), (20, None), (20, 3), (200, 7)])
+def test_max_byte_sequential_chunker_block_segments(max_bytes: int, max_lines: Optional[int]):
+    random = Random(0)
+    for delimiter in ["\n", b"\n"]:
+        text = "".join(random.choice(["", "a", "bb", "x" * 30, "ä", "\n", "\n"]) for _ in range(2_000))
+        text = text if isinstance(delimiter, str) else text.encode()
+        blocks = [text[start:start + 333] for start in range(0, len(text), 333)]
+
+        # Segments of a block are the segments of its lines, but searched in place
+        chunker, expected_chunker = (MaxByteSequentialChunker(max_bytes=max_bytes, max_lines=max_lines, delimiter=delimiter) for _ in range(2))
+        for block in blocks:
+            lines = parse_lines(block, delimiter=delimiter)
+            lines = lines[:-1] if not lines[-1] else lines
+            offsets = list(accumulate(map(len, lines), initial=0))
+            expected_segments = [(index, offsets[start], offsets[stop])
+                                 for index, start, stop in expected_chunker.segments(lines)]
+            assert chunker.block_segments(block) == expected_segments
@@ -1,6 +1,9 @@
 import pytest
 
+from itertools import accumulate
+from random import Random
 from chunkio.chunk_handler import MaxLineSequentialChunker
+from chunkio.chunk_handler.utils import parse_lines
 from typing import List
 
 
@@ -82,6 +85,13 @@ def test_max_line_sequential_chunker_indices(max_lines: int,
             ["line\n", "incomplete", "line"],
             ["line\n", "complete"],
             [1, 2]
+        ),
+        # Bytes
+        (
+                b"\n", 2,
+                3 * [b"\n"],
+                [b"fir", b"st\n", b"second\n", b"third\n"],
+                [1, 1, 2, 2]
         )
     ]
 )
@@ -90,6 +100,74 @@ def test_max_line_sequential_chunker_indices_line_parts(delimiter: str,
                                                         prime_lines: List[str],
                                                         line_parts: List[str],
                                                         expected_indices: List[int]):
-    chunker = MaxLineSequentialChunker(max_lines=max_lines)
+    chunker = MaxLineSequentialChunker(max_lines=max_lines, delimiter=delimiter)
     _ = chunker.indices(prime_lines)
     assert chunker.indices(line_parts) == expected_indices
+
+
+def _run_length_segments(indices: List[int]) -> List[tuple]:
+    segments = []
+    for position, index in enumerate(indices):
+        if segments and segments[-1][0] == index:
+            segments[-1] = (index, segments[-1][1], position + 1)
+        else:
+            segments.append((index, position, position + 1))
+    return segments
+
+
+@pytest.mark.parametrize(
+    "max_lines, calls", [
+        (2, [["fir", "st\n", "s", "e", "c", "ond\n", "third\n", "four", "th"]]),
+        (2, [["\n", "in", "complete"], ["fir", "st\n", "s", "e", "c", "ond\n", "third\n", "four", "th"]]),
+        (1, [["line\n", "incomplete", "line"], ["line\n", "complete"]]),
+        (10, [109 * ["\n"], 12 * ["\n"]]),
+        (3, [7 * ["\n"], [], ["a", "b\n"], 5 * ["c\n"]]),
+        (2, [[b"fir", b"st\n", b"second\n", b"third\n"]]),
+    ]
+)
+def test_max_line_sequential_chunker_segments(max_lines: int, calls: List[List[str]]):
+    delimiter = b"\n" if calls[0] and isinstance(calls[0][0], bytes) else "\n"
+    chunker = MaxLineSequentialChunker(max_lines=max_lines, delimiter=delimiter)
+    reference_chunker = MaxLineSequentialChunker(max_lines=max_lines, delimiter=delimiter)
+    for line_parts in calls:
+        expected_segments = _run_length_segments(reference_chunker.indices(line_parts))
+        assert chunker.segments(line_parts) == expected_segments
+
+
+@pytest.mark.parametrize(
+    "max_lines, first_parts, second_parts", [
+        (3, ["a\n", "b\n"], ["c\n", "d\n", "e\n", "f\n"]),
+        (3, ["a\n", "b\n", "c\n"], ["d\n"]),
+        (2, ["a\n", "in"], ["complete\n", "b\n", "c\n"]),
+    ]
+)
+def test_max_line_sequential_chunker_resume(max_lines: int, first_parts: List[str], second_parts: List[str]):
+    reference_chunker = MaxLineSequentialChunker(max_lines=max_lines)
+    first_indices = reference_chunker.indices(first_parts)
+    expected_indices = reference_chunker.indices(second_parts)
+
+    line_complete = first_parts[-1].endswith("\n")
+    line_count = sum(1 for index, part in zip(first_indices, first_parts)
+                     if index == first_indices[-1] and part.endswith("\n"))
+    chunker = MaxLineSequentialChunker(max_lines=max_lines)
+    chunker.resume(first_indices[-1], line_count=line_count, line_complete=line_complete)
+    assert chunker.indices(second_parts) == expected_indices
+
+
+@pytest.mark.parametrize("max_lines", [1, 3, 10])
+def test_max_line_sequential_chunker_block_segments(max_lines: int):
+    random = Random(0)
+    for delimiter in ["\n", b"\n"]:
+        text = "".join(random.choice(["", "a", "bb", "x" * 30, "ä", "\n", "\n"]) for _ in range(2_000))
+        text = text if isinstance(delimiter, str) else text.encode()
+        blocks = [text[start:start + 333] for start in range(0, len(text), 333)]
+
+        # Segments of a block are the segments of its lines, but searched in place
+        chunker, expected_chunker = (MaxLineSequentialChunker(max_lines=max_lines, delimiter=delimiter) for _ in range(2))
+        for block in blocks:
+            lines = parse_lines(block, delimiter=delimiter)
+            lines = lines[:-1] if not lines[-1] else lines
+            offsets = list(accumulate(map(len, lines), initial=0))
+            expected_segments = [(index, offsets[start], offsets[stop])
+                                 for index, start, stop in expected_chunker.segments(lines)]
+            assert chunker.block_segments(block) == expected_segments
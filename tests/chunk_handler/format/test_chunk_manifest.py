@@ -0,0 +1,69 @@
+import pytest
+import shutil
+import os
+
+from typing import List
+
+from chunkio.chunk_handler import BaseSequentialTextIOWriter, MaxLineSequentialChunker, SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import ChunkManifest, ChunkManifestEntry
+
+
+def test_chunk_manifest_write_read():
+    manifest_path = "/tmp/chunkio/chunk_manifest.json"
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    manifest = ChunkManifest()
+    manifest.append(0, "test.000000.txt", lines=2, bytes=10)
+    manifest.append(3, "test.000003.txt", lines=1, bytes=4)
+    manifest.write(manifest_path)
+
+    observed = ChunkManifest.read(manifest_path)
+    os.remove(manifest_path)
+    assert observed.entries == [
+        ChunkManifestEntry(0, "test.000000.txt", 2, 10, 0, 0),
+        ChunkManifestEntry(3, "test.000003.txt", 1, 4, 2, 10)
+    ]
+    assert (observed.lines, observed.bytes) == (3, 14)
+
+
+@pytest.mark.parametrize(
+    "lines, expected_lines, expected_bytes", [
+        (["first\n", "second\n", "third\n", "fourth"], [2, 2], [13, 12]),
+        (["first\n", "second\n", "third\n", "fourth\n"], [2, 2], [13, 13]),
+        (["first\n"], [1], [6]),
+    ]
+)
+def test_chunk_manifest_writer(lines: List[str], expected_lines: List[int], expected_bytes: List[int]):
+    base_file_path = "/tmp/chunkio/chunk_manifest.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)
+    with BaseSequentialTextIOWriter(base_file_path, chunker=MaxLineSequentialChunker(max_lines=2)) as file:
+        file.writelines(lines)
+
+    chunk_format = SubdirNumberedChunkFormat()
+    manifest = chunk_format.read_manifest(base_file_path)
+    shutil.rmtree(base_file_path, ignore_errors=True)
+    assert [entry.lines for entry in manifest.entries] == expected_lines
+    assert [entry.bytes for entry in manifest.entries] == expected_bytes
+    assert manifest.lines == sum(expected_lines)
+    assert manifest.bytes == sum(expected_bytes)
+
+
+def test_chunk_manifest_list():
+    base_file_path = "/tmp/chunkio/chunk_manifest.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)
+    with BaseSequentialTextIOWriter(base_file_path, chunker=MaxLineSequentialChunker(max_lines=1)) as file:
+        file.writelines(["first\n", "second\n"])
+    chunk_format = SubdirNumberedChunkFormat()
+    expected_chunks = [
+        os.path.join(base_file_path, "chunk_manifest.000000.txt"),
+        os.path.join(base_file_path, "chunk_manifest.000001.txt")
+    ]
+    # Chunks not covered by the manifest are not listed
+    with open(os.path.join(base_file_path, "chunk_manifest.000002.txt"), "w") as file:
+        file.write("stale\n")
+    listed_with_manifest = list(chunk_format.list(base_file_path))
+
+    os.remove(chunk_format.manifest_path(base_file_path))
+    listed_without_manifest = list(chunk_format.list(base_file_path))
+    shutil.rmtree(base_file_path, ignore_errors=True)
+    assert listed_with_manifest == expected_chunks
+    assert listed_without_manifest == expected_chunks + [os.path.join(base_file_path, "chunk_manifest.000002.txt")]
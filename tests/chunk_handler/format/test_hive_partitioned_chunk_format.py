@@ -0,0 +1,57 @@
+import pytest
+import os
+import shutil
+
+from typing import List, Optional
+
+from chunkio.chunk_handler import HivePartitionedChunkFormat
+
+
+@pytest.mark.parametrize(
+    "keep_extension, partition, index, expected", [
+        (True, "2026-10-18", 0, "/tmp/chunkio/test_file.txt/date=2026-10-18/test_file.txt/test_file.000000.txt"),
+        (True, "a/b", 1, "/tmp/chunkio/test_file.txt/date=a%2Fb/test_file.txt/test_file.000001.txt"),
+        (False, "2026-10-18", 2, "/tmp/chunkio/test_file/date=2026-10-18/test_file/test_file.000002.txt"),
+    ]
+)
+def test_hive_partitioned_chunk_format_format_parse(keep_extension: bool, partition: str, index: int, expected: str):
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Reset
+    chunk_format = HivePartitionedChunkFormat("date", keep_extension=keep_extension)
+    assert chunk_format.format("/tmp/chunkio/test_file.txt", index, partition=partition) == expected
+    assert chunk_format.parse(expected) == ("/tmp/chunkio/test_file.txt", index)
+    assert chunk_format.list_partitions("/tmp/chunkio/test_file.txt") == []  # Formatting creates no directories
+    os.makedirs(os.path.dirname(expected))
+    assert chunk_format.list_partitions("/tmp/chunkio/test_file.txt") == [partition]
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Clean up
+
+
+@pytest.mark.parametrize(
+    "partition_filter, expected_partitions", [
+        (None, ["2026-10-16", "2026-10-17", "2026-10-18"]),
+        (["2026-10-18"], ["2026-10-18"]),
+        (lambda value: value >= "2026-10-17", ["2026-10-17", "2026-10-18"]),
+        ([], []),
+    ]
+)
+def test_hive_partitioned_chunk_format_list(partition_filter, expected_partitions: List[str]):
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Reset
+    file_path = "/tmp/chunkio/test_file.txt"
+    writing_format = HivePartitionedChunkFormat("date")
+    for partition in ["2026-10-18", "2026-10-16", "2026-10-17"]:
+        for index in [1, 0]:
+            chunk_file_path = writing_format.format(file_path, index, partition=partition)
+            os.makedirs(os.path.dirname(chunk_file_path), exist_ok=True)
+            with open(chunk_file_path, "w") as file:
+                file.write(f"{partition}\n")
+
+    chunk_format = HivePartitionedChunkFormat("date", partition_filter=partition_filter)
+    assert chunk_format.list_partitions(file_path) == expected_partitions
+    expected_chunks = [f"{file_path}/date={partition}/test_file.txt/test_file.{index:06d}.txt"
+                       for partition in expected_partitions for index in [0, 1]]
+    assert list(chunk_format.list(file_path)) == expected_chunks
+    assert [index for _, index in chunk_format.list(file_path, return_index=True)] == list(range(len(expected_chunks)))
+    # Without partition, indices are positions within the listing
+    assert [chunk_format.format(file_path, index) for index in range(len(expected_chunks))] == expected_chunks
+    with pytest.raises(IndexError):
+        chunk_format.format(file_path, len(expected_chunks))
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Clean up
@@ -3,6 +3,8 @@ import shutil
 import os
 
 from chunkio.chunk_handler import SubdirNumberedChunkFormat
+from chunkio.chunk_handler.compression import open_chunk_file
+from chunkio.chunk_handler.format import ChunkManifest
 
 
 @pytest.mark.parametrize(
@@ -16,6 +18,18 @@ def test_format_subdir_numbered_chunk_format(file_path: str, index: int, expecte
     assert chunk_format.format(file_path, index) == expected
 
 
+@pytest.mark.parametrize(
+    "file_path,compression,expected", [
+        ("/tmp/test_file.txt", "gzip", "/tmp/test_file.txt/test_file.000000.txt.gz"),
+        ("/tmp/test_file.txt", "bz2", "/tmp/test_file.txt/test_file.000000.txt.bz2"),
+        ("/tmp/test_file.txt", "lzma", "/tmp/test_file.txt/test_file.000000.txt.xz")
+    ]
+)
+def test_format_subdir_numbered_chunk_format_compression(file_path: str, compression: str, expected: str):
+    chunk_format = SubdirNumberedChunkFormat(index_format="06d", compression=compression)
+    assert chunk_format.format(file_path, 0) == expected
+
+
 @pytest.mark.parametrize(
     "file_path,index,expected", [
         ("/tmp/test_file.txt", 0, "/tmp/test_file/test_file.000000.txt"),
@@ -45,6 +59,9 @@ def test_format_subdir_numbered_chunk_format_assertion(file_path: str, index: in
         ("/tmp/test_file.txt/test_file.000000.txt", "/tmp/test_file.txt", 0),
         ("/tmp/test_file.txt/test_file.1234567.txt", "/tmp/test_file.txt", 1234567),
         ("/tmp/test_file.something.txt/test_file.something.001234.txt", "/tmp/test_file.something.txt", 1234),
+        ("/tmp/test_file.txt/test_file.000001.txt.gz", "/tmp/test_file.txt", 1),
+        ("/tmp/test_file.txt/test_file.000001.txt.xz", "/tmp/test_file.txt", 1),
+        ("/tmp/test_file.gz/test_file.000002.gz", "/tmp/test_file.gz", 2),
     ]
 )
 def test_parse_subdir_numbered_chunk_format(file_path: str, expected_base_path: str, expected_index: int):
@@ -138,3 +155,83 @@ def test_list_subdir_numbered_chunk_format_no_extension():
     expected_file_paths = [os.path.join(base_directory, file_name) for file_name in ordered_valid_files]
 
     assert list(chunk_format.list(base_directory + ".txt")) == expected_file_paths
+
+
+def test_list_subdir_numbered_chunk_format_compressed_and_temporary_files():
+    base_directory = "/tmp/chunkio/subdir_numbered_chunk_format.txt"
+    shutil.rmtree(base_directory, ignore_errors=True)
+
+    ordered_valid_files = [
+        "subdir_numbered_chunk_format.000000.txt.gz",
+        "subdir_numbered_chunk_format.000001.txt",
+        "subdir_numbered_chunk_format.000002.txt.xz",
+    ]
+    invalid_files = [
+        "subdir_numbered_chunk_format.000003.txt.tmp",
+        "subdir_numbered_chunk_format.000003.txt.gz.part",
+        "subdir_numbered_chunk_format.000003.csv",
+        "subdir_numbered_chunk_format.000003.txt.zip",
+    ]
+
+    os.makedirs(base_directory, exist_ok=True)
+    for file_name in ordered_valid_files + invalid_files:
+        with open(os.path.join(base_directory, file_name), "w") as file:
+            file.write("\n")
+
+    chunk_format = SubdirNumberedChunkFormat(index_format="06d")
+    expected = [(os.path.join(base_directory, file_name), index) for index, file_name in enumerate(ordered_valid_files)]
+
+    assert list(chunk_format.list(base_directory, return_index=True)) == expected
+    shutil.rmtree(base_directory, ignore_errors=True)
+
+
+def test_list_subdir_numbered_chunk_format_cache_listing():
+    base_directory = "/tmp/chunkio/subdir_numbered_chunk_format.txt"
+    shutil.rmtree(base_directory, ignore_errors=True)
+    os.makedirs(base_directory, exist_ok=True)
+
+    chunk_format = SubdirNumberedChunkFormat(index_format="06d", cache_listing=True)
+    file_paths = [chunk_format.format(base_directory, index) for index in range(3)]
+    for file_path in file_paths[:2]:
+        with open(file_path, "w") as file:
+            file.write("\n")
+
+    # Recently modified directories are not cached
+    assert list(chunk_format.list(base_directory)) == file_paths[:2]
+    with open(file_paths[2], "w") as file:
+        file.write("\n")
+    assert list(chunk_format.list(base_directory)) == file_paths
+
+    # Cached listings are kept while the modification time of the directory does not change
+    os.utime(base_directory, ns=(0, 0))
+    assert list(chunk_format.list(base_directory)) == file_paths
+    os.remove(file_paths[2])
+    os.utime(base_directory, ns=(0, 0))
+    assert list(chunk_format.list(base_directory)) == file_paths
+    assert list(SubdirNumberedChunkFormat(index_format="06d").list(base_directory)) == file_paths[:2]
+
+    # A changed modification time invalidates the cached listing
+    os.utime(base_directory, ns=(1, 1))
+    assert list(chunk_format.list(base_directory)) == file_paths[:2]
+    shutil.rmtree(base_directory, ignore_errors=True)
+
+
+@pytest.mark.parametrize("write_manifest", [True, False])
+def test_subdir_numbered_chunk_format_chunk_sizes_line_counts(write_manifest: bool):
+    base_directory = "/tmp/chunkio/subdir_numbered_chunk_format.txt"
+    shutil.rmtree(base_directory, ignore_errors=True)
+    os.makedirs(base_directory, exist_ok=True)
+
+    chunk_format = SubdirNumberedChunkFormat(compression="gzip")
+    chunks = ["a\nb\n", "cc\n", "ddd\neee"]
+    manifest = ChunkManifest()
+    for index, chunk in enumerate(chunks):
+        with open_chunk_file(chunk_format.format(base_directory, index), "wt") as file:
+            file.write(chunk)
+        manifest.append(index=index, file_name=f"chunk_{index}", lines=len(chunk.splitlines()), bytes=len(chunk))
+    if write_manifest:
+        manifest.write(chunk_format.manifest_path(base_directory))
+
+    assert chunk_format.chunk_sizes(base_directory) == [4, 3, 7]
+    assert chunk_format.chunk_line_counts(base_directory) == [2, 1, 2]
+    shutil.rmtree(base_directory, ignore_errors=True)
@@ -0,0 +1,72 @@
+import io
+import pytest
+import os
+import shutil
+
+from typing import List
+
+from chunkio.chunk_handler.chunker import MaxLineSequentialChunker
+from chunkio.chunk_handler.base_sequential_text_io_reader import BaseSequentialTextIOReader
+from chunkio.chunk_handler.base_sequential_text_io_writer import BaseSequentialTextIOWriter
+from chunkio.chunk_handler.background_sequential_io_writer import BackgroundSequentialIOWriter
+
+
+@pytest.mark.parametrize(
+    "max_lines, max_queue_size, writes", [
+        (2, 1, ["first\n", "sec", "ond\nt", "hi", "rd\n", "four", "th"]),
+        (3, 100, [f"line {i}\n" for i in range(100)]),
+    ]
+)
+def test_background_sequential_io_writer_write(max_lines: int, max_queue_size: int, writes: List[str]):
+    base_file_path = "/tmp/chunkio/background_sequential_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    _chunker = MaxLineSequentialChunker(max_lines=max_lines)
+    with BackgroundSequentialIOWriter(BaseSequentialTextIOWriter(base_file_path, mode="w", chunker=_chunker),
+                                      max_queue_size=max_queue_size) as file:
+        for _write in writes:
+            file.write(_write)
+        file.writelines(["last\n"])
+    with BaseSequentialTextIOReader(base_file_path, mode="r") as file:
+        observed_text = "".join(file)
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+    assert observed_text == "".join(writes) + "last\n"
+
+
+def test_background_sequential_io_writer_flush():
+    base_file_path = "/tmp/chunkio/background_sequential_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    _chunker = MaxLineSequentialChunker(max_lines=1)
+    with BackgroundSequentialIOWriter(BaseSequentialTextIOWriter(base_file_path, mode="w", chunker=_chunker)) as file:
+        file.writelines(["first\n", "second\n", "third\n"])
+        file.flush()
+        # All but the current chunk are complete after flushing, the current chunk is published on close
+        assert sorted(os.listdir(base_file_path)) == ["background_sequential_io_writer.000000.txt",
+                                                      "background_sequential_io_writer.000001.txt",
+                                                      "background_sequential_io_writer.000002.txt.tmp"]
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+
+
+def test_background_sequential_io_writer_error():
+    base_file_path = "/tmp/chunkio/background_sequential_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    file = BackgroundSequentialIOWriter(BaseSequentialTextIOWriter(base_file_path, mode="w"))
+    file.write(b"not text\n")  # Enqueued only, fails in the background thread
+    with pytest.raises(TypeError):
+        file.flush()
+    # The error is sticky, thus writes after catching it fail as well, instead of leaving a gap in the output
+    with pytest.raises(TypeError):
+        file.write("text\n")
+    with pytest.raises(TypeError):
+        file.writelines(["text\n"])
+    with pytest.raises(TypeError):
+        file.flush()
+    with pytest.raises(TypeError):
+        file.close()
+    assert file.closed
+    with pytest.raises(TypeError):
+        file.close()
+    with pytest.raises(ValueError):
+        file.write("closed\n")
+    with pytest.raises(io.UnsupportedOperation):
+        file.fileno()
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
@@ -1,10 +1,16 @@
 import pytest
+import io
 import os
+import shutil
+import threading
+import time
 
+from itertools import islice
 from typing import List
 
 from tests.utils import FileSystemBuilder
 from chunkio.chunk_handler import BaseSequentialTextIOReader, SubdirNumberedChunkFormat
+from chunkio.chunk_handler import BaseSequentialTextIOWriter, MaxLineSequentialChunker
 
 TEXT_WITH_EMPTY_FILES = "".join([
     "<test.txt/readlines.000000.txt>",
@@ -70,6 +76,37 @@ def test_base_sequential_text_io_reader_iter(data: str, expected_lines: List[str
         assert ten_lines == expected_lines
 
 
+@pytest.mark.parametrize(
+    "data, prefetch, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, 1, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 2, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 100, ["first line\n", "second line\n", "third line\n", "forth line\n"])
+    ]
+)
+def test_base_sequential_text_io_reader_prefetch(data: str, prefetch: int, expected_lines: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r", prefetch=prefetch) as file:
+            lines = [file.readline(4)]
+            lines.extend([line for line in file])
+        assert "".join(lines) == "".join(expected_lines)
+
+
+def test_base_sequential_text_io_reader_prefetch_open_args():
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(TEXT_WITH_EMPTY_FILES, base_path=_base_dir, keep_files=False) as _:
+        # Positional open arguments are forwarded as well, here buffering, encoding, errors and newline
+        with BaseSequentialTextIOReader(_base_file_path, -1, "ascii", "strict", "", mode="r", prefetch=2) as file:
+            assert list(file) == ["first line\n", "second line\n", "third line\n", "forth line\n"]
+            with pytest.raises(io.UnsupportedOperation):
+                file.fileno()
+
+    with pytest.raises(AssertionError):
+        BaseSequentialTextIOReader(_base_file_path, mode="r", prefetch=2, closefd=False)
+
+
 @pytest.mark.parametrize(
     "data, expected_lines", [
         (TEXT_WITH_EMPTY_FILES, ["firs", "t line\n", "second line\n", "third line\n", "forth ", "line\n", ""])
@@ -95,3 +132,317 @@ def test_base_sequential_text_io_reader_mixed_reads(data: str, expected_lines: L
             lines.extend(file.readlines())
             lines.extend([line for line in file])
     assert lines == expected_lines
+
+
+@pytest.mark.parametrize(
+    "data, num_lines", [
+        (TEXT_WITH_EMPTY_FILES, 0),
+        (TEXT_WITH_EMPTY_FILES, 1),
+        (TEXT_WITH_EMPTY_FILES, 2),
+        (TEXT_WITH_EMPTY_FILES, 3),
+        (TEXT_WITH_EMPTY_FILES, 4),
+    ]
+)
+def test_base_sequential_text_io_reader_tell_seek(data: str, num_lines: int):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            for _ in range(num_lines):
+                next(file)
+            position = file.tell()
+            expected_lines = [line for line in file]
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            assert file.seek(position) == position
+            assert file.tell() == position
+            observed_lines = [line for line in file]
+    assert observed_lines == expected_lines
+
+
+def test_base_sequential_text_io_reader_tell_after_next_and_readline():
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(TEXT_WITH_EMPTY_FILES, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            assert next(file) == "first line\n"
+            assert file.readline(6) == "second"
+            assert file.tell() == 17
+            assert next(file) == " line\n"
+            assert file.tell() == 23
+            assert file.seekable()
+
+
+@pytest.mark.parametrize(
+    "operations", [
+        ["batch", "next"],
+        ["batch", "tell", "next"],
+        ["lines", "next", "batch"],
+        ["next", "lines", "lines", "batch"],
+        ["readline", "batch", "next", "lines"],
+        ["tell", "batch", "readline", "next"],
+        ["batch", "batch", "lines"],  # Spans chunks
+    ]
+)
+def test_base_sequential_text_io_reader_tell_seek_mixed_iteration(operations: List[str]):
+    _base_file_path = "/tmp/chunkio/tell_seek.txt"
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+    os.makedirs(os.path.dirname(_base_file_path), exist_ok=True)
+    expected_lines = [f"line {i}\n" for i in range(12)]
+    with BaseSequentialTextIOWriter(_base_file_path, mode="w",
+                                    chunker=MaxLineSequentialChunker(max_lines=5)) as file:
+        file.writelines(expected_lines)
+
+    with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+        lines = []
+        for operation in operations:
+            if operation == "batch":
+                lines.extend(next(file.iter_batches(3)))
+            elif operation == "lines":
+                lines.extend(islice(file.iter_lines(), 2))
+            elif operation == "next":
+                lines.append(next(file))
+            elif operation == "readline":
+                lines.append(file.readline())
+            else:
+                file.tell()
+        position = file.tell()
+        assert lines == expected_lines[:len(lines)]
+        assert list(file) == expected_lines[len(lines):]
+    with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+        assert file.seek(position) == position
+        assert list(file) == expected_lines[len(lines):]
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+
+
+def test_base_sequential_text_io_reader_follow_not_seekable():
+    _base_file_path = "/tmp/chunkio/follow.txt"
+    os.makedirs(os.path.dirname(_base_file_path), exist_ok=True)
+    with BaseSequentialTextIOReader(_base_file_path, mode="r", follow=True, timeout=0.05) as reader:
+        assert not reader.seekable()
+        with pytest.raises(io.UnsupportedOperation):
+            reader.seek(0)
+        with pytest.raises(io.UnsupportedOperation):
+            reader.tell()
+
+
+@pytest.mark.parametrize(
+    "data, offset, whence, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, 0, 0, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 6, 0, ["line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 23, 0, ["third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, -5, 2, ["line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 0, 2, []),
+    ]
+)
+def test_base_sequential_text_io_reader_seek(data: str, offset: int, whence: int, expected_lines: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            file.seek(offset, whence)
+            lines = [line for line in file]
+    assert lines == expected_lines
+
+
+@pytest.mark.parametrize(
+    "data, line_index_step, start, stop, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, None, 0, 1, ["first line\n"]),
+        (TEXT_WITH_EMPTY_FILES, None, 1, 3, ["second line\n", "third line\n"]),
+        (TEXT_WITH_EMPTY_FILES, None, 3, 10, ["forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, None, 4, 10, []),
+        (TEXT_WITH_EMPTY_FILES, 1, 1, 4, ["second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 3, 1, 4, ["second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 3, 3, 4, ["forth line\n"]),
+    ]
+)
+def test_base_sequential_text_io_reader_lines(data: str,
+                                              line_index_step: int,
+                                              start: int,
+                                              stop: int,
+                                              expected_lines: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        if line_index_step is not None:
+            with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+                file.build_line_index(step=line_index_step)
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            first_line = file.readline()
+            lines = file.lines(start, stop)
+            # Random access does not change the position of the reader
+            second_line = file.readline()
+    assert lines == expected_lines
+    assert [first_line, second_line] == ["first line\n", "second line\n"]
+
+
+def test_base_sequential_text_io_reader_getline():
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(TEXT_WITH_EMPTY_FILES, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            file.build_line_index(step=1, persist=False)
+            assert file.getline(2) == "third line\n"
+            with pytest.raises(IndexError):
+                file.getline(4)
+
+
+@pytest.mark.parametrize(
+    "data, skip_lines, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, 0, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 1, ["second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 4, []),
+    ]
+)
+def test_base_sequential_text_io_reader_iter_lines(data: str, skip_lines: int, expected_lines: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            for _ in range(skip_lines):
+                file.readline()
+            lines = list(file.iter_lines())
+        assert lines == expected_lines
+
+
+@pytest.mark.parametrize(
+    "data, n_lines, expected_batches", [
+        (TEXT_WITH_EMPTY_FILES, 1, [["first line\n"], ["second line\n"], ["third line\n"], ["forth line\n"]]),
+        (TEXT_WITH_EMPTY_FILES, 3, [["first line\n", "second line\n", "third line\n"], ["forth line\n"]]),
+        (TEXT_WITH_EMPTY_FILES, 4, [["first line\n", "second line\n", "third line\n", "forth line\n"]]),
+        (TEXT_WITH_EMPTY_FILES, 100, [["first line\n", "second line\n", "third line\n", "forth line\n"]]),
+    ]
+)
+def test_base_sequential_text_io_reader_iter_batches(data: str, n_lines: int, expected_batches: List[List[str]]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            batches = list(file.iter_batches(n_lines))
+        assert batches == expected_batches
+
+
+@pytest.mark.parametrize(
+    "data, n, expected_blocks", [
+        (TEXT_WITH_EMPTY_FILES, 1, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 11, ["first line\n", "second line\n", "third line\n", "forth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 12, ["first line\nsecond line\n", "third line\nforth line\n"]),
+        (TEXT_WITH_EMPTY_FILES, 1000, ["first line\nsecond line\n", "third line\nforth line\n"]),
+    ]
+)
+def test_base_sequential_text_io_reader_iter_blocks(data: str, n: int, expected_blocks: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            blocks = list(file.iter_blocks(n))
+        assert blocks == expected_blocks
+
+
+@pytest.mark.parametrize(
+    "data, size, expected_reads", [
+        (TEXT_WITH_EMPTY_FILES, -1, ["first line\nsecond line\nthird line\nforth line\n", ""]),
+        (TEXT_WITH_EMPTY_FILES, None, ["first line\nsecond line\nthird line\nforth line\n", ""]),
+        (TEXT_WITH_EMPTY_FILES, 20, ["first line\nsecond li", "ne\nthird line\nforth ", "line\n", ""]),
+        (TEXT_WITH_EMPTY_FILES, 1000, ["first line\nsecond line\nthird line\nforth line\n", ""]),
+    ]
+)
+def test_base_sequential_text_io_reader_read(data: str, size: int, expected_reads: List[str]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r") as file:
+            reads = [file.read(size) for _ in range(len(expected_reads))]
+        assert reads == expected_reads
+
+
+@pytest.mark.parametrize(
+    "num_lines, max_lines, prefetch", [
+        (20, 3, 0),
+        (20, 3, 2),
+        (0, 3, 0),
+    ]
+)
+def test_base_sequential_text_io_reader_follow(num_lines: int, max_lines: int, prefetch: int):
+    _base_file_path = "/tmp/chunkio/follow.txt"
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+    os.makedirs(os.path.dirname(_base_file_path), exist_ok=True)
+    expected_lines = [f"line {i}\n" for i in range(num_lines)]
+    started = threading.Event()
+
+    def write():
+        with BaseSequentialTextIOWriter(_base_file_path, mode="w",
+                                        chunker=MaxLineSequentialChunker(max_lines=max_lines)) as file:
+            started.wait()
+            for line in expected_lines:
+                file.write(line)
+                time.sleep(0.001)
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r", follow=True, prefetch=prefetch, timeout=10) as file:
+            started.set()
+            lines = list(file)
+    finally:
+        started.set()
+        writer.join()
+    assert lines == expected_lines
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+
+
+def test_base_sequential_text_io_reader_follow_timeout():
+    _base_file_path = "/tmp/chunkio/follow.txt"
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+    os.makedirs(os.path.dirname(_base_file_path), exist_ok=True)
+    file = BaseSequentialTextIOWriter(_base_file_path, mode="w", chunker=MaxLineSequentialChunker(max_lines=1))
+    file.write("first\nsecond\n")  # The second chunk is published on close only
+    with BaseSequentialTextIOReader(_base_file_path, mode="r", follow=True, timeout=0.05) as reader:
+        assert reader.readline() == "first\n"
+        with pytest.raises(TimeoutError):
+            reader.readline()
+    file.close()
+    with BaseSequentialTextIOReader(_base_file_path, mode="r", follow=True, timeout=0.05) as reader:
+        assert reader.readlines() == ["first\n", "second\n"]
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "compression, prefetch", [
+        (None, 0),
+        (None, 2),
+        ("gzip", 0),
+    ]
+)
+def test_base_sequential_text_io_reader_follow_append(compression: str, prefetch: int):
+    _base_file_path = "/tmp/chunkio/follow.txt"
+    shutil.rmtree(_base_file_path, ignore_errors=True)
+    os.makedirs(os.path.dirname(_base_file_path), exist_ok=True)
+    chunk_format = SubdirNumberedChunkFormat(compression=compression)
+    expected_lines = [f"l{i}\n" for i in range(20)]
+    with BaseSequentialTextIOWriter(_base_file_path, mode="w", chunk_format=chunk_format,
+                                    chunker=MaxLineSequentialChunker(max_lines=5)) as file:
+        file.writelines(expected_lines[:3])
+
+    # Appending continues the last chunk, which the follower reads before it is replaced
+    appender = BaseSequentialTextIOWriter(_base_file_path, mode="a", chunk_format=chunk_format,
+                                          chunker=MaxLineSequentialChunker(max_lines=5))
+    started = threading.Event()
+
+    def append():
+        started.wait()
+        time.sleep(0.05)
+        appender.writelines(expected_lines[3:])
+        appender.close()
+
+    writer = threading.Thread(target=append)
+    writer.start()
+    try:
+        with BaseSequentialTextIOReader(_base_file_path, mode="r", chunk_format=chunk_format, follow=True,
+                                        prefetch=prefetch, timeout=10) as reader:
+            started.set()
+            lines = list(reader)
+    finally:
+        started.set()
+        writer.join()
+    assert lines == expected_lines
+    shutil.rmtree(_base_file_path, ignore_errors=True)
@@ -1,3 +1,4 @@
+import multiprocessing
 import pytest
 import os
 import shutil
@@ -6,6 +7,8 @@ from typing import List, Dict
 
 from chunkio.chunk_handler.chunker import MaxLineSequentialChunker
 from chunkio.chunk_handler.base_sequential_text_io_writer import BaseSequentialTextIOWriter
+from chunkio.chunk_handler.base_sequential_text_io_reader import BaseSequentialTextIOReader
+from chunkio.chunk_handler.format import SubdirNumberedChunkFormat
 
 
 @pytest.mark.parametrize(
@@ -96,3 +99,78 @@ def test_base_sequential_text_io_writer_mixed_writes():
     expected_data["base_sequential_text_io_writer.000001.txt"] = ["third\n", "fourth"]
     shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
     assert observed_data == expected_data
+
+
+def test_base_sequential_text_io_writer_suspend():
+    base_file_path = "/tmp/chunkio/base_sequential_text_io_writer_suspend.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    _chunker = MaxLineSequentialChunker(max_lines=2)
+    with BaseSequentialTextIOWriter(base_file_path, mode="w", chunker=_chunker) as file:
+        file.write("first\nsec")
+        file.suspend()  # The chunk is not published while suspended
+        assert not file.closed
+        assert os.listdir(base_file_path) == ["base_sequential_text_io_writer_suspend.000000.txt.tmp"]
+        file.write("ond\nthird\n")
+        file.suspend()
+    with BaseSequentialTextIOReader(base_file_path, mode="r") as file:
+        observed_lines = list(file)
+    assert observed_lines == ["first\n", "second\n", "third\n"]
+    assert [entry.lines for entry in file.chunk_format.read_manifest(base_file_path).entries] == [2, 1]
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+
+
+def test_base_sequential_text_io_writer_streaming():
+    base_file_path = "/tmp/chunkio/base_sequential_text_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    _chunker = MaxLineSequentialChunker(max_lines=3)
+    with BaseSequentialTextIOWriter(base_file_path, mode="w", chunker=_chunker) as file:
+        file._write_block_size = 8
+        file._writelines_batch_size = 2
+        assert file.write("first\nsecond\nthird\nfourth\n") == 26
+        file.writelines(f"line {i}\n" for i in range(5))  # Consumed in batches
+        file.write("sixth\nseventh\neighth\n")  # Exactly fills the last chunk, without opening an empty one
+
+    observed_data = dict()
+    for file_name in sorted(os.listdir(base_file_path)):
+        if file_name.endswith(".txt"):
+            with open(os.path.join(base_file_path, file_name), "r") as file:
+                observed_data[file_name] = [line for line in file]
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+    assert observed_data == {
+        "base_sequential_text_io_writer.000000.txt": ["first\n", "second\n", "third\n"],
+        "base_sequential_text_io_writer.000001.txt": ["fourth\n", "line 0\n", "line 1\n"],
+        "base_sequential_text_io_writer.000002.txt": ["line 2\n", "line 3\n", "line 4\n"],
+        "base_sequential_text_io_writer.000003.txt": ["sixth\n", "seventh\n", "eighth\n"],
+    }
+
+
+def _write_concurrently(args):
+    base_file_path, writer_id, compression = args
+    chunk_format = SubdirNumberedChunkFormat(compression=compression)
+    _chunker = MaxLineSequentialChunker(max_lines=3)
+    with BaseSequentialTextIOWriter(base_file_path, mode="w", chunker=_chunker, chunk_format=chunk_format,
+                                    concurrent=True, compression_workers=0) as file:
+        file.writelines(f"writer {writer_id}, line {i}\n" for i in range(20))
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_base_sequential_text_io_writer_concurrent(compression: str):
+    base_file_path = "/tmp/chunkio/base_sequential_text_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    os.makedirs(os.path.dirname(base_file_path), exist_ok=True)
+    num_writers = 4
+    with multiprocessing.Pool(num_writers) as pool:
+        pool.map(_write_concurrently, [(base_file_path, writer_id, compression) for writer_id in range(num_writers)])
+    # A later writer appends after the existing chunks
+    _write_concurrently((base_file_path, num_writers, compression))
+
+    chunk_files = list(SubdirNumberedChunkFormat().list(base_file_path))
+    assert len(chunk_files) == (num_writers + 1) * 7
+    assert not [file_name for file_name in os.listdir(base_file_path) if file_name.endswith((".tmp", ".part"))]
+    with BaseSequentialTextIOReader(base_file_path, mode="r") as file:
+        observed_lines = list(file)
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+    expected_lines = [f"writer {writer_id}, line {i}\n" for writer_id in range(num_writers + 1) for i in range(20)]
+    assert sorted(observed_lines) == sorted(expected_lines)
+    # Chunks of the later writer come last
+    assert observed_lines[-20:] == expected_lines[-20:]
@@ -0,0 +1,40 @@
+import os
+import shutil
+import pytest
+
+from chunkio.chunk_handler.compression import compress_file, open_chunk_file, uncompressed_size, \
+    split_compression_extension
+
+
+@pytest.mark.parametrize(
+    "file_path, expected", [
+        ("/tmp/test.txt.gz", ("/tmp/test.txt", ".gz")),
+        ("/tmp/test.txt.bz2", ("/tmp/test.txt", ".bz2")),
+        ("/tmp/test.txt.xz", ("/tmp/test.txt", ".xz")),
+        ("/tmp/test.txt", ("/tmp/test.txt", "")),
+        ("/tmp/test.txt.gz.tmp", ("/tmp/test.txt.gz.tmp", "")),
+    ]
+)
+def test_split_compression_extension(file_path: str, expected: tuple):
+    assert split_compression_extension(file_path) == expected
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz"])
+def test_compress_file(extension: str):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    source_file_path = os.path.join(tmp_dir, "compress_file.txt")
+    target_file_path = source_file_path + extension
+    with open(source_file_path, "w") as file:
+        file.write("first line\nsecond line\n")
+
+    compress_file(source_file_path, target_file_path)
+    with open_chunk_file(target_file_path, "r") as file:
+        lines = [line for line in file]
+    size = uncompressed_size(target_file_path)
+    remaining_files = os.listdir(tmp_dir)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert lines == ["first line\n", "second line\n"]
+    assert size == 23
+    assert remaining_files == [os.path.basename(target_file_path)]
@@ -0,0 +1,74 @@
+import pytest
+import os
+import shutil
+
+from collections import Counter
+
+from chunkio.list import list_chunks
+from chunkio.chunk_handler import BaseSequentialTextIOReader, BaseSequentialBinaryIOReader, SubdirNumberedChunkFormat
+from chunkio.chunk_handler.format import ChunkManifest
+from chunkio.chunk_handler.hash_partitioned_text_io_writer import HashPartitionedTextIOWriter, stable_hash
+from chunkio.chunk_handler.hash_partitioned_binary_io_writer import HashPartitionedBinaryIOWriter
+
+LINES = [f"customer_{i % 7},{i}\n" for i in range(100)]
+
+
+def _customer(line: str) -> str:
+    return line.split(",")[0]
+
+
+@pytest.mark.parametrize(
+    "num_partitions, max_open_files, buffer_size, compression", [
+        (1, 1, 1, None),
+        (4, 2, 16, None),
+        (10, 3, 1 << 16, None),
+        (4, 1, 8, "gzip"),
+    ]
+)
+def test_hash_partitioned_text_io_writer(num_partitions: int, max_open_files: int, buffer_size: int,
+                                         compression: str):
+    base_file_path = "/tmp/chunkio/hash_partitioned_text_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    os.makedirs(os.path.dirname(base_file_path), exist_ok=True)
+    chunk_format = SubdirNumberedChunkFormat(compression=compression)
+    with HashPartitionedTextIOWriter(base_file_path, mode="w", num_partitions=num_partitions, key=_customer,
+                                     chunk_format=chunk_format, max_open_files=max_open_files,
+                                     buffer_size=buffer_size) as file:
+        file.write("".join(LINES[:10]))
+        file.writelines(LINES[10:-1])
+        file.write(LINES[-1][:5])  # Incomplete lines are routed once they are complete
+        file.write(LINES[-1][5:])
+
+    # Every partition has its chunk, all lines of a customer are in the partition given by the stable hash
+    chunk_files = list(list_chunks(base_file_path))
+    assert len(chunk_files) == num_partitions
+    with BaseSequentialTextIOReader(base_file_path, mode="r") as file:
+        observed_lines = list(file)
+    assert Counter(observed_lines) == Counter(LINES)
+
+    manifest = ChunkManifest.read(chunk_format.manifest_path(base_file_path))
+    assert manifest.lines == len(LINES)
+    for entry in manifest.entries:
+        expected_lines = [line for line in LINES if stable_hash(_customer(line)) % num_partitions == entry.index]
+        assert entry.lines == len(expected_lines)
+        assert entry.bytes == len("".join(expected_lines))
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+
+
+def test_hash_partitioned_binary_io_writer():
+    base_file_path = "/tmp/chunkio/hash_partitioned_binary_io_writer.txt"
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Reset
+    os.makedirs(os.path.dirname(base_file_path), exist_ok=True)
+    with HashPartitionedBinaryIOWriter(base_file_path, mode="wb", num_partitions=3) as file:
+        file.writelines(line.encode() for line in LINES)
+        file.write(b"last line without linebreak")
+    with BaseSequentialBinaryIOReader(base_file_path, mode="rb") as file:
+        observed_lines = list(file)
+    shutil.rmtree(base_file_path, ignore_errors=True)  # Clean up
+    assert Counter(observed_lines) == Counter([line.encode() for line in LINES] + [b"last line without linebreak"])
+
+
+def test_stable_hash():
+    assert stable_hash("customer") == stable_hash(b"customer") == 2168032777
+    assert stable_hash(-5) == 2 ** 64 - 5 != stable_hash(5)
+    assert stable_hash(("a", 1)) == stable_hash(("a", 1))
@@ -0,0 +1,58 @@
+import pytest
+import shutil
+
+from chunkio.list import list_chunks
+from chunkio.chunk_handler import BaseSequentialTextIOReader, BaseSequentialBinaryIOReader, HivePartitionedChunkFormat
+from chunkio.chunk_handler.chunker import MaxLineSequentialChunker
+from chunkio.chunk_handler.hive_partitioned_text_io_writer import HivePartitionedTextIOWriter
+from chunkio.chunk_handler.hive_partitioned_binary_io_writer import HivePartitionedBinaryIOWriter
+
+LINES = [f"2026-10-{16 + i % 3},{i}\n" for i in range(20)]
+
+
+def _date(line):
+    return line[:10]
+
+
+@pytest.mark.parametrize(
+    "max_lines, buffer_size", [
+        (2, 1),
+        (100, 1 << 16),
+    ]
+)
+def test_hive_partitioned_text_io_writer(max_lines: int, buffer_size: int):
+    base_file_path = "/tmp/chunkio/hive_partitioned_text_io_writer.txt"
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Reset
+    with HivePartitionedTextIOWriter(base_file_path, mode="w", partition_format=HivePartitionedChunkFormat("date"),
+                                     partition=_date, chunker=MaxLineSequentialChunker(max_lines=max_lines),
+                                     buffer_size=buffer_size) as file:
+        file.write("".join(LINES[:5]))
+        file.writelines(LINES[5:])
+
+    for date in ["2026-10-16", "2026-10-17", "2026-10-18"]:
+        expected_lines = [line for line in LINES if line.startswith(date)]
+        # Only the chunks of the selected partition are listed and read
+        partition_format = HivePartitionedChunkFormat("date", partition_filter=[date])
+        chunk_files = list(partition_format.list(base_file_path))
+        assert len(chunk_files) == -(-len(expected_lines) // max_lines)
+        assert all(f"/date={date}/" in chunk_file for chunk_file in chunk_files)
+        with BaseSequentialTextIOReader(base_file_path, mode="r", chunk_format=partition_format) as file:
+            assert list(file) == expected_lines
+
+    expected_num_chunks = sum(-(-num_lines // max_lines) for num_lines in [7, 7, 6])
+    assert len(list(list_chunks(base_file_path, partition_by="date"))) == expected_num_chunks
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Clean up
+
+
+def test_hive_partitioned_binary_io_writer():
+    base_file_path = "/tmp/chunkio/hive_partitioned_binary_io_writer.txt"
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Reset
+    with HivePartitionedBinaryIOWriter(base_file_path, mode="wb", partition_format=HivePartitionedChunkFormat("date"),
+                                       partition=_date) as file:
+        file.writelines(line.encode() for line in LINES)
+    partition_format = HivePartitionedChunkFormat("date", partition_filter=lambda date: date != "2026-10-17")
+    with BaseSequentialBinaryIOReader(base_file_path, mode="rb", chunk_format=partition_format) as file:
+        observed_lines = list(file)
+    shutil.rmtree("/tmp/chunkio", ignore_errors=True)  # Clean up
+    assert observed_lines == sorted([line.encode() for line in LINES if not line.startswith("2026-10-17")],
+                                    key=lambda line: line[:10])
@@ -0,0 +1,94 @@
+import pytest
+import os
+import shutil
+
+from typing import List
+
+import chunkio
+from tests.utils import FileSystemBuilder
+from chunkio.chunk_handler import MmapSequentialBinaryReader
+
+TEXT_WITH_EMPTY_FILES = "".join([
+    "<test.txt/readlines.000000.txt>",
+    "",  # Start empty file
+    "<test.txt/readlines.000001.txt>",
+    "first line\nsecond line\n",
+    "<test.txt/readlines.000002.txt>",
+    "",  # Consequtive empty file
+    "<test.txt/readlines.000003.txt>",
+    "third line\nforth",
+    "<test.txt/readlines.000004.txt>",
+    " line\n\nsixth line"
+])
+
+
+@pytest.mark.parametrize(
+    "data, copy, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, False,
+         [b"first line\n", b"second line\n", b"third line\n", b"forth", b" line\n", b"\n", b"sixth line"]),
+        (TEXT_WITH_EMPTY_FILES, True,
+         [b"first line\n", b"second line\n", b"third line\n", b"forth", b" line\n", b"\n", b"sixth line"]),
+        ("<test.txt/readlines.000000.txt>", False, []),
+    ]
+)
+def test_mmap_sequential_binary_reader_iter_lines(data: str, copy: bool, expected_lines: List[bytes]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with MmapSequentialBinaryReader(_base_file_path, copy=copy) as file:
+            lines = [line if copy else bytes(line) for line in file]
+            assert all(isinstance(line, bytes if copy else memoryview) for line in file)
+        assert file.closed
+    assert lines == expected_lines
+
+
+@pytest.mark.parametrize(
+    "data, needle, expected_lines", [
+        (TEXT_WITH_EMPTY_FILES, b"line", [b"first line\n", b"second line\n", b"third line\n", b" line\n",
+                                          b"sixth line"]),
+        (TEXT_WITH_EMPTY_FILES, b"i", [b"first line\n", b"second line\n", b"third line\n", b" line\n",
+                                       b"sixth line"]),
+        (TEXT_WITH_EMPTY_FILES, b"fir", [b"first line\n"]),
+        (TEXT_WITH_EMPTY_FILES, b"th", [b"third line\n", b"forth", b"sixth line"]),
+        (TEXT_WITH_EMPTY_FILES, b"missing", []),
+    ]
+)
+def test_mmap_sequential_binary_reader_iter_lines_containing(data: str, needle: bytes, expected_lines: List[bytes]):
+    _base_dir = "/tmp/chunkio"
+    _base_file_path = os.path.join(_base_dir, "test.txt")
+    with FileSystemBuilder(data, base_path=_base_dir, keep_files=False) as _:
+        with MmapSequentialBinaryReader(_base_file_path) as file:
+            lines = [bytes(line) for line in file.iter_lines_containing(needle)]
+    assert lines == expected_lines
+
+
+def test_mmap_sequential_binary_reader_unmaps_chunks():
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    file_name = os.path.join(tmp_dir, "mmap_test.txt")
+    lines = [f"line {i}\n".encode() for i in range(10)]
+    with chunkio.open(file_name, mode="wb", max_lines=3) as file:
+        file.writelines(lines)
+    with chunkio.open(os.path.join(tmp_dir, "mmap_test.gz.txt"), mode="wb", max_lines=3, compression="gzip") as file:
+        file.writelines(lines)
+
+    maps = []
+    with MmapSequentialBinaryReader(file_name) as file:
+        read_lines = []
+        for line in file:
+            if file._current_map not in maps:
+                maps.append(file._current_map)
+            read_lines.append(bytes(line))
+            assert all(_map.closed for _map in maps[:-2])  # Previous chunks are unmapped
+    assert read_lines == lines
+    assert len(maps) == 4 and all(_map.closed for _map in maps[:-1])
+
+    # Views referencing a previous chunk stay valid
+    with MmapSequentialBinaryReader(file_name) as file:
+        kept_lines = list(file)
+    assert [bytes(line) for line in kept_lines] == lines
+
+    with MmapSequentialBinaryReader(os.path.join(tmp_dir, "mmap_test.gz.txt")) as file:
+        assert [bytes(line) for line in file] == lines
+    shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -23,7 +23,10 @@ def test_check_mode_passes(mode: str, accepted_mode: str):
         # Extra unsupported char
         ("rtx", "rt"),
         ("r+", "rt"),
-        ("at", "rt")
+        ("at", "rt"),
+        # Exclusive modes
+        ("wa", "wat"),
+        ("tb", "wtb")
     ]
 )
 def test_check_mode_assert(mode: str, accepted_mode: str):
@@ -0,0 +1,36 @@
+import os
+import pytest
+
+from typing import Optional
+
+from chunkio.chunk_handler.utils import copy_range
+
+
+@pytest.mark.parametrize(
+    "data, offset, size, target_offset, expected_copied, expected_data", [
+        (b"0123456789", 0, 10, None, 10, b"prefix0123456789"),
+        (b"0123456789", 3, 4, None, 4, b"prefix3456"),
+        (b"0123456789", 8, 4, None, 2, b"prefix89"),  # Source ends before
+        (b"0123456789", 0, 0, None, 0, b"prefix"),
+        (b"0123456789", 2, 3, 1, 3, b"p234ix"),
+        (b"0123456789", 0, 10, 6, 10, b"prefix0123456789"),
+    ]
+)
+def test_copy_range(data: bytes, offset: int, size: int, target_offset: Optional[int], expected_copied: int,
+                    expected_data: bytes):
+    source_file_path = "/tmp/chunkio/copy_range.source.txt"
+    target_file_path = "/tmp/chunkio/copy_range.target.txt"
+    os.makedirs(os.path.dirname(source_file_path), exist_ok=True)
+    with open(source_file_path, "wb") as file:
+        file.write(data)
+    with open(target_file_path, "wb") as file:
+        file.write(b"prefix")
+    with open(source_file_path, "rb") as source, open(target_file_path, "r+b") as target:
+        target.seek(0, os.SEEK_END)
+        copied = copy_range(source.fileno(), target.fileno(), offset, size, target_offset=target_offset)
+    with open(target_file_path, "rb") as file:
+        target_data = file.read()
+    os.remove(source_file_path)
+    os.remove(target_file_path)
+    assert copied == expected_copied
+    assert target_data == expected_data
@@ -0,0 +1,23 @@
+import os
+import pytest
+
+from chunkio.chunk_handler.utils import count_lines
+
+
+@pytest.mark.parametrize(
+    "data, block_size, expected_lines", [
+        (b"", 4, 0),
+        (b"line", 4, 1),
+        (b"line\n", 4, 1),
+        (b"line\nline", 4, 2),
+        (b"\n\nline\nline\n", 3, 4),
+    ]
+)
+def test_count_lines(data: bytes, block_size: int, expected_lines: int):
+    file_path = "/tmp/chunkio/count_lines.txt"
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "wb") as file:
+        file.write(data)
+    lines = count_lines(file_path, block_size=block_size)
+    os.remove(file_path)
+    assert lines == expected_lines
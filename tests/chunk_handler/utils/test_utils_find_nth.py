@@ -0,0 +1,21 @@
+import pytest
+
+from chunkio.chunk_handler.utils import find_nth
+
+
+@pytest.mark.parametrize(
+    "string, delimiter, n, start, expected", [
+        ("a\nb\nc\n", "\n", 1, 0, 2),
+        ("a\nb\nc\n", "\n", 3, 0, 6),
+        ("a\nb\nc\n", "\n", 4, 0, -1),
+        ("a\nb\nc\n", "\n", 1, 2, 4),
+        ("a<br>b<br>", "<br>", 2, 0, 10),
+        (b"a\nb\n", b"\n", 2, 0, 4),
+        # Long ranges are skipped by counting in windows
+        ("line\n" * 100_000, "\n", 99_999, 0, 499_995),
+        ("line\n" * 100_000, "\n", 100_000, 5, -1),
+        ("\n" * 10_000 + "x" * 100_000 + "\n", "\n", 10_001, 0, 110_001),
+    ]
+)
+def test_find_nth(string: str, delimiter: str, n: int, start: int, expected: int):
+    assert find_nth(string, delimiter, n, start) == expected
@@ -9,6 +9,7 @@ from chunkio.chunk_handler.utils import group_into_lines
     "delimiter, strings, expected_groups", [
         ("\n", ["fir", "st\n", "l", "i", "n", "e\n"], [["fir", "st\n"], ["l", "i", "n", "e\n"]]),
         ("\n", ["fir", "st\n", "l", "i", "n", "e"], [["fir", "st\n"], ["l", "i", "n", "e"]]),
+        (b"\n", [b"fir", b"st\n", b"l", b"ine"], [[b"fir", b"st\n"], [b"l", b"ine"]]),
     ]
 )
 def test_group_into_lines(delimiter: str, strings: List[str], expected_groups: List[List[str]]):
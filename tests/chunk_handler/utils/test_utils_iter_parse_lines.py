@@ -0,0 +1,25 @@
+import pytest
+
+from typing import List
+
+from chunkio.chunk_handler.utils import iter_parse_lines
+
+
+@pytest.mark.parametrize(
+    "delimiter, input_string, block_size, expected_blocks", [
+        ("\n", "", 4, []),
+        ("\n", "line", 4, [["line"]]),
+        ("\n", "line\nline\n", 100, [["line\n", "line\n"]]),
+        ("\n", "a\nb\nc\nd", 4, [["a\n", "b\n"], ["c\n", "d"]]),
+        ("\n", "a\nlong line\nb\n", 3, [["a\n"], ["long line\n"], ["b\n"]]),
+        ("\n", "long line without linebreak", 3, [["long line without linebreak"]]),
+        (b"\n", b"a\nb\nc\n", 2, [[b"a\n"], [b"b\n"], [b"c\n"]]),
+        ("<br>", "a<br>b<br>c", 6, [["a<br>"], ["b<br>", "c"]]),
+    ]
+)
+def test_iter_parse_lines(delimiter: str, input_string: str, block_size: int, expected_blocks: List[List[str]]):
+    observed_blocks = []
+    for block, lines in iter_parse_lines(input_string, delimiter=delimiter, block_size=block_size):
+        assert block == input_string[:0].join(lines)
+        observed_blocks.append(lines)
+    assert observed_blocks == expected_blocks
@@ -11,6 +11,7 @@ from chunkio.chunk_handler.utils import parse_lines
         ("\n", "line\nline\n", ["line\n", "line\n", ""]),
         ("\n", "line\nline", ["line\n", "line"]),
         ("\n", "\nline\n\nline\n\nline", ["\n", "line\n", "\n", "line\n", "\n", "line"]),
+        (b"\n", b"line\nline", [b"line\n", b"line"]),
         (
                 "<line break>",
                 "<line break>line<line break><line break>line<line break><line break>line",
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import pytest
+import shutil
+import chunkio
+
+from typing import List
+
+
+TEST_LINES = [f"line {i}, " + "x" * (i % 7) + "\n" for i in range(50)] + ["last line without linebreak"]
+
+
+async def _write(file_path: str, mode: str, lines: List[str], chunkio_kwargs: dict):
+    async with chunkio.aopen(file_path, mode, **chunkio_kwargs) as file:
+        for line in lines[:10]:
+            await file.write(line)
+        await file.writelines(lines[10:])
+
+
+async def _read(file_path: str, mode: str, chunkio_kwargs: dict) -> List[str]:
+    async with chunkio.aopen(file_path, mode, **chunkio_kwargs) as file:
+        return [line async for line in file]
+
+
+@pytest.mark.parametrize(
+    "binary, chunkio_kwargs", [
+        (False, dict(max_lines=3)),
+        (False, dict(max_lines=7, batch_size=16)),
+        (False, dict(max_bytes=100, batch_size=1)),
+        (True, dict(max_lines=4, batch_size=32)),
+    ]
+)
+def test_aopen(binary: bool, chunkio_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    file_path = os.path.join(tmp_dir, "chunkio_aopen_test.txt")
+    lines = [line.encode() for line in TEST_LINES] if binary else TEST_LINES
+    mode = "b" if binary else ""
+
+    asyncio.run(_write(file_path, "w" + mode, lines, chunkio_kwargs))
+    observed_lines = asyncio.run(_read(file_path, "r" + mode, chunkio_kwargs))
+
+    # Files are interchangeable with the synchronous API
+    with chunkio.open(file_path, "r" + mode) as file:
+        sync_lines = [line for line in file]
+
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert observed_lines == lines
+    assert sync_lines == lines
+
+
+def test_aopen_read_mixed():
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    file_path = os.path.join(tmp_dir, "chunkio_aopen_test.txt")
+    with chunkio.open(file_path, "w", max_lines=2) as file:
+        file.writelines(TEST_LINES)
+
+    async def _read_mixed():
+        file = await chunkio.aopen(file_path, "r", batch_size=16)
+        first = await file.__anext__()
+        second = await file.readline()
+        head = await file.read(4)
+        rest = await file.readlines()
+        await file.close()
+        return [first, second, head] + rest
+
+    observed_lines = asyncio.run(_read_mixed())
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert "".join(observed_lines) == "".join(TEST_LINES)
+    assert observed_lines[:3] == TEST_LINES[:2] + [TEST_LINES[2][:4]]
+
+
+def _read_chunks(file_path: str) -> dict:
+    chunks = {}
+    for root, _, files in os.walk(file_path):
+        for name in files:
+            with open(os.path.join(root, name), "rb") as file:
+                chunks[os.path.relpath(os.path.join(root, name), file_path)] = file.read()
+    return chunks
+
+
+@pytest.mark.parametrize(
+    "chunkio_kwargs, batch_size", [
+        (dict(max_lines=1), 1024),
+        (dict(max_lines=2), 1),
+        (dict(max_bytes=5), 1024),
+    ]
+)
+def test_aopen_write_chunks_match_sync(chunkio_kwargs: dict, batch_size: int):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    sync_path = os.path.join(tmp_dir, "sync", "chunkio_aopen_test.txt")
+    async_path = os.path.join(tmp_dir, "async", "chunkio_aopen_test.txt")
+    os.makedirs(os.path.dirname(sync_path))
+    os.makedirs(os.path.dirname(async_path))
+    data, lines = "a\nb\nc\n", ["d\ne\n", "f\n"]
+
+    with chunkio.open(sync_path, "w", **chunkio_kwargs) as file:
+        file.write(data)
+        file.writelines(lines)
+
+    async def _write_mixed():
+        async with chunkio.aopen(async_path, "w", batch_size=batch_size, **chunkio_kwargs) as file:
+            await file.write(data)
+            await file.writelines(lines)
+
+    asyncio.run(_write_mixed())
+    sync_chunks, async_chunks = _read_chunks(sync_path), _read_chunks(async_path)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert len(async_chunks) > 2
+    assert async_chunks == sync_chunks
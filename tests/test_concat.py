@@ -0,0 +1,73 @@
+import io
+import os
+import shutil
+import pytest
+import chunkio
+
+from typing import Optional
+
+from chunkio.chunk_handler.format import ChunkManifest
+
+
+TEST_DATA = "".join(f"line {i}{'x' * (i % 7)}\n" for i in range(100))
+
+
+@pytest.mark.parametrize(
+    "data, chunkio_kwargs, processes, remove_manifest", [
+        (TEST_DATA, dict(max_lines=7), 1, False),
+        (TEST_DATA, dict(max_lines=7), 2, False),
+        (TEST_DATA, dict(max_lines=7), 2, True),
+        (TEST_DATA, dict(max_lines=7), None, False),
+        (TEST_DATA + "incomplete", dict(max_bytes=64), 3, False),
+        (TEST_DATA, dict(max_lines=7, compression="gzip"), 1, False),
+        (TEST_DATA, dict(max_lines=7, compression="gzip"), 2, False),
+        ("", dict(max_lines=7), 2, False),
+    ]
+)
+def test_concat(data: str, chunkio_kwargs: dict, processes: Optional[int], remove_manifest: bool):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_concat_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", **chunkio_kwargs) as file:
+        file.write(data)
+    if remove_manifest:
+        os.remove(os.path.join(chunkio_file_name, ChunkManifest.file_name))
+
+    target_file_name = os.path.join(tmp_dir, "chunkio_concat_test.concat.txt")
+    size = chunkio.concat(chunkio_file_name, target_file_name, processes=processes)
+    with open(target_file_name, "rb") as file:
+        concatenated_data = file.read()
+    assert sorted(os.listdir(tmp_dir)) == ["chunkio_concat_test.concat.txt", "chunkio_concat_test.txt"]
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert concatenated_data == data.encode()
+    assert size == len(concatenated_data)
+
+
+@pytest.mark.parametrize(
+    "chunkio_kwargs, use_file", [
+        (dict(max_lines=7), True),
+        (dict(max_lines=7), False),
+        (dict(max_lines=7, compression="gzip"), True),
+        (dict(max_lines=7, compression="gzip"), False),
+    ]
+)
+def test_to_fileobj(chunkio_kwargs: dict, use_file: bool):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_to_fileobj_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", **chunkio_kwargs) as file:
+        file.write(TEST_DATA)
+
+    target_file_name = os.path.join(tmp_dir, "chunkio_to_fileobj_test.concat.txt")
+    with (open(target_file_name, "w+b") if use_file else io.BytesIO()) as fileobj:
+        fileobj.write(b"header\n")  # Buffered content is written first
+        size = chunkio.to_fileobj(chunkio_file_name, fileobj)
+        assert fileobj.tell() == len(b"header\n") + size
+        fileobj.write(b"footer\n")
+        fileobj.seek(0)
+        concatenated_data = fileobj.read()
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert concatenated_data == b"header\n" + TEST_DATA.encode() + b"footer\n"
+    assert size == len(TEST_DATA.encode())
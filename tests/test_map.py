@@ -0,0 +1,59 @@
+import os
+import shutil
+import pytest
+import chunkio
+
+from chunkio.list import list_chunks
+
+from typing import IO, List
+
+
+TEST_LINES = [f"line {i}\n" for i in range(10)]
+
+
+def count_lines(file: IO) -> int:
+    return sum(1 for _ in file)
+
+
+def upper_lines(file: IO) -> List[str]:
+    return [line.upper() for line in file]
+
+
+@pytest.mark.parametrize(
+    "max_lines, ordered, expected_counts", [
+        (3, True, [3, 3, 3, 1]),
+        (3, False, [1, 3, 3, 3]),
+        (100, True, [10]),
+    ]
+)
+def test_map(max_lines: int, ordered: bool, expected_counts: List[int]):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    file_name = os.path.join(tmp_dir, "chunkio_map_test.txt")
+    with chunkio.open(file_name, mode="w", max_lines=max_lines) as file:
+        file.writelines(TEST_LINES)
+
+    counts = chunkio.map(file_name, count_lines, processes=2, ordered=ordered)
+    if not ordered:
+        counts = sorted(counts)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert counts == expected_counts
+
+
+def test_map_output_file_path():
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    file_name = os.path.join(tmp_dir, "chunkio_map_test.txt")
+    output_file_name = os.path.join(tmp_dir, "chunkio_map_output_test.txt")
+    with chunkio.open(file_name, mode="w", max_lines=3) as file:
+        file.writelines(TEST_LINES)
+
+    output_chunks = list(chunkio.imap(file_name, upper_lines, processes=2, output_file_path=output_file_name))
+    with chunkio.open(output_file_name, mode="r") as file:
+        observed_lines = [line for line in file]
+    expected_chunks = list(list_chunks(output_file_name))
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    assert output_chunks == expected_chunks
+    assert observed_lines == [line.upper() for line in TEST_LINES]
@@ -1,3 +1,4 @@
+import io
 import os
 import pytest
 import shutil
@@ -6,6 +7,9 @@ import builtins
 
 from typing import List
 
+from chunkio.list import list_chunks
+from chunkio.chunk_handler.compression import COMPRESSION_EXTENSIONS
+
 
 TEST_DATA_FUll = [
     "Lorem ipsum dolor sit amet, consetetur sadipscing elitr, "
@@ -65,6 +69,11 @@ TEST_DATA_FRAGMENTED_RANDOM = [
     (TEST_DATA_FUll, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
     (TEST_DATA_FRAGMENTED_LINEBREAKS, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
     (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
+    (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_lines=2, prefetch=2)),
+    (TEST_DATA_FUll, [], [], dict(), dict(max_bytes=64)),
+    (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_bytes=64)),
+    (TEST_DATA_FRAGMENTED_LINEBREAKS, [], [], dict(), dict(max_lines=1, max_bytes=1024)),
+    (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_lines=2, background=4)),
 ])
 def test_open_write(data: List[str],
                     builtins_args: list,
@@ -108,6 +117,8 @@ def test_open_write(data: List[str],
     (TEST_DATA_FUll, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
     (TEST_DATA_FRAGMENTED_LINEBREAKS, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
     (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_lines=2, keep_extension=False, index_format="04d", verbose=False)),
+    (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_bytes=64)),
+    (TEST_DATA_FRAGMENTED_RANDOM, [], [], dict(), dict(max_lines=2, background=1)),
 ])
 def test_open_writelines(data: List[str],
                     builtins_args: list,
@@ -135,3 +146,268 @@ def test_open_writelines(data: List[str],
     assert chunkio_read_data == expected_read_data
     shutil.rmtree(tmp_dir, ignore_errors=True)
 
+
+
+@pytest.mark.parametrize(
+    "data, chunkio_kwargs", [
+    (TEST_DATA_FUll, dict(max_lines=1)),
+    (TEST_DATA_FRAGMENTED_RANDOM, dict(max_lines=2)),
+    (TEST_DATA_FRAGMENTED_LINEBREAKS, dict(max_lines=2, prefetch=2)),
+])
+def test_open_binary(data: List[str], chunkio_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_binary_test.txt")
+    builtin_file_name = os.path.join(tmp_dir, "builtin_open_binary_test.txt")
+
+    # Write files
+    with (chunkio.open(chunkio_file_name, mode="wb", **chunkio_kwargs) as chunkio_file,
+          builtins.open(builtin_file_name, mode="wb") as builtins_file):
+        for text in data:
+            chunkio_file.write(text.encode())
+            builtins_file.write(text.encode())
+
+    # Read files to check
+    with (chunkio.open(chunkio_file_name, mode="rb", **chunkio_kwargs) as chunkio_file,
+          builtins.open(builtin_file_name, mode="rb") as builtins_file):
+        chunkio_read_data = [line for line in chunkio_file]
+        expected_read_data = [line for line in builtins_file]
+
+    assert chunkio_read_data == expected_read_data
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "data, chunkio_kwargs", [
+    (TEST_DATA_FUll, dict(max_lines=1)),
+    (TEST_DATA_FRAGMENTED_RANDOM, dict(max_lines=2, prefetch=2)),
+    (TEST_DATA_FRAGMENTED_RANDOM, dict(max_lines=2, compression="gzip")),
+])
+def test_open_binary_read(data: List[str], chunkio_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_binary_test.txt")
+    expected_data = "".join(data).encode()
+
+    with chunkio.open(chunkio_file_name, mode="wb", **chunkio_kwargs) as chunkio_file:
+        chunkio_file.writelines(text.encode() for text in data)
+
+    # Block oriented consumers see one contiguous stream
+    with chunkio.open(chunkio_file_name, mode="rb", **chunkio_kwargs) as chunkio_file:
+        copy = io.BytesIO()
+        shutil.copyfileobj(chunkio_file, copy, 7)
+    assert copy.getvalue() == expected_data
+
+    with chunkio.open(chunkio_file_name, mode="rb", **chunkio_kwargs) as chunkio_file:
+        buffer = bytearray(len(expected_data) + 10)
+        assert chunkio_file.readinto(buffer) == len(expected_data)
+        assert chunkio_file.readinto(buffer) == 0
+    assert bytes(buffer[:len(expected_data)]) == expected_data
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "mode, chunkio_kwargs", [
+    ("", dict(max_lines=1)),
+    ("b", dict(max_lines=2)),
+    ("", dict(max_lines=2, prefetch=2)),
+])
+def test_open_tell_seek(mode: str, chunkio_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_tell_seek_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w" + mode, **chunkio_kwargs) as chunkio_file:
+        chunkio_file.writelines([line.encode() if mode else line for line in TEST_DATA_FRAGMENTED_LINEBREAKS])
+
+    with chunkio.open(chunkio_file_name, mode="r" + mode, **chunkio_kwargs) as chunkio_file:
+        _ = [next(chunkio_file) for _ in range(3)]
+        checkpoint = chunkio_file.tell()
+        expected_read_data = [line for line in chunkio_file]
+    with chunkio.open(chunkio_file_name, mode="r" + mode, **chunkio_kwargs) as chunkio_file:
+        chunkio_file.seek(checkpoint)
+        chunkio_read_data = [line for line in chunkio_file]
+
+    assert chunkio_read_data == expected_read_data
+    assert len(chunkio_read_data) == 3
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "data, compression, chunkio_kwargs", [
+    (TEST_DATA_FUll, "gzip", dict(max_lines=1)),
+    (TEST_DATA_FRAGMENTED_RANDOM, "bz2", dict(max_lines=2, compression_workers=0)),
+    (TEST_DATA_FRAGMENTED_LINEBREAKS, "lzma", dict(max_lines=2, compresslevel=1)),
+    (TEST_DATA_FRAGMENTED_LINEBREAKS, "gzip", dict(max_lines=2, prefetch=2)),
+])
+def test_open_compression(data: List[str], compression: str, chunkio_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_compression_test.txt")
+    builtin_file_name = os.path.join(tmp_dir, "builtin_open_compression_test.txt")
+
+    # Write files
+    with (chunkio.open(chunkio_file_name, mode="w", compression=compression, **chunkio_kwargs) as chunkio_file,
+          builtins.open(builtin_file_name, mode="w") as builtins_file):
+        chunkio_file.writelines(data)
+        builtins_file.writelines(data)
+
+    # Read files to check, the compression is detected from the file extension
+    with (chunkio.open(chunkio_file_name, mode="r", **chunkio_kwargs) as chunkio_file,
+          builtins.open(builtin_file_name, mode="r") as builtins_file):
+        chunkio_read_data = [line for line in chunkio_file]
+        expected_read_data = [line for line in builtins_file]
+
+    chunk_files = list(list_chunks(chunkio_file_name))
+    assert chunkio_read_data == expected_read_data
+    assert chunk_files and all(chunk_file.endswith(".txt" + COMPRESSION_EXTENSIONS[compression])
+                               for chunk_file in chunk_files)
+    assert len(os.listdir(chunkio_file_name)) == len(chunk_files) + 1  # No temporary files, besides the manifest
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "mode, num_partitions", [
+    ("", 3),
+    ("b", 5),
+])
+def test_open_hash_partitions(mode: str, num_partitions: int):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_partitions_test.txt")
+    lines = [f"{i % 4},{i}\n" for i in range(40)]
+    if mode == "b":
+        lines = [line.encode() for line in lines]
+
+    with chunkio.open(chunkio_file_name, mode="w" + mode, num_partitions=num_partitions,
+                      partition_key=lambda line: line[:1]) as chunkio_file:
+        chunkio_file.writelines(lines)
+
+    assert len(list(list_chunks(chunkio_file_name))) == num_partitions
+    with chunkio.open(chunkio_file_name, mode="r" + mode) as chunkio_file:
+        chunkio_read_data = [line for line in chunkio_file]
+    assert sorted(chunkio_read_data) == sorted(lines)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_open_hive_partitions():
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_partitions_test.txt")
+    lines = [f"2026-10-{16 + i % 3},{i}\n" for i in range(30)]
+
+    with chunkio.open(chunkio_file_name, mode="w", max_lines=4, partition_by="date",
+                      partition_value=lambda line: line[:10]) as chunkio_file:
+        chunkio_file.writelines(lines)
+
+    with chunkio.open(chunkio_file_name, mode="r", partition_by="date", partition_filter=["2026-10-18"]) as chunkio_file:
+        chunkio_read_data = [line for line in chunkio_file]
+    assert chunkio_read_data == [line for line in lines if line.startswith("2026-10-18")]
+
+    # Appending continues existing partitions and starts new ones
+    appended_lines = [f"2026-10-{18 + i % 2},{i}\n" for i in range(30, 40)]
+    with chunkio.open(chunkio_file_name, mode="a", max_lines=4, partition_by="date",
+                      partition_value=lambda line: line[:10]) as chunkio_file:
+        chunkio_file.writelines(appended_lines)
+    with chunkio.open(chunkio_file_name, mode="r", partition_by="date") as chunkio_file:
+        chunkio_read_data = [line for line in chunkio_file]
+    assert chunkio_read_data == sorted(lines + appended_lines, key=lambda line: line[:10])
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_open_hash_partitions_append():
+    with pytest.raises(AssertionError):
+        chunkio.open("/tmp/chunkio/chunkio_open_partitions_test.txt", mode="a", num_partitions=3)
+
+
+@pytest.mark.parametrize(
+    "mode, chunkio_kwargs, remove_manifest", [
+    ("", dict(max_lines=3), False),
+    ("", dict(max_lines=3), True),
+    ("b", dict(max_lines=4), False),
+    ("", dict(max_bytes=64), False),
+    ("", dict(max_lines=3, compression="gzip"), False),
+])
+def test_open_append(mode: str, chunkio_kwargs: dict, remove_manifest: bool):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_append_test.txt")
+    lines = [f"line {i}\n" for i in range(20)]
+    data = ["".join(lines[:5]), "".join(lines[5:11]) + "incomplete ", "line\n" + "".join(lines[11:])]
+    if mode == "b":
+        data = [text.encode() for text in data]
+
+    # Append to a new file first, then to the existing chunks
+    manifest_path = os.path.join(chunkio_file_name, ".chunkio-manifest.json")
+    for text in data:
+        published_chunks = list(list_chunks(chunkio_file_name)) if os.path.isdir(chunkio_file_name) else []
+        with chunkio.open(chunkio_file_name, mode="a" + mode, **chunkio_kwargs) as chunkio_file:
+            # The continued chunk stays published, only the manifest marking the end is removed
+            assert not os.path.isfile(manifest_path)
+            assert list(list_chunks(chunkio_file_name)) == published_chunks
+            chunkio_file.write(text)
+        if remove_manifest and os.path.isfile(manifest_path):
+            os.remove(manifest_path)
+
+    with chunkio.open(chunkio_file_name, mode="w" + mode, **chunkio_kwargs) as chunkio_file:
+        chunkio_file.write(data[0][:0].join(data))
+    expected_chunks = [os.path.basename(path) for path in list_chunks(chunkio_file_name)]
+    with chunkio.open(chunkio_file_name, mode="r" + mode) as chunkio_file:
+        expected_read_data = [line for line in chunkio_file]
+    shutil.rmtree(chunkio_file_name)
+
+    for text in data:
+        with chunkio.open(chunkio_file_name, mode="a" + mode, **chunkio_kwargs) as chunkio_file:
+            chunkio_file.write(text)
+    observed_chunks = [os.path.basename(path) for path in list_chunks(chunkio_file_name)]
+    with chunkio.open(chunkio_file_name, mode="r" + mode) as chunkio_file:
+        chunkio_read_data = [line for line in chunkio_file]
+
+    assert chunkio_read_data == expected_read_data
+    assert observed_chunks == expected_chunks
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("kwargs", [dict(newline="\r\n"), dict(encoding="utf-16"), dict(encoding="utf-8-sig")])
+def test_open_write_max_bytes_on_disk(kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_write_test.txt")
+    lines = [f"line {i}{'ä' * (i % 5)}\n" for i in range(200)]
+    with chunkio.open(chunkio_file_name, mode="w", max_bytes=64, **kwargs) as file:
+        file.writelines(lines)
+
+    chunk_files = list(list_chunks(chunkio_file_name))
+    assert len(chunk_files) > 1
+    assert all(os.path.getsize(chunk_file) <= 64 for chunk_file in chunk_files)
+    with chunkio.open(chunkio_file_name, mode="r", **kwargs) as file:
+        assert [line.replace("\r\n", "\n") for line in file] == lines
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize("mode", ["", "b"])
+def test_open_cache_listing(mode: str):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_open_cache_listing_test.txt")
+    lines = [f"line {i}\n" for i in range(10)]
+    if mode == "b":
+        lines = [line.encode() for line in lines]
+    with chunkio.open(chunkio_file_name, mode="w" + mode, max_lines=3) as chunkio_file:
+        chunkio_file.writelines(lines)
+
+    os.remove(os.path.join(chunkio_file_name, ".chunkio-manifest.json"))  # Chunks are listed from the directory
+    for _ in range(2):
+        os.utime(chunkio_file_name, ns=(0, 0))  # Not recently modified, thus the listing is cached
+        with chunkio.open(chunkio_file_name, mode="r" + mode, cache_listing=True) as chunkio_file:
+            assert chunkio_file.chunk_format.cache_listing
+            assert list(chunkio_file) == lines
+    shutil.rmtree(tmp_dir, ignore_errors=True)
@@ -0,0 +1,110 @@
+import os
+import shutil
+import pytest
+import chunkio
+
+from chunkio.list import list_chunks
+from chunkio.chunk_handler.compression import open_chunk_file
+from chunkio.chunk_handler.format import ChunkManifest
+
+
+TEST_DATA = "".join(f"line {i}{'x' * (i % 7)}\n" for i in range(100))
+TAIL_DATA = "".join(f"l{i}\n" for i in range(2000)) + "tail"  # 2001 lines, the last one without delimiter
+
+
+@pytest.mark.parametrize(
+    "data, source_kwargs, rechunk_kwargs, expected_kwargs, remove_manifest", [
+        (TEST_DATA, dict(max_lines=7), dict(max_lines=10), dict(max_lines=10), False),
+        (TEST_DATA, dict(max_lines=10), dict(max_lines=7), dict(max_lines=7), False),
+        (TEST_DATA, dict(max_lines=10), dict(max_lines=30), dict(max_lines=30), False),
+        (TEST_DATA, dict(max_lines=10), dict(max_lines=1000), dict(max_lines=1000), False),
+        (TEST_DATA, dict(max_lines=10), dict(max_lines=7), dict(max_lines=7), True),
+        (TEST_DATA + "incomplete", dict(max_lines=10), dict(max_lines=7), dict(max_lines=7), False),
+        (TEST_DATA + "incomplete", dict(max_lines=7), dict(max_lines=101), dict(max_lines=101), True),
+        (TEST_DATA, dict(max_lines=7), dict(n_chunks=4), dict(max_lines=25), False),
+        (TEST_DATA, dict(max_lines=7), dict(max_bytes=128), dict(max_bytes=128), False),
+        (TEST_DATA, dict(max_bytes=64), dict(max_bytes=200, max_lines=12), dict(max_bytes=200, max_lines=12), True),
+        (TEST_DATA, dict(max_lines=7, compression="gzip"), dict(max_lines=10), dict(max_lines=10), False),
+        (TEST_DATA, dict(max_lines=7), dict(max_lines=10, compression="bz2"), dict(max_lines=10, compression="bz2"),
+         False),
+        ("", dict(max_lines=7), dict(max_lines=10), dict(max_lines=10), False),
+        (TAIL_DATA, dict(max_lines=37), dict(max_lines=100), dict(max_lines=100), False),
+        (TAIL_DATA, dict(max_lines=37), dict(max_lines=100), dict(max_lines=100), True),
+        (TAIL_DATA, dict(max_lines=37), dict(max_lines=1), dict(max_lines=1), False),
+        (TAIL_DATA, dict(max_lines=37), dict(n_chunks=3), dict(max_lines=667), False),
+        (TAIL_DATA, dict(max_lines=37), dict(n_chunks=23), dict(max_lines=87), False),
+    ]
+)
+def test_rechunk(data: str, source_kwargs: dict, rechunk_kwargs: dict, expected_kwargs: dict, remove_manifest: bool):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_rechunk_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", **source_kwargs) as file:
+        file.write(data)
+    if remove_manifest:
+        os.remove(os.path.join(chunkio_file_name, ChunkManifest.file_name))
+
+    expected_file_name = os.path.join(tmp_dir, "expected", "chunkio_rechunk_test.txt")
+    os.makedirs(os.path.dirname(expected_file_name))
+    with chunkio.open(expected_file_name, mode="w", **expected_kwargs) as file:
+        file.write(data)
+
+    chunk_file_paths = chunkio.rechunk(chunkio_file_name, block_size=16, **rechunk_kwargs)
+    assert chunk_file_paths == list(list_chunks(chunkio_file_name))
+
+    expected_chunks = list(list_chunks(expected_file_name))
+    assert [os.path.basename(path) for path in chunk_file_paths] == [os.path.basename(path) for path in expected_chunks]
+    for chunk_file_path, expected_chunk_file_path in zip(chunk_file_paths, expected_chunks):
+        with open_chunk_file(chunk_file_path, "rb") as file, open_chunk_file(expected_chunk_file_path, "rb") as expected:
+            assert file.read() == expected.read()
+    assert sorted(os.listdir(chunkio_file_name)) == sorted(os.listdir(expected_file_name))
+    assert sorted(os.listdir(tmp_dir)) == ["chunkio_rechunk_test.txt", "expected"]  # No staging directories left
+
+    manifest = ChunkManifest.read(os.path.join(chunkio_file_name, ChunkManifest.file_name))
+    expected_manifest = ChunkManifest.read(os.path.join(expected_file_name, ChunkManifest.file_name))
+    assert manifest.entries == expected_manifest.entries
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@pytest.mark.parametrize(
+    "data, n_chunks, expected_line_counts", [
+        (TEST_DATA, 3, [34, 33, 33]),
+        (TEST_DATA, 7, [15, 15, 14, 14, 14, 14, 14]),
+        (TEST_DATA + "incomplete", 2, [51, 50]),
+        ("".join(f"line {i}\n" for i in range(3)), 5, [1, 1, 1]),
+    ]
+)
+def test_rechunk_n_chunks(data: str, n_chunks: int, expected_line_counts: list):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_rechunk_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", max_lines=7) as file:
+        file.write(data)
+
+    chunk_file_paths = chunkio.rechunk(chunkio_file_name, n_chunks=n_chunks, block_size=16)
+    observed_chunks = []
+    for chunk_file_path in chunk_file_paths:
+        with open(chunk_file_path, "r") as file:
+            observed_chunks.append(file.read())
+    assert [len(chunk.splitlines()) for chunk in observed_chunks] == expected_line_counts
+    assert "".join(observed_chunks) == data
+    manifest = ChunkManifest.read(os.path.join(chunkio_file_name, ChunkManifest.file_name))
+    assert [entry.lines for entry in manifest.entries] == expected_line_counts
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def test_rechunk_links_whole_chunks():
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_rechunk_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", max_lines=10) as file:
+        file.write(TEST_DATA)
+    inodes = [os.stat(path).st_ino for path in list_chunks(chunkio_file_name)]
+
+    # Chunks which already fit are neither read nor copied
+    chunk_file_paths = chunkio.rechunk(chunkio_file_name, max_bytes=1 << 20, max_lines=10)
+    assert [os.stat(path).st_ino for path in chunk_file_paths] == inodes
+    shutil.rmtree(tmp_dir, ignore_errors=True)
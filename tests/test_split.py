@@ -0,0 +1,62 @@
+import os
+import shutil
+import pytest
+import chunkio
+
+from chunkio.list import list_chunks
+from chunkio.chunk_handler.compression import open_chunk_file
+from chunkio.chunk_handler.format import ChunkManifest
+
+
+TEST_DATA = "".join(f"line {i}{'x' * (i % 7)}\n" for i in range(100))
+
+
+@pytest.mark.parametrize(
+    "data, split_kwargs", [
+        (TEST_DATA, dict(max_lines=7)),
+        (TEST_DATA, dict(max_lines=10)),  # Last chunk is full
+        (TEST_DATA, dict(max_lines=1000)),
+        (TEST_DATA + "incomplete", dict(max_lines=10)),
+        (TEST_DATA + "incomplete", dict(max_lines=7)),
+        (TEST_DATA, dict(max_lines=7, processes=2, block_size=16)),  # Boundaries spread over several byte ranges
+        (TEST_DATA, dict(max_lines=1, processes=3, block_size=5)),
+        ("", dict(max_lines=7)),
+        ("\n\n\n", dict(max_lines=2)),
+        (TEST_DATA, dict(max_bytes=64)),
+        (TEST_DATA, dict(max_bytes=64, block_size=4)),
+        (TEST_DATA, dict(max_bytes=5)),  # Lines exceeding max_bytes
+        (TEST_DATA + "incomplete", dict(max_bytes=64)),
+        (TEST_DATA, dict(max_bytes=64, max_lines=3)),
+        ("", dict(max_bytes=64)),
+        (TEST_DATA, dict(max_lines=7, compression="gzip")),
+    ]
+)
+def test_split(data: str, split_kwargs: dict):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    source_file_name = os.path.join(tmp_dir, "chunkio_split_test.source.txt")
+    with open(source_file_name, "wb") as file:
+        file.write(data.encode())
+
+    open_kwargs = {key: value for key, value in split_kwargs.items() if key in ["max_lines", "max_bytes", "compression"]}
+    expected_file_name = os.path.join(tmp_dir, "expected", "chunkio_split_test.txt")
+    os.makedirs(os.path.dirname(expected_file_name))
+    with chunkio.open(expected_file_name, mode="wb", **open_kwargs) as file:
+        file.write(data.encode())
+
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_split_test.txt")
+    chunk_file_paths = chunkio.split(source_file_name, chunkio_file_name, **split_kwargs)
+    assert chunk_file_paths == list(list_chunks(chunkio_file_name))
+
+    expected_chunks = list(list_chunks(expected_file_name))
+    assert [os.path.basename(path) for path in chunk_file_paths] == [os.path.basename(path) for path in expected_chunks]
+    for chunk_file_path, expected_chunk_file_path in zip(chunk_file_paths, expected_chunks):
+        with open_chunk_file(chunk_file_path, "rb") as file, open_chunk_file(expected_chunk_file_path, "rb") as expected:
+            assert file.read() == expected.read()
+    assert sorted(os.listdir(chunkio_file_name)) == sorted(os.listdir(expected_file_name))
+
+    manifest = ChunkManifest.read(os.path.join(chunkio_file_name, ChunkManifest.file_name))
+    expected_manifest = ChunkManifest.read(os.path.join(expected_file_name, ChunkManifest.file_name))
+    assert manifest.entries == expected_manifest.entries
+    shutil.rmtree(tmp_dir, ignore_errors=True)
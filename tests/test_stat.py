@@ -0,0 +1,45 @@
+import os
+import shutil
+import pytest
+import chunkio
+
+from typing import List, Optional
+
+from chunkio.chunk_handler.format import ChunkManifest
+
+
+TEST_DATA = "".join(f"line {i}{'x' * (i % 7)}\n" for i in range(100))
+
+
+@pytest.mark.parametrize(
+    "data, chunkio_kwargs, remove_manifest, processes, persist", [
+        (TEST_DATA, dict(max_lines=7), False, None, False),
+        (TEST_DATA, dict(max_lines=7), True, None, False),
+        (TEST_DATA, dict(max_lines=7), True, 1, False),
+        (TEST_DATA, dict(max_lines=7), True, 2, True),
+        (TEST_DATA + "incomplete", dict(max_bytes=64), True, 2, False),
+        (TEST_DATA + "incomplete", dict(max_lines=7, compression="gzip"), True, 2, False),
+        ("", dict(max_lines=7), True, 2, False),
+    ]
+)
+def test_stat(data: str, chunkio_kwargs: dict, remove_manifest: bool, processes: Optional[int], persist: bool):
+    tmp_dir = "/tmp/chunkio"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    chunkio_file_name = os.path.join(tmp_dir, "chunkio_stat_test.txt")
+    with chunkio.open(chunkio_file_name, mode="w", **chunkio_kwargs) as file:
+        file.write(data)
+    manifest_path = os.path.join(chunkio_file_name, ChunkManifest.file_name)
+    expected_manifest = ChunkManifest.read(manifest_path)
+    if remove_manifest:
+        os.remove(manifest_path)
+
+    manifest = chunkio.stat(chunkio_file_name, processes=processes, block_size=16, persist=persist)
+    lines = chunkio.count(chunkio_file_name, processes=processes)
+    manifest_exists = os.path.isfile(manifest_path)
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    assert manifest.entries == expected_manifest.entries
+    assert manifest.lines == lines == len(data.splitlines())
+    assert manifest.bytes == len(data.encode())
+    assert manifest_exists == (persist or not remove_manifest)